@@ -1,8 +1,8 @@
 from .config import settings
-from .database import table_registry, SessionLocal
+from .database import SessionLocal, table_registry
 from .security import (
-    get_password_hash,
     create_access_token,
+    get_password_hash,
     verify_password,
 )
 
@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING: Any = object()
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe in-memory cache with per-entry expiry and LRU eviction.
+
+    Args:
+        ttl (float): Default seconds an entry stays valid.
+        maxsize (int): Maximum entries; the least recently used is evicted.
+    """
+
+    def __init__(self, *, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = max(1, maxsize)
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        """Returns the cached value, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Stores a value for `ttl` seconds (the cache default if omitted)."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """Removes a single entry, if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Returns hit/miss counters and the current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+class SingleFlightCache(Generic[K, V]):
+    """Coalesces concurrent async loads of the same key and caches the result.
+
+    While a load is in flight, every caller asking for the same key awaits
+    that load instead of starting another one. Successful results are
+    kept for `ttl` seconds; errors are not cached. A caller being
+    cancelled does not cancel the shared load.
+
+    Args:
+        ttl (float): Seconds results are cached; 0 only coalesces.
+        maxsize (int): Maximum cached results.
+    """
+
+    def __init__(self, *, ttl: float, maxsize: int = 1024):
+        self.cache: TTLCache[K, V] = TTLCache(ttl=ttl, maxsize=maxsize)
+        self._flights: dict[K, asyncio.Task] = {}
+
+    async def get_or_load(
+        self, key: K, loader: Callable[[], Awaitable[V]]
+    ) -> V:
+        """Returns the cached value, joining or starting a load if needed.
+
+        Args:
+            key (K): Cache key.
+            loader (Callable[[], Awaitable[V]]): Produces the value.
+
+        Returns:
+            V: Cached or freshly loaded value.
+        """
+        value = self.cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._flights[key] = task
+            task.add_done_callback(lambda t: self._landed(key, t))
+
+        return await asyncio.shield(task)
+
+    def _landed(self, key: K, task: asyncio.Task) -> None:
+        failed = task.cancelled() or task.exception() is not None
+
+        # A flight detached by invalidate() must not repopulate the cache
+        if self._flights.get(key) is task:
+            del self._flights[key]
+            if not failed and self.cache.ttl > 0:
+                self.cache.set(key, task.result())
+
+    def invalidate(self, key: K) -> None:
+        """Drops the cached value and detaches any load in flight.
+
+        Callers already waiting on the detached load still get its result;
+        new callers start a fresh load.
+        """
+        self.cache.invalidate(key)
+        self._flights.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """Returns the cache counters plus the number of loads in flight."""
+        return {**self.cache.stats(), "in_flight": len(self._flights)}
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -13,6 +14,18 @@ class Settings(BaseSettings):
     )
 
     DATABASE_URL: str = ""
+    ASYNC_DATABASE_URL: str = ""
+    SQLITE_JOURNAL_MODE: Literal[
+        "WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"
+    ] = "WAL"
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_BUSY_TIMEOUT: int = 5000
+    SQLITE_MMAP_SIZE: int = 268435456
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 1800
     SECRET_KEY: str = ""
     ALGORITHM: str = ""
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
@@ -30,6 +43,18 @@ class Settings(BaseSettings):
     AD_DOMAIN: str = ""
     AD_BASE_DN: str = ""
     DISABLED_OU: str = ""
+    AD_POOL_MIN_SIZE: int = 1
+    AD_POOL_MAX_SIZE: int = 5
+    AD_POOL_IDLE_TIMEOUT: float = 300.0
+    AD_POOL_CHECKOUT_TIMEOUT: float = 10.0
+    AD_POOL_HEALTH_CHECK_AFTER: float = 60.0
+    AD_SUBSTRING_FALLBACK: bool = False
+    AD_SNAPSHOT_ENABLED: bool = False
+    AD_SNAPSHOT_SYNC_INTERVAL: float = 300.0
+    AD_SNAPSHOT_FULL_SYNC_INTERVAL: float = 86400.0
+    AD_SNAPSHOT_MAX_STALENESS: float = 900.0
+    AD_SNAPSHOT_PATH: str = ""
+    TURNSTILE_UNITS: str = ""
     TURNSTILE_A_URL: str = ""
     TURNSTILE_A_SESSION: str = ""
     TURNSTILE_B_URL: str = ""
@@ -46,7 +71,56 @@ class Settings(BaseSettings):
     IFS_TST_PASSWORD: str = ""
     IFS_TST_CLIENT_ID: str = ""
     IFS_TST_CLIENT_SECRET: str = ""
-    
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    SNIPEIT_MAX_CONNECTIONS: int = 10
+    SNIPEIT_TIMEOUT: float = 30.0
+    SNIPEIT_TEMPLATE_CACHE_TTL: float = 3600.0
+    SNIPEIT_LOOKUP_CACHE_TTL: float = 60.0
+    SNIPEIT_CACHE_SIZE: int = 1024
+    SNIPEIT_ASSET_CONCURRENCY: int = 4
+    TERMS_DIR: str = "data/terms"
+    TERMS_RETENTION_DAYS: int = 30
+    IFS_MAX_CONNECTIONS: int = 10
+    IFS_TIMEOUT: float = 15.0
+    IFS_TOKEN_REFRESH_MARGIN: float = 60.0
+    IFS_TOKEN_DEFAULT_TTL: float = 300.0
+    INTOUCH_MAX_CONNECTIONS: int = 10
+    INTOUCH_TIMEOUT: float = 10.0
+    TURNSTILE_MAX_CONNECTIONS: int = 10
+    TURNSTILE_TIMEOUT: float = 5.0
+    SNIPEIT_RATE_LIMIT: float = 0.0
+    IFS_RATE_LIMIT: float = 0.0
+    INTOUCH_RATE_LIMIT: float = 0.0
+    TURNSTILE_RATE_LIMIT: float = 0.0
+    OFFBOARDING_DEADLINE: float = 120.0
+    OFFBOARDING_STEP_TIMEOUT: float = 60.0
+    OFFBOARDING_STEP_TIMEOUTS: dict[str, float] = {}
+    OFFBOARDING_LOOKUP_CACHE_TTL: float = 15.0
+    OFFBOARDING_LOOKUP_CACHE_SIZE: int = 1024
+    OFFBOARDING_BULK_CONCURRENCY: int = 4
+    OFFBOARDING_BULK_MAX_ITEMS: int = 500
+    OFFBOARDING_JOB_WORKERS: int = 2
+    OFFBOARDING_JOB_POLL_INTERVAL: float = 2.0
+    OFFBOARDING_JOB_LEASE: float = 60.0
+    OFFBOARDING_JOB_MAX_ATTEMPTS: int = 3
+    OFFBOARDING_JOB_RETRY_BACKOFF: float = 30.0
+    AUDIT_LOG_COUNT_CACHE_TTL: float = 30.0
+    AUDIT_ASYNC_ACTIONS: list[str] = [
+        "list_users",
+        "read_current_user",
+        "search_ad_user",
+        "search_intouch_user",
+        "view_audit_logs",
+    ]
+    AUDIT_WRITER_BATCH_SIZE: int = 200
+    AUDIT_WRITER_FLUSH_INTERVAL: float = 1.0
+    AUDIT_WRITER_MAX_QUEUE: int = 10000
+    AUDIT_EXPORT_REUSE_WINDOW: float = 300.0
+    AUDIT_EXPORT_JOB_TIMEOUT: float = 3600.0
+    AUDIT_EXPORT_PROCESSES: int = 2
+    AUDIT_EXPORT_MAX_QUEUE: int = 10
 
 
 @lru_cache
@@ -1,23 +1,249 @@
+import logging
+from contextlib import asynccontextmanager, contextmanager
+from functools import cache
+from typing import Annotated, AsyncIterator, Iterator
+
 from fastapi import Depends
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session, registry
-from typing import Annotated
+from sqlalchemy import URL, Engine, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, registry, sessionmaker
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 table_registry = registry()
 
-engine = create_engine(
-    settings.DATABASE_URL, connect_args={"check_same_thread": False}
-)
+# Async DBAPI driver used for each backend by the AsyncSession path
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    # WAL lets readers (exports, listings) run while a write is in
+    # progress; NORMAL only fsyncs at checkpoints, which is safe in WAL
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(
+            f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT)}"
+        )
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    finally:
+        cursor.close()
+
+
+def _engine_options(url: URL) -> dict:
+    if url.get_backend_name() == "sqlite":
+        return {
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": settings.SQLITE_BUSY_TIMEOUT / 1000,
+            },
+        }
+
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
+def create_db_engine(database_url: str) -> Engine:
+    """Creates the engine with the options suited to its database.
+
+    SQLite connections may be used from other threads and are tuned
+    through PRAGMAs on connect (SQLITE_* settings). Other databases use a
+    connection pool sized by the DB_POOL_* settings, with connections
+    checked before use and recycled periodically.
+
+    Args:
+        database_url (str): SQLAlchemy database URL.
+
+    Returns:
+        Engine: The configured engine.
+    """
+    url = make_url(database_url)
+    db_engine = create_engine(url, **_engine_options(url))
+
+    if url.get_backend_name() == "sqlite":
+        event.listen(db_engine, "connect", _configure_sqlite_connection)
+
+    return db_engine
+
+
+def async_database_url(database_url: str) -> URL:
+    """Derives the URL of the async driver from a database URL.
+
+    sqlite:// becomes sqlite+aiosqlite:// and postgresql:// (with any
+    driver) postgresql+asyncpg://; other URLs are returned unchanged.
+
+    Args:
+        database_url (str): SQLAlchemy database URL.
+
+    Returns:
+        URL: The URL with its async driver.
+    """
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        return url
+
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}")
+
+
+def create_async_db_engine(database_url: str) -> AsyncEngine:
+    """Creates the async engine, with the same options as create_db_engine.
+
+    Args:
+        database_url (str): SQLAlchemy database URL; a sync URL is
+            converted with async_database_url.
+
+    Returns:
+        AsyncEngine: The configured engine.
+    """
+    url = async_database_url(database_url)
+    db_engine = create_async_engine(url, **_engine_options(url))
+
+    if url.get_backend_name() == "sqlite":
+        event.listen(
+            db_engine.sync_engine, "connect", _configure_sqlite_connection
+        )
+
+    return db_engine
+
+
+engine = create_db_engine(settings.DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Attributes stay loaded after commit, since an AsyncSession cannot
+# lazy-load them again outside an await
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+
+@cache
+def get_async_engine() -> AsyncEngine:
+    """Returns the async engine, creating it on first use.
+
+    It is created lazily so that importing the app does not load the
+    async driver until a coroutine actually needs the database.
+    """
+    return create_async_db_engine(
+        settings.ASYNC_DATABASE_URL or settings.DATABASE_URL
+    )
+
+
+def async_session_local() -> AsyncSession:
+    """Opens an AsyncSession on the async engine."""
+    return AsyncSessionLocal(bind=get_async_engine())
+
+
+async def dispose_async_engine() -> None:
+    """Closes the connections of the async engine, if it was created."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+        get_async_engine.cache_clear()
+
 
 def init_db():
     table_registry.metadata.create_all(bind=engine)
 
 
+@contextmanager
+def unit_of_work(session: Session) -> Iterator[Session]:
+    """Groups the writes of several services into one transaction.
+
+    Inside the block, services that support it (create_audit_log,
+    create_offboarding_record) only add their rows to the session with
+    commit_or_stage(); they are written and committed once when the
+    block exits, also when it raises, so the audit trail of a failure is
+    kept. Staging does no I/O, so the block may stay open across awaits
+    without holding a database write lock (SessionLocal does not
+    autoflush). Any explicit session.commit() inside the block commits
+    what is staged so far, e.g. at the step boundaries of an offboarding
+    job.
+
+    Args:
+        session (Session): Session shared by the grouped writes.
+
+    Yields:
+        Session: The same session.
+    """
+    if session.info.get("unit_of_work"):
+        yield session
+        return
+
+    session.info["unit_of_work"] = True
+    try:
+        yield session
+    except BaseException:
+        session.info.pop("unit_of_work", None)
+        try:
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Could not commit unit of work after error: {e}")
+        raise
+
+    session.info.pop("unit_of_work", None)
+    session.commit()
+
+
+@asynccontextmanager
+async def async_unit_of_work(session: AsyncSession) -> AsyncIterator[Session]:
+    """unit_of_work for coroutines, committed with an await.
+
+    Yields the synchronous Session behind the AsyncSession, so the usual
+    services (create_audit_log, create_offboarding_record) stage their
+    rows into it. The staged rows are written by one awaited commit when
+    the block exits, also when it raises, so the event loop is never
+    blocked on the database. Nothing inside the block may query or
+    commit the yielded session itself: that would be blocking I/O and
+    raises MissingGreenlet.
+
+    Args:
+        session (AsyncSession): Session shared by the grouped writes.
+
+    Yields:
+        Session: The sync facade of the session, for staging only.
+    """
+    staging = session.sync_session
+    staging.info["unit_of_work"] = True
+    try:
+        yield staging
+    except BaseException:
+        staging.info.pop("unit_of_work", None)
+        try:
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Could not commit unit of work after error: {e}")
+        raise
+
+    staging.info.pop("unit_of_work", None)
+    await session.commit()
+
+
+def commit_or_stage(session: Session) -> None:
+    """Commits the session, or leaves its rows staged inside a unit_of_work."""
+    if not session.info.get("unit_of_work"):
+        session.commit()
+
+
+async def commit_or_stage_async(session: AsyncSession) -> None:
+    """Async variant of commit_or_stage."""
+    if not session.info.get("unit_of_work"):
+        await session.commit()
+
+
 def get_db():
     db = SessionLocal()
 
@@ -28,3 +254,11 @@ def get_db():
 
 
 Db_session = Annotated[Session, Depends(get_db)]
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with async_session_local() as db:
+        yield db
+
+
+AsyncDb_session = Annotated[AsyncSession, Depends(get_async_db)]
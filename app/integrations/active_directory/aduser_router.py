@@ -1,34 +1,136 @@
+import json
+from itertools import chain
 from logging import getLogger
+from typing import Annotated, Iterable, Iterator, Literal
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
-from app.modules.audit.service import create_audit_log
+from app.core.config import settings
 from app.core.database import Db_session
-#from app.enums import AuditAction, AuditStatus
-from .schemas import ADUser, DisableUserRequest
-#from app.schemas import AuditLogCreate
+
+# from app.schemas import AuditLogCreate
 from app.modules.users import Current_user
+
+# from app.enums import AuditAction, AuditStatus
+from .constants import LDAP_ATTRS
 from .deps import ADServiceDep
+from .schemas import ADUser, DisableUserRequest
+from .snapshot import directory_snapshot
 
 logger = getLogger(__name__)
 
 router = APIRouter(prefix="/aduser", tags=["ADUser"])
 
 
+def _ndjson(users: Iterable[ADUser]) -> Iterator[str]:
+    # The 200 and the headers are already sent once iteration starts, so a
+    # failure mid-stream is reported as a final error record
+    try:
+        for user in users:
+            yield user.model_dump_json() + "\n"
+    except Exception as e:
+        logger.error(f"Error streaming AD users: {e}", exc_info=True)
+        yield json.dumps({"error": "Error querying Active Directory"}) + "\n"
+
+
 @router.get("/", response_model=list[ADUser])
 async def get_user(
     ad_service: ADServiceDep,
     current_user: Current_user,
     request: Request,
+    response: Response,
     db: Db_session,
     registration: str | None = None,
+    enabled_only: bool = False,
+    attributes: Literal["USER_SEARCH", "USER_BASIC"] = "USER_SEARCH",
+    stream: bool = False,
+    source: Literal["ldap", "snapshot"] = "ldap",
+    max_staleness: Annotated[float | None, Query(ge=0)] = None,
 ):
+    """
+    Searches users in Active Directory
+
+    With stream=true the users are sent as NDJSON while AD returns them,
+    page by page, so scans of the whole directory are neither truncated
+    nor held in memory. An error after the stream has started is sent as
+    a final {"error": ...} record. `attributes` selects the LDAP attribute set
+    fetched for live searches.
+
+    With source=snapshot the search is answered from the in-memory
+    directory snapshot, as long as it was synced less than max_staleness
+    seconds ago (AD_SNAPSHOT_MAX_STALENESS by default); otherwise it falls
+    back to a live LDAP search. The X-AD-Source response header tells
+    which one answered, and X-AD-Match which registration strategy
+    matched (exact, substring or none).
+    """
     try:
         logger.info(
             f"User {current_user.username}"
-            " searching AD - registration={registration}"
+            f" searching AD - registration={registration}, source={source}"
         )
-        users = ad_service.search_users(registration=registration)
+        if max_staleness is None:
+            max_staleness = settings.AD_SNAPSHOT_MAX_STALENESS
+
+        headers: dict[str, str] = {}
+
+        if source == "snapshot" and directory_snapshot.is_fresh(max_staleness):
+            if registration:
+                lookup = directory_snapshot.lookup_registration(
+                    registration, enabled_only
+                )
+                users = lookup.users
+                headers["X-AD-Match"] = lookup.strategy or "none"
+            else:
+                users = directory_snapshot.search(enabled_only=enabled_only)
+            headers["X-AD-Snapshot-Age"] = f"{directory_snapshot.age:.0f}"
+        else:
+            if source == "snapshot":
+                logger.warning(
+                    f"AD snapshot older than {max_staleness}s "
+                    f"(age={directory_snapshot.age}), searching LDAP"
+                )
+            source = "ldap"
+            headers["X-AD-Source"] = source
+            if stream and not registration:
+                pages = ad_service.iter_users(
+                    enabled_only, LDAP_ATTRS[attributes]
+                )
+                # Fetch the first entry before answering, so connection
+                # and search errors still return a 500
+                first = await run_in_threadpool(next, pages, None)
+                if first is not None:
+                    pages = chain([first], pages)
+                return StreamingResponse(
+                    _ndjson(pages),
+                    media_type="application/x-ndjson",
+                    headers=headers,
+                )
+            if registration:
+                lookup = await run_in_threadpool(
+                    ad_service.lookup_registration,
+                    registration,
+                    enabled_only,
+                    LDAP_ATTRS[attributes],
+                )
+                users = lookup.users
+                headers["X-AD-Match"] = lookup.strategy or "none"
+            else:
+                users = await run_in_threadpool(
+                    ad_service.search_users,
+                    enabled_only=enabled_only,
+                    attributes=LDAP_ATTRS[attributes],
+                )
+        headers["X-AD-Source"] = source
+
+        if stream:
+            return StreamingResponse(
+                _ndjson(users),
+                media_type="application/x-ndjson",
+                headers=headers,
+            )
+        response.headers.update(headers)
 
 #        create_audit_log(
 #            db,
@@ -1,4 +1,4 @@
-from enum import IntFlag
+from enum import IntFlag, StrEnum
 
 
 class UserAccountControl(IntFlag):
@@ -31,6 +31,18 @@ class UserAccountControl(IntFlag):
     PARTIAL_SECRETS_ACCOUNT = 0x04000000
 
 
+class RegistrationMatch(StrEnum):
+    """
+    Strategy that matched a registration to AD users
+
+    EXACT is an equality filter on EmployeeID, which the DC can answer
+    from an index; SUBSTRING is the `*registration*` fallback, which
+    always scans
+    """
+    EXACT = "exact"
+    SUBSTRING = "substring"
+
+
 LDAP_ATTRS = {
     "USER_SEARCH": [
         "cn",
@@ -47,9 +59,21 @@ LDAP_ATTRS = {
         "sAMAccountName",
         "displayName",
         "userAccountControl",
-    ]
+    ],
+    "USER_SNAPSHOT": [
+        "cn",
+        "displayName",
+        "sAMAccountName",
+        "description",
+        "userAccountControl",
+        "distinguishedName",
+        "employeeID",
+        "objectGUID",
+        "uSNChanged",
+    ],
 }
 
 # Limites
 MAX_DESCRIPTION_LENGTH = 1024
 MAX_SEARCH_RESULTS = 1000
+SEARCH_PAGE_SIZE = 500
@@ -0,0 +1,325 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Generator
+
+from ldap3 import (  # type: ignore
+    ALL,
+    BASE,
+    NO_ATTRIBUTES,
+    SIMPLE,
+    Connection,
+    Server,
+)
+from ldap3.core.exceptions import (  # type: ignore
+    LDAPBindError,
+    LDAPCommunicationError,
+    LDAPException,
+)
+
+from app.core.config import settings
+from app.integrations.active_directory.exceptions import ADConnectionError
+
+logger = logging.getLogger(__name__)
+
+# LDAP result descriptions that mean the bound identity is no longer usable
+# (password rotated, session invalidated, DC handing us off elsewhere).
+REBIND_RESULTS = {
+    "invalidCredentials",
+    "referral",
+    "strongerAuthRequired",
+    "unwillingToPerform",
+}
+
+
+@dataclass
+class _PooledConnection:
+    conn: Connection
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class LDAPConnectionPool:
+    """
+    Bounded, thread-safe pool of bound LDAP connections
+
+    Connections are bound once and reused across ADRepository calls,
+    so an offboarding run pays for a single TCP connect + bind instead
+    of one per operation. The schema is fetched only on the first bind
+    because every connection shares the same Server object.
+
+    Args:
+    min_size: Connections kept open even when idle
+    max_size: Hard limit of simultaneous connections
+    idle_timeout: Seconds after which idle connections above
+        min_size are closed
+    checkout_timeout: Seconds to wait for a free connection
+    health_check_after: Idle seconds after which a connection is
+        probed before being handed out
+    """
+
+    def __init__(
+        self,
+        *,
+        min_size: int,
+        max_size: int,
+        idle_timeout: float,
+        checkout_timeout: float,
+        health_check_after: float,
+    ):
+        self.min_size = max(0, min(min_size, max_size))
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.health_check_after = health_check_after
+
+        self._server: Server | None = None
+        self._idle: list[_PooledConnection] = []
+        self._in_use = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def server(self) -> Server:
+        if self._server is None:
+            self._server = Server(
+                settings.AD_SERVER,
+                port=389,
+                use_ssl=False,
+                get_info=ALL,
+            )
+        return self._server
+
+    def _connect(self) -> _PooledConnection:
+        """
+        Opens and binds a new connection
+
+        Raises:
+        ADConnectionError: If the server is unreachable or the bind fails
+        """
+        conn = Connection(
+            self.server,
+            user=settings.AD_USERNAME,
+            password=settings.AD_PASSWORD,
+            authentication=SIMPLE,
+            auto_bind=False,
+        )
+
+        try:
+            conn.open(read_server_info=False)
+            if not conn.bind(read_server_info=self.server.info is None):
+                raise LDAPBindError(conn.result.get("description"))
+        except LDAPException as e:
+            conn.unbind()
+            logger.error(f"Error connecting to LDAP.: {e}")
+            raise ADConnectionError(
+                f"Failed to connect to Active Directory.: {e}"
+            )
+
+        logger.debug("LDAP connection established.")
+        return _PooledConnection(conn)
+
+    def _is_healthy(self, pooled: _PooledConnection) -> bool:
+        conn = pooled.conn
+
+        if conn.closed or not conn.bound:
+            return False
+
+        if time.monotonic() - pooled.last_used < self.health_check_after:
+            return True
+
+        try:
+            return conn.search(
+                search_base="",
+                search_filter="(objectClass=*)",
+                search_scope=BASE,
+                attributes=[NO_ATTRIBUTES],
+            )
+        except LDAPException as e:
+            logger.info(f"Pooled LDAP connection failed health check: {e}")
+            return False
+
+    def _rebind(self, pooled: _PooledConnection) -> _PooledConnection:
+        """
+        Restores a connection that lost its bind, or replaces it
+        """
+        conn = pooled.conn
+
+        if not conn.closed:
+            try:
+                if conn.rebind(
+                    user=settings.AD_USERNAME,
+                    password=settings.AD_PASSWORD,
+                    authentication=SIMPLE,
+                    read_server_info=False,
+                ):
+                    logger.debug("LDAP connection rebound.")
+                    pooled.last_used = time.monotonic()
+                    return pooled
+            except LDAPException as e:
+                logger.info(f"LDAP rebind failed, reconnecting: {e}")
+
+        self._discard(pooled)
+        return self._connect()
+
+    @staticmethod
+    def _discard(pooled: _PooledConnection) -> None:
+        try:
+            pooled.conn.unbind()
+        except LDAPException:
+            pass
+        logger.debug("LDAP connection closed.")
+
+    def _reap_idle(self) -> list[_PooledConnection]:
+        """Detaches idle connections above min_size. Caller holds the lock."""
+        now = time.monotonic()
+        keep: list[_PooledConnection] = []
+        expired: list[_PooledConnection] = []
+
+        for pooled in self._idle:
+            total = len(keep) + self._in_use
+            if (
+                now - pooled.last_used > self.idle_timeout
+                and total >= self.min_size
+            ):
+                expired.append(pooled)
+            else:
+                keep.append(pooled)
+
+        self._idle = keep
+        return expired
+
+    def acquire(self) -> _PooledConnection:
+        """
+        Checks out a healthy, bound connection
+
+        Raises:
+        ADConnectionError: If the pool is exhausted or AD is unreachable
+        """
+        deadline = time.monotonic() + self.checkout_timeout
+
+        with self._cond:
+            expired = self._reap_idle()
+
+        for stale in expired:
+            self._discard(stale)
+
+        with self._cond:
+            if self._closed:
+                raise ADConnectionError("LDAP connection pool is closed")
+
+            while not self._idle and self._in_use >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ADConnectionError(
+                        "Timed out waiting for a free LDAP connection"
+                    )
+                self._cond.wait(remaining)
+
+            pooled = self._idle.pop() if self._idle else None
+            self._in_use += 1
+
+        try:
+            if pooled is None:
+                pooled = self._connect()
+            elif not self._is_healthy(pooled):
+                pooled = self._rebind(pooled)
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        return pooled
+
+    def release(self, pooled: _PooledConnection, broken: bool = False):
+        """
+        Returns a connection to the pool
+
+        Connections flagged as broken, or whose last result asks for a
+        new bind, are closed instead of being reused.
+        """
+        description = (pooled.conn.result or {}).get("description")
+        reusable = (
+            not broken
+            and not pooled.conn.closed
+            and description not in REBIND_RESULTS
+        )
+
+        with self._cond:
+            self._in_use -= 1
+            keep = reusable and not self._closed
+            if keep:
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+            self._cond.notify()
+
+        if not keep:
+            self._discard(pooled)
+
+    @contextmanager
+    def connection(self) -> Generator[Connection, None, None]:
+        """
+        Context manager that borrows a connection from the pool
+
+        Yields:
+        Active LDAP connection
+
+        Raises:
+        ADConnectionError: If no connection can be obtained
+        """
+        pooled = self.acquire()
+        broken = False
+        try:
+            yield pooled.conn
+        except (LDAPCommunicationError, LDAPBindError):
+            broken = True
+            raise
+        finally:
+            self.release(pooled, broken=broken)
+
+    def open(self) -> None:
+        """
+        Pre-binds min_size connections
+
+        Failures are logged, not raised, so the API can still start
+        while the domain controller is unreachable.
+        """
+        with self._cond:
+            self._closed = False
+            missing = self.min_size - len(self._idle) - self._in_use
+
+        for _ in range(max(0, missing)):
+            try:
+                pooled = self._connect()
+            except ADConnectionError as e:
+                logger.warning(f"Could not pre-warm LDAP pool: {e}")
+                return
+
+            with self._cond:
+                self._idle.append(pooled)
+
+        logger.info(f"LDAP pool ready with {len(self._idle)} connection(s)")
+
+    def close(self) -> None:
+        """Closes every idle connection and refuses new checkouts."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+
+        for pooled in idle:
+            self._discard(pooled)
+
+        logger.info("LDAP pool closed")
+
+
+ldap_pool = LDAPConnectionPool(
+    min_size=settings.AD_POOL_MIN_SIZE,
+    max_size=settings.AD_POOL_MAX_SIZE,
+    idle_timeout=settings.AD_POOL_IDLE_TIMEOUT,
+    checkout_timeout=settings.AD_POOL_CHECKOUT_TIMEOUT,
+    health_check_after=settings.AD_POOL_HEALTH_CHECK_AFTER,
+)
@@ -1,6 +1,6 @@
 import logging
 from contextlib import contextmanager
-from typing import Any, Generator
+from typing import Any, Generator, Iterator
 
 from ldap3 import MODIFY_REPLACE, SUBTREE, Connection
 from ldap3.core.exceptions import LDAPException
@@ -9,12 +9,17 @@ from app.core.config import settings
 from app.integrations.active_directory.constants import (
     LDAP_ATTRS,
     MAX_SEARCH_RESULTS,
+    SEARCH_PAGE_SIZE,
     UserAccountControl,
 )
-from app.integrations.active_directory.exceptions import ADConnectionError, ADOperationError
+from app.integrations.active_directory.exceptions import (
+    ADConnectionError,
+    ADOperationError,
+)
+from app.integrations.active_directory.schemas import ADOperationStep
 from app.integrations.active_directory.utils import escape_ldap_filter
 
-from .client import get_ldap_connection
+from .pool import ldap_pool
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +29,8 @@ def ldap_connection() -> Generator[Connection, None, None]:
     """
     Context manager for LDAP connection
 
-    Ensures that the connection is closed after use
+    Borrows a bound connection from the shared pool and returns it
+    after use, so consecutive operations reuse the same bind
 
     Yields:
     Active LDAP connection
@@ -32,21 +38,23 @@ def ldap_connection() -> Generator[Connection, None, None]:
     Raises:
     ADConnectionError: If connection fails
     """
-    conn = None
     try:
-        conn = get_ldap_connection()
-        logger.debug("LDAP connection established.")
-        yield conn
+        with ldap_pool.connection() as conn:
+            yield conn
     except LDAPException as e:
         logger.error(f"Error connecting to LDAP.: {e}")
         raise ADConnectionError(f"Failed to connect to Active Directory.: {e}")
-    finally:
-        if conn:
-            conn.unbind()
-            logger.debug("LDAP connection closed.")
 
 
 class ADRepository:
+    USERS_FILTER = "(objectClass=user)"
+    ENABLED_USERS_FILTER = (
+        "(&"
+        "(objectClass=user)"
+        "(!(userAccountControl:1.2.840.113556.1.4.803:=2))"
+        ")"
+    )
+
     def __init__(self):
         self.base_dn = settings.AD_BASE_DN
         self.disabled_ou = settings.DISABLED_OU
@@ -78,7 +86,7 @@ class ADRepository:
             try:
                 logger.info(f"Searching users with filter: {search_filter}")
 
-                success = conn.search(
+                conn.search(
                     search_base=self.base_dn,
                     search_filter=search_filter,
                     search_scope=SUBTREE,
@@ -86,7 +94,15 @@ class ADRepository:
                     size_limit=size_limit
                 )
 
-                if not success:
+                # conn.search() also returns False for a successful search
+                # with no results, which is not an error here
+                description = conn.result.get('description')
+                if description == 'sizeLimitExceeded':
+                    logger.warning(
+                        f"Search truncated at {size_limit} results: "
+                        f"{search_filter}"
+                    )
+                elif description != 'success':
                     logger.warning(f"LDAP search failed: {conn.result}")
                     raise ADOperationError(
                         "User search",
@@ -102,12 +118,104 @@ class ADRepository:
                 logger.error(f"LDAP error: {e}")
                 raise ADOperationError("User search", str(e))
 
-    def search_by_registration(self, registration: str) -> list[Any]:
+    def iter_users(
+        self,
+        search_filter: str,
+        attributes: list[str] | None = None,
+        page_size: int = SEARCH_PAGE_SIZE,
+        conn: Connection | None = None
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Search for users using the Simple Paged Results control
+
+        Pages are requested as the caller iterates, so there is no size
+        limit and only one page is held in memory. The connection stays
+        checked out of the pool until the iteration ends
+
+        Args:
+        search_filter: LDAP filter
+        attributes: Attributes to return
+        page_size: Entries requested per page
+        conn: Connection to search on (optional, borrowed from the pool
+        otherwise)
+
+        Yields:
+        (distinguished name, attributes) of each entry
+
+        Raises:
+        ADOperationError: If a page cannot be fetched
+        """
+        if attributes is None:
+            attributes = LDAP_ATTRS["USER_SEARCH"]
+
+        if conn is None:
+            with ldap_connection() as pooled:
+                yield from self.iter_users(
+                    search_filter, attributes, page_size, pooled
+                )
+            return
+
+        logger.info(f"Paged search with filter: {search_filter}")
+        count = 0
+        try:
+            for response in conn.extend.standard.paged_search(
+                search_base=self.base_dn,
+                search_filter=search_filter,
+                search_scope=SUBTREE,
+                attributes=attributes,
+                paged_size=page_size,
+                generator=True,
+            ):
+                if response.get("type") != "searchResEntry":
+                    continue
+                count += 1
+                yield response["dn"], response["attributes"]
+        except LDAPException as e:
+            logger.error(f"LDAP error after {count} entries: {e}")
+            raise ADOperationError("User search", str(e))
+
+        logger.info(f"Paged search returned {count} user(s)")
+
+    def search_by_employee_ids(
+        self,
+        employee_ids: list[str],
+        attributes: list[str] | None = None
+    ) -> list[Any]:
+        """
+        Search for users whose EmployeeID equals one of the given values
+
+        Equality filters can be answered from an index on EmployeeID
+        (when the attribute is indexed in the schema), unlike the
+        substring filter of search_by_registration
+
+        Args:
+        employee_ids: Exact EmployeeID values to match
+        attributes: Attributes to return
+        Returns:
+        List of users found
+        """
+        clauses = "".join(
+            f"(EmployeeID={escape_ldap_filter(employee_id)})"
+            for employee_id in employee_ids
+        )
+        search_filter = f"(&(objectClass=user)(|{clauses}))"
+
+        return self.search_users(search_filter, attributes)
+
+    def search_by_registration(
+        self,
+        registration: str,
+        attributes: list[str] | None = None
+    ) -> list[Any]:
         """
         Search for users by registration number (EmployeeID field)
 
+        Matches any EmployeeID containing the registration, which forces
+        a scan on the DC; prefer search_by_employee_ids
+
         Args:
         registration: Registration number to search for
+        attributes: Attributes to return
         Returns:
         List of users found
         """
@@ -119,7 +227,7 @@ class ADRepository:
             f")"
         )
 
-        return self.search_users(search_filter)
+        return self.search_users(search_filter, attributes)
 
     def search_enabled_users(self) -> list[Any]:
         """
@@ -128,14 +236,7 @@ class ADRepository:
         Returns:
         List of enabled users
         """
-        search_filter = (
-            "(&"
-            "(objectClass=user)"
-            "(!(userAccountControl:1.2.840.113556.1.4.803:=2))"
-            ")"
-        )
-
-        return self.search_users(search_filter)
+        return self.search_users(self.ENABLED_USERS_FILTER)
 
     def disable_account(  # noqa: PLR6301
         self,
@@ -251,3 +352,84 @@ class ADRepository:
             except LDAPException as e:
                 logger.error(f"Error moving user.: {e}")
                 raise ADOperationError("Move User", str(e))
+
+    def disable_user_entry(  # noqa: PLR6301
+        self,
+        dn: str,
+        current_uac: int,
+        new_description: str,
+        target_ou: str
+    ) -> list[ADOperationStep]:
+        """
+        Disable a user in a single transaction on one bound connection
+
+        The description and userAccountControl are replaced in a single
+        modify operation, then the entry is moved to the target OU on the
+        same connection. The move is only attempted if the modify succeeds
+
+        Args:
+        dn: User's Distinguished Name
+        current_uac: Current UserAccountControl, as already fetched
+        new_description: New description
+        target_ou: Destination OU
+
+        Returns:
+        Result of each step, in execution order
+
+        Raises:
+        ADOperationError: If the connection fails before any step runs
+        """
+        new_uac = current_uac | UserAccountControl.ACCOUNTDISABLE
+        rdn = dn.split(',', 1)[0]
+        steps: list[ADOperationStep] = []
+
+        with ldap_connection() as conn:
+            try:
+                logger.info(f"Disabling account and updating description: {dn}")
+
+                conn.modify(
+                    dn,
+                    {
+                        'description': [(MODIFY_REPLACE, [new_description])],
+                        'userAccountControl': [(MODIFY_REPLACE, [new_uac])],
+                    }
+                )
+                modified = conn.result['description'] == 'success'
+                steps.append(ADOperationStep(
+                    step="disable_account",
+                    success=modified,
+                    message=None if modified
+                    else conn.result.get('message', 'Unknown error'),
+                ))
+            except LDAPException as e:
+                logger.error(f"Error disabling account: {e}")
+                steps.append(ADOperationStep(
+                    step="disable_account", success=False, message=str(e)
+                ))
+
+            if not steps[-1].success:
+                steps.append(ADOperationStep(
+                    step="move_to_ou",
+                    success=False,
+                    message="Skipped: account was not disabled",
+                ))
+                return steps
+
+            try:
+                logger.info(f"Moving user {dn} to {target_ou}")
+
+                conn.modify_dn(dn, rdn, new_superior=target_ou)
+                moved = conn.result['description'] == 'success'
+                steps.append(ADOperationStep(
+                    step="move_to_ou",
+                    success=moved,
+                    message=None if moved
+                    else conn.result.get('message', 'Unknown error'),
+                ))
+            except LDAPException as e:
+                logger.error(f"Error moving user.: {e}")
+                steps.append(ADOperationStep(
+                    step="move_to_ou", success=False, message=str(e)
+                ))
+
+        return steps
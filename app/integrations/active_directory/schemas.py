@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
 
+from .constants import RegistrationMatch
+
 
 class ADUser(BaseModel):
     name: str
@@ -10,13 +12,25 @@ class ADUser(BaseModel):
     user_account_control: int = Field(..., description="UAC from AD")
 
 
+class RegistrationLookup(BaseModel):
+    users: list[ADUser] = []
+    strategy: RegistrationMatch | None = None
+
+
 class DisableUserRequest(BaseModel):
     registration: str
     performed_by: str
 
 
+class ADOperationStep(BaseModel):
+    step: str
+    success: bool
+    message: str | None = None
+
+
 class ADUserDisableResponse(BaseModel):
     success: bool
     action: str
     user: ADUser
     message: str
+    steps: list[ADOperationStep] = []
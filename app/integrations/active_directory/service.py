@@ -1,20 +1,33 @@
 import logging
-from typing import Sequence
+import threading
+from typing import Iterator, Sequence
 
-from .schemas import ADUser, DisableUserRequest, ADUserDisableResponse
-from app.integrations.active_directory.constants import UserAccountControl
+from app.core.config import settings
+from app.integrations.active_directory.constants import (
+    RegistrationMatch,
+    UserAccountControl,
+)
 from app.integrations.active_directory.exceptions import (
+    ADOperationError,
     MultipleUsersFoundError,
     UserNotFoundError,
 )
 from app.integrations.active_directory.repository import ADRepository
 from app.integrations.active_directory.utils import (
+    attributes_to_user,
     build_disabled_description,
-    is_account_enabled,
+    employee_id_variants,
     validate_performed_by,
     validate_registration,
 )
 
+from .schemas import (
+    ADUser,
+    ADUserDisableResponse,
+    DisableUserRequest,
+    RegistrationLookup,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,15 +38,20 @@ class ADService:
     def search_users(
         self,
         registration: str | None = None,
-        enabled_only: bool = False
+        enabled_only: bool = False,
+        attributes: list[str] | None = None
     ) -> Sequence[ADUser]:
         """
         Search for users in Active Directory
 
+        Searches without a registration go through iter_users, so they
+        return the whole directory instead of stopping at the size limit
+
         Args:
 
         registration: Registration number to search (optional)
         enabled_only: Return only active users
+        attributes: Attributes to fetch (default LDAP_ATTRS["USER_SEARCH"])
 
         Returns:
 
@@ -45,17 +63,92 @@ class ADService:
         )
 
         if registration:
-
-            registration = validate_registration(registration)
-            entries = self.repository.search_by_registration(registration)
-        elif enabled_only:
-            entries = self.repository.search_enabled_users()
+            users = self.lookup_registration(
+                registration, enabled_only, attributes
+            ).users
         else:
-            entries = self.repository.search_users("(objectClass=user)")
-        users = [self._entry_to_model(entry) for entry in entries]
+            users = list(self.iter_users(enabled_only, attributes))
         logger.info(f"Returning {len(users)} user(s)")
         return users
 
+    def lookup_registration(
+        self,
+        registration: str,
+        enabled_only: bool = False,
+        attributes: list[str] | None = None
+    ) -> RegistrationLookup:
+        """
+        Finds the users of a registration, reporting how they matched
+
+        Strategies, in order:
+        1. EXACT: EmployeeID equal to the registration or one of its
+           variants (zero-padded, `ctb` prefixed)
+        2. SUBSTRING: EmployeeID containing the registration, only when
+           AD_SUBSTRING_FALLBACK is enabled and nothing matched exactly
+
+        Args:
+
+        registration: Registration number to search
+        enabled_only: Return only active users
+        attributes: Attributes to fetch (default LDAP_ATTRS["USER_SEARCH"])
+
+        Returns:
+
+        Users found and the strategy that matched (None if none did)
+        """
+        registration = validate_registration(registration)
+        strategy: RegistrationMatch | None = RegistrationMatch.EXACT
+        entries = self.repository.search_by_employee_ids(
+            employee_id_variants(registration), attributes
+        )
+
+        if not entries and settings.AD_SUBSTRING_FALLBACK:
+            strategy = RegistrationMatch.SUBSTRING
+            entries = self.repository.search_by_registration(
+                registration, attributes
+            )
+
+        if not entries:
+            strategy = None
+
+        users = [self._entry_to_model(entry) for entry in entries]
+        if enabled_only:
+            users = [user for user in users if user.enabled]
+
+        logger.info(
+            f"Registration {registration} matched {len(entries)} user(s) "
+            f"- strategy={strategy}"
+        )
+        return RegistrationLookup(users=users, strategy=strategy)
+
+    def iter_users(
+        self,
+        enabled_only: bool = False,
+        attributes: list[str] | None = None
+    ) -> Iterator[ADUser]:
+        """
+        Iterates over every user in the directory, one page at a time
+
+        Only the current page is held in memory, so full-directory scans
+        stay flat regardless of the number of accounts
+
+        Args:
+
+        enabled_only: Return only active users
+        attributes: Attributes to fetch (default LDAP_ATTRS["USER_SEARCH"])
+
+        Yields:
+
+        Users found
+        """
+        search_filter = (
+            self.repository.ENABLED_USERS_FILTER if enabled_only
+            else self.repository.USERS_FILTER
+        )
+        entries = self.repository.iter_users(search_filter, attributes)
+        for dn, values in entries:
+            yield attributes_to_user(dn, values)
+
     def get_unique_user(self, registration: str) -> ADUser:
         """
         Search for a unique user by registration number
@@ -74,36 +167,48 @@ class ADService:
         MultipleUsersFoundError: If multiple users are found
         """
         registration = validate_registration(registration)
-        entries = self.repository.search_by_registration(registration)
+        users = self.lookup_registration(registration).users
 
-        if not entries:
+        if not users:
             logger.warning(f"User not found: {registration}")
             raise UserNotFoundError(registration)
 
-        if len(entries) > 1:
+        if len(users) > 1:
             logger.warning(
                 f"Multiple users found for '{registration}': "
-                f"{len(entries)}"
+                f"{len(users)}"
             )
-            raise MultipleUsersFoundError(registration, len(entries))
+            raise MultipleUsersFoundError(registration, len(users))
 
-        return self._entry_to_model(entries[0])
+        return users[0]
 
     def disable_user(
         self,
-        request: DisableUserRequest
+        request: DisableUserRequest,
+        user: ADUser | None = None,
+        cancelled: threading.Event | None = None,
     ) -> ADUserDisableResponse:
         """
         Disable user in Active Directory and move to Deactivated OU
 
         Operations performed:
-        1. Search for unique user by registration number
-        2. Update description field
-        3. Disable account (userAccountControl)
-        4. Move to Deactivated Accounts OU
+        1. Search for unique user by registration number, unless it
+           was already looked up by the caller
+        2. Update description and disable account (userAccountControl)
+           in a single modify operation
+        3. Move to Deactivated Accounts OU on the same connection
+
+        If the move fails after the account was disabled, the response
+        is still successful and the failed step is reported in `steps`
 
         Args:
         request: Deactivation request data
+        user: User already returned by get_unique_user/search_users
+        for this registration (optional)
+        cancelled: Set by a caller that stopped waiting (e.g. a step
+        timeout); checked right before the account is modified, so a
+        late thread does not disable it after the failure was reported
+        (optional)
 
         Returns:
         Deactivated user
@@ -122,7 +227,8 @@ class ADService:
             f"registration={registration}, performed_by={performed_by}"
         )
 
-        user = self.get_unique_user(registration)
+        if user is None:
+            user = self.get_unique_user(registration)
         logger.info(f"User found: {user.sam_account_name} ({user.name})")
 
         logger.debug(
@@ -144,6 +250,11 @@ class ADService:
         dn = user.distinguished_name
         current_uac = user.user_account_control
 
+        if cancelled is not None and cancelled.is_set():
+            raise ADOperationError(
+                "Disable account", "Cancelled before the account was modified"
+            )
+
         try:
             new_description = build_disabled_description(
                 user.description,
@@ -151,28 +262,53 @@ class ADService:
             )
 
             logger.debug(f"New description: {new_description[:100]}...")
-            self.repository.update_description(dn, new_description)
-
-            self.repository.disable_account(dn, current_uac)
-
-            self.repository.move_to_ou(dn, self.repository.disabled_ou)
-
-            logger.info(
-                f"User successfully deactivated.: {user.sam_account_name}"
+            steps = self.repository.disable_user_entry(
+                dn,
+                current_uac,
+                new_description,
+                self.repository.disabled_ou,
             )
 
+            disable_step, move_step = steps
+            if not disable_step.success:
+                raise ADOperationError("Disable account", disable_step.message)
+
             user.enabled = False
             user.description = new_description
             user.user_account_control = (
                 current_uac | UserAccountControl.ACCOUNTDISABLE
             )
 
+            if not move_step.success:
+                logger.warning(
+                    f"User {user.sam_account_name} disabled but not moved "
+                    f"to {self.repository.disabled_ou}: {move_step.message}"
+                )
+                return ADUserDisableResponse(
+                    success=True,
+                    action="disabled",
+                    user=user,
+                    steps=steps,
+                    message=f"User '{user.sam_account_name}' "
+                    f"({user.name}) deactivated by {performed_by}, "
+                    f"but could not be moved: {move_step.message}",
+                )
+
+            user.distinguished_name = (
+                f"{dn.split(',', 1)[0]},{self.repository.disabled_ou}"
+            )
+
+            logger.info(
+                f"User successfully deactivated.: {user.sam_account_name}"
+            )
+
             return ADUserDisableResponse(
                 success=True,
                 action="disabled",
                 user=user,
+                steps=steps,
                 message=f"User '{user.sam_account_name}' "
-                "({user.name}) deactivated successfully by {performed_by}",
+                f"({user.name}) deactivated successfully by {performed_by}",
             )
 
         except Exception as e:
@@ -194,14 +330,6 @@ class ADService:
         Returns:
         ADUser Model
         """
-        uac = int(entry.userAccountControl.value)
-
-        return ADUser(
-            name=entry.displayName.value or entry.cn.value,
-            sam_account_name=entry.sAMAccountName.value,
-            enabled=is_account_enabled(uac),
-            distinguished_name=entry.distinguishedName.value,
-            description=entry.description.value
-            if 'description' in entry else None,
-            user_account_control=uac
+        return attributes_to_user(
+            entry.entry_dn, entry.entry_attributes_as_dict
         )
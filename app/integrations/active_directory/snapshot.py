@@ -0,0 +1,395 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+
+from ldap3 import BASE, Connection  # type: ignore
+from ldap3.core.exceptions import LDAPException  # type: ignore
+
+from app.core.config import settings
+from app.integrations.active_directory.constants import (
+    LDAP_ATTRS,
+    RegistrationMatch,
+)
+from app.integrations.active_directory.exceptions import ADOperationError
+from app.integrations.active_directory.repository import (
+    ADRepository,
+    ldap_connection,
+)
+from app.integrations.active_directory.schemas import (
+    ADUser,
+    RegistrationLookup,
+)
+from app.integrations.active_directory.utils import (
+    attributes_to_user,
+    employee_id_variants,
+    first_value,
+    validate_registration,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _SnapshotUser:
+    guid: str
+    employee_id: str | None
+    user: ADUser
+
+
+def _to_snapshot_user(dn: str, attributes: dict) -> _SnapshotUser:
+    employee_id = first_value(attributes.get("employeeID"))
+
+    return _SnapshotUser(
+        guid=str(first_value(attributes.get("objectGUID"))),
+        employee_id=str(employee_id) if employee_id else None,
+        user=attributes_to_user(dn, attributes),
+    )
+
+
+class DirectorySnapshot:
+    """
+    In-memory copy of the AD users, indexed for fast lookups
+
+    Users are keyed by objectGUID and indexed by EmployeeID,
+    sAMAccountName and DN. The first sync loads every user; later syncs
+    only fetch entries whose uSNChanged is above the highestCommittedUSN
+    read before the previous sync. USNs are local to a domain controller,
+    so a full load is done again whenever the DC answering changes, and
+    periodically to drop users deleted from AD (deletions are not
+    returned by the incremental search).
+
+    When a path is given the snapshot is also kept in a SQLite file, so
+    after a restart it is served immediately and synced incrementally.
+
+    Args:
+    full_sync_interval: Seconds between full reloads
+    path: SQLite file used to persist the snapshot (optional)
+    """
+
+    def __init__(self, *, full_sync_interval: float, path: str = ""):
+        self.full_sync_interval = full_sync_interval
+        self.path = path
+
+        self._users: dict[str, _SnapshotUser] = {}
+        self._by_employee_id: dict[str, set[str]] = {}
+        self._by_sam: dict[str, str] = {}
+        self._by_dn: dict[str, str] = {}
+
+        self.usn: int | None = None
+        self.server_name: str | None = None
+        self.synced_at: float | None = None
+        self.full_synced_at: float | None = None
+
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._loaded = False
+
+    @property
+    def age(self) -> float | None:
+        """Seconds since the last successful sync, or None if never synced."""
+        if self.synced_at is None:
+            return None
+        return max(0.0, time.time() - self.synced_at)
+
+    def is_fresh(self, max_staleness: float) -> bool:
+        """True if the snapshot was synced less than max_staleness ago."""
+        age = self.age
+        return age is not None and age <= max_staleness
+
+    def search(
+        self,
+        registration: str | None = None,
+        enabled_only: bool = False
+    ) -> list[ADUser]:
+        """
+        Searches users in the snapshot
+
+        Args:
+        registration: Registration number to search (optional)
+        enabled_only: Return only active users
+
+        Returns:
+        Copies of the users found
+        """
+        if registration:
+            return self.lookup_registration(registration, enabled_only).users
+
+        with self._lock:
+            return [
+                record.user.model_copy()
+                for record in self._users.values()
+                if record.user.enabled or not enabled_only
+            ]
+
+    def lookup_registration(
+        self,
+        registration: str,
+        enabled_only: bool = False
+    ) -> RegistrationLookup:
+        """
+        Finds the users of a registration with the same strategies as
+        ADService.lookup_registration
+
+        Args:
+        registration: Registration number to search
+        enabled_only: Return only active users
+
+        Returns:
+        Copies of the users found and the strategy that matched
+        """
+        registration = validate_registration(registration)
+
+        with self._lock:
+            strategy: RegistrationMatch | None = RegistrationMatch.EXACT
+            guids = {
+                guid
+                for variant in employee_id_variants(registration)
+                for guid in self._by_employee_id.get(variant.lower(), ())
+            }
+            records = [self._users[guid] for guid in guids]
+
+            if not records and settings.AD_SUBSTRING_FALLBACK:
+                strategy = RegistrationMatch.SUBSTRING
+                needle = registration.lower()
+                records = [
+                    record for record in self._users.values()
+                    if record.employee_id
+                    and needle in record.employee_id.lower()
+                ]
+
+            if not records:
+                strategy = None
+
+            return RegistrationLookup(
+                users=[
+                    record.user.model_copy()
+                    for record in records
+                    if record.user.enabled or not enabled_only
+                ],
+                strategy=strategy,
+            )
+
+    def get_by_sam_account_name(self, sam_account_name: str) -> ADUser | None:
+        """Returns the user with that sAMAccountName, if any."""
+        with self._lock:
+            guid = self._by_sam.get(sam_account_name.lower())
+            return self._users[guid].user.model_copy() if guid else None
+
+    def get_by_dn(self, dn: str) -> ADUser | None:
+        """Returns the user with that distinguished name, if any."""
+        with self._lock:
+            guid = self._by_dn.get(dn.lower())
+            return self._users[guid].user.model_copy() if guid else None
+
+    def sync(self) -> None:
+        """
+        Brings the snapshot up to date with AD
+
+        Does a full load on the first run, when the domain controller
+        changed or when full_sync_interval elapsed; otherwise fetches
+        only the users changed since the previous sync.
+
+        Raises:
+        ADConnectionError: If AD is unreachable
+        ADOperationError: If the search fails
+        """
+        with self._sync_lock:
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+
+            now = time.time()
+            with ldap_connection() as conn:
+                server_name, usn = self._directory_state(conn)
+                full = (
+                    self.usn is None
+                    or server_name != self.server_name
+                    or self.full_synced_at is None
+                    or now - self.full_synced_at >= self.full_sync_interval
+                )
+
+                search_filter = (
+                    "(objectClass=user)" if full
+                    else f"(&(objectClass=user)(uSNChanged>={self.usn + 1}))"
+                )
+                records = self._fetch(conn, search_filter)
+
+            with self._lock:
+                if full:
+                    self._users = {}
+                    self._by_employee_id = {}
+                    self._by_sam = {}
+                    self._by_dn = {}
+                    self.full_synced_at = now
+                for record in records:
+                    self._put(record)
+                self.usn = usn
+                self.server_name = server_name
+                self.synced_at = now
+
+            self._save(records, full)
+
+            logger.info(
+                f"AD snapshot {'full' if full else 'incremental'} sync: "
+                f"{len(records)} user(s) fetched, {len(self._users)} total"
+            )
+
+    @staticmethod
+    def _directory_state(conn: Connection) -> tuple[str, int]:
+        try:
+            conn.search(
+                search_base="",
+                search_filter="(objectClass=*)",
+                search_scope=BASE,
+                attributes=["highestCommittedUSN", "dsServiceName"],
+            )
+            attributes = conn.response[0]["attributes"]
+        except (LDAPException, IndexError, KeyError) as e:
+            raise ADOperationError("Read directory state", str(e))
+
+        return (
+            str(first_value(attributes.get("dsServiceName"))),
+            int(first_value(attributes.get("highestCommittedUSN")) or 0),
+        )
+
+    @staticmethod
+    def _fetch(conn: Connection, search_filter: str) -> list[_SnapshotUser]:
+        return [
+            _to_snapshot_user(dn, attributes)
+            for dn, attributes in ADRepository().iter_users(
+                search_filter, LDAP_ATTRS["USER_SNAPSHOT"], conn=conn
+            )
+        ]
+
+    def _put(self, record: _SnapshotUser) -> None:
+        self._drop(record.guid)
+        self._users[record.guid] = record
+        if record.employee_id:
+            self._by_employee_id.setdefault(
+                record.employee_id.lower(), set()
+            ).add(record.guid)
+        self._by_sam[record.user.sam_account_name.lower()] = record.guid
+        self._by_dn[record.user.distinguished_name.lower()] = record.guid
+
+    def _drop(self, guid: str) -> None:
+        previous = self._users.pop(guid, None)
+        if previous is None:
+            return
+
+        if previous.employee_id:
+            key = previous.employee_id.lower()
+            guids = self._by_employee_id.get(key, set())
+            guids.discard(guid)
+            if not guids:
+                self._by_employee_id.pop(key, None)
+        self._by_sam.pop(previous.user.sam_account_name.lower(), None)
+        self._by_dn.pop(previous.user.distinguished_name.lower(), None)
+
+    def _connect_db(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS ad_snapshot_users "
+            "(guid TEXT PRIMARY KEY, employee_id TEXT, user TEXT NOT NULL)"
+        )
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS ad_snapshot_state "
+            "(key TEXT PRIMARY KEY, value TEXT)"
+        )
+        return db
+
+    def _read_db(self) -> tuple[dict, list[tuple]]:
+        with closing(self._connect_db()) as db:
+            state = {
+                key: json.loads(value)
+                for key, value in db.execute(
+                    "SELECT key, value FROM ad_snapshot_state"
+                )
+            }
+            rows = db.execute(
+                "SELECT guid, employee_id, user FROM ad_snapshot_users"
+            ).fetchall()
+        return state, rows
+
+    def _write_db(
+        self, records: list[_SnapshotUser], full: bool, state: dict
+    ) -> None:
+        with closing(self._connect_db()) as db, db:
+            if full:
+                db.execute("DELETE FROM ad_snapshot_users")
+            db.executemany(
+                "INSERT OR REPLACE INTO ad_snapshot_users "
+                "(guid, employee_id, user) VALUES (?, ?, ?)",
+                [
+                    (r.guid, r.employee_id, r.user.model_dump_json())
+                    for r in records
+                ],
+            )
+            db.executemany(
+                "INSERT OR REPLACE INTO ad_snapshot_state "
+                "(key, value) VALUES (?, ?)",
+                [(k, json.dumps(v)) for k, v in state.items()],
+            )
+
+    def _load(self) -> None:
+        if not self.path:
+            return
+
+        try:
+            state, rows = self._read_db()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not load AD snapshot from {self.path}: {e}")
+            return
+
+        if "usn" not in state:
+            return
+
+        with self._lock:
+            for guid, employee_id, user in rows:
+                self._put(_SnapshotUser(
+                    guid=guid,
+                    employee_id=employee_id,
+                    user=ADUser.model_validate_json(user),
+                ))
+            self.usn = int(state["usn"])
+            self.server_name = state.get("server_name")
+            self.synced_at = float(state["synced_at"])
+            self.full_synced_at = float(state["full_synced_at"])
+
+        logger.info(
+            f"AD snapshot loaded from {self.path}: {len(rows)} user(s)"
+        )
+
+    def _save(self, records: list[_SnapshotUser], full: bool) -> None:
+        if not self.path:
+            return
+
+        state = {
+            "usn": self.usn,
+            "server_name": self.server_name,
+            "synced_at": self.synced_at,
+            "full_synced_at": self.full_synced_at,
+        }
+        try:
+            self._write_db(records, full, state)
+        except sqlite3.Error as e:
+            logger.warning(
+                f"Could not persist AD snapshot to {self.path}: {e}"
+            )
+
+
+directory_snapshot = DirectorySnapshot(
+    full_sync_interval=settings.AD_SNAPSHOT_FULL_SYNC_INTERVAL,
+    path=settings.AD_SNAPSHOT_PATH,
+)
+
+
+def sync_directory_snapshot() -> None:
+    """Scheduler job keeping directory_snapshot up to date."""
+    try:
+        directory_snapshot.sync()
+    except Exception as e:
+        logger.error(f"AD snapshot sync failed: {e}")
@@ -1,7 +1,10 @@
 import re
 from datetime import datetime
+
 from app.integrations.active_directory.constants import UserAccountControl
 from app.integrations.active_directory.exceptions import InvalidInputError
+from app.integrations.active_directory.schemas import ADUser
+from app.integrations.registration import registration_variants
 
 
 def escape_ldap_filter(value: str) -> str:
@@ -65,6 +68,25 @@ def validate_registration(registration: str | None = None) -> str:
     return registration
 
 
+def employee_id_variants(registration: str) -> list[str]:
+    """
+    Lists the EmployeeID values a registration may be stored as
+
+    The registration as typed comes first, followed by the variants
+    also used to search InTouch (zero-padded, `ctb` prefixed)
+
+    Args:
+
+    registration: Validated registration
+
+    Returns:
+    Distinct values to match exactly
+    """
+    return list(dict.fromkeys(
+        [registration, *registration_variants(registration)]
+    ))
+
+
 def validate_performed_by(performed_by: str) -> str:
     """
     Validates 'performed_by' field
@@ -103,6 +125,51 @@ def is_account_enabled(uac: int) -> bool:
     return not bool(uac & UserAccountControl.ACCOUNTDISABLE)
 
 
+def first_value(value):
+    """
+    Returns the first value of a multi-valued LDAP attribute
+
+    Args:
+
+    value: Attribute value, as a list or a single value
+
+    Returns:
+    First value, or None if the list is empty
+    """
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def attributes_to_user(dn: str, attributes: dict) -> ADUser:
+    """
+    Builds an ADUser from the attributes returned by a search
+
+    Attributes that were not requested or are empty are tolerated, so
+    reduced attribute sets (e.g. LDAP_ATTRS["USER_BASIC"]) can be used
+
+    Args:
+
+    dn: Distinguished Name of the entry
+    attributes: Attribute name to value(s)
+
+    Returns:
+    ADUser Model
+    """
+    uac = int(first_value(attributes.get("userAccountControl")) or 0)
+
+    return ADUser(
+        name=first_value(attributes.get("displayName"))
+        or first_value(attributes.get("cn"))
+        or "",
+        sam_account_name=first_value(attributes.get("sAMAccountName")) or "",
+        enabled=is_account_enabled(uac),
+        distinguished_name=dn,
+        description=first_value(attributes.get("description")),
+        user_account_control=uac,
+    )
+
+
 def build_disabled_description(
     old_description: str | None,
     performed_by: str,
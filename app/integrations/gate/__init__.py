@@ -1,6 +1,14 @@
-from .service import deactivate_user_turnstiles
-
+from .schemas import (
+    TurnstileDeactivationResult,
+    TurnstileDeviceResult,
+    TurnstileUnit,
+)
+from .service import deactivate_user_turnstiles, get_turnstile_units
 
 __all__ = [
-    "deactivate_user_turnstiles"
-]
\ No newline at end of file
+    "deactivate_user_turnstiles",
+    "get_turnstile_units",
+    "TurnstileDeactivationResult",
+    "TurnstileDeviceResult",
+    "TurnstileUnit",
+]
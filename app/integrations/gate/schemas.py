@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+
+
+class TurnstileUnit(BaseModel):
+    name: str
+    url: str
+    session: str
+
+
+class TurnstileDeviceResult(BaseModel):
+    name: str
+    success: bool = False
+    status_code: int | None = None
+    latency_ms: float = 0.0
+    error: str | None = None
+
+
+class TurnstileDeactivationResult(BaseModel):
+    success: bool = False
+    action: str = "turnstile_deactivation"
+    devices: dict[str, TurnstileDeviceResult] = {}
+    error: str | None = None
+
+    @property
+    def failed_devices(self) -> list[TurnstileDeviceResult]:
+        return [d for d in self.devices.values() if not d.success]
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.failed_devices) and any(
+            d.success for d in self.devices.values()
+        )
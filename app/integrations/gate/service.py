@@ -1,48 +1,148 @@
+import asyncio
+import logging
+import time
+from http import HTTPStatus
 
-import requests
+import httpx
+from pydantic import TypeAdapter
 
 from app.core.config import settings
+from app.integrations.http_clients import Upstream, http_clients
 
-TURNSTILES = [
-    {
-        "name": "Unit A",
-        "url": settings.TURNSTILE_A_URL,
-        "session": settings.TURNSTILE_A_SESSION
-    },
-    {
-        "name": "Unit B",
-        "url": settings.TURNSTILE_B_URL,
-        "session": settings.TURNSTILE_B_SESSION
-    }
-]
+from .schemas import (
+    TurnstileDeactivationResult,
+    TurnstileDeviceResult,
+    TurnstileUnit,
+)
 
+logger = logging.getLogger(__name__)
 
-async def deactivate_user_turnstiles(registration: str):
-    print(f"DEBUG: Receiving the registration: {registration}")
+# Timestamp in the past written as the user's access end date, which makes
+# the controllers reject the badge immediately.
+EXPIRED_END_TIME = 1700000000
 
-    user_id = int(registration)
 
-    payload = {
-        "object": "users",
-        "values": {
+def get_turnstile_units() -> list[TurnstileUnit]:
+    """Builds the list of turnstile controllers from the environment.
 
-            "end_time": 1700000000
-        },
-        "where": {
-            "users": {"id": user_id}
-        }
-    }
+    TURNSTILE_UNITS takes a JSON list of {"name", "url", "session"}
+    objects. When it is empty, the legacy TURNSTILE_A_* / TURNSTILE_B_*
+    settings are used instead.
+
+    Returns:
+        list[TurnstileUnit]: Configured controllers.
+
+    Raises:
+        ValueError: If TURNSTILE_UNITS is invalid or repeats a unit name,
+            since results are reported per unit name.
+    """
+    if settings.TURNSTILE_UNITS:
+        units = TypeAdapter(list[TurnstileUnit]).validate_json(
+            settings.TURNSTILE_UNITS
+        )
+        names = [unit.name for unit in units]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(
+                f"Duplicate turnstile unit names in TURNSTILE_UNITS: "
+                f"{duplicates}"
+            )
+        return units
+
+    legacy = [
+        ("Unit A", settings.TURNSTILE_A_URL, settings.TURNSTILE_A_SESSION),
+        ("Unit B", settings.TURNSTILE_B_URL, settings.TURNSTILE_B_SESSION),
+    ]
+    return [
+        TurnstileUnit(name=name, url=url, session=session)
+        for name, url, session in legacy
+        if url
+    ]
 
-    for turnstile in TURNSTILES:
-        url = (
-            f"{turnstile['url']}/modify_objects.fcgi?session={turnstile['session']}"
+
+async def _deactivate_on_device(
+    client: httpx.AsyncClient,
+    unit: TurnstileUnit,
+    payload: dict,
+) -> TurnstileDeviceResult:
+    url = f"{unit.url.rstrip('/')}/modify_objects.fcgi"
+    started = time.perf_counter()
+
+    try:
+        response = await client.post(
+            url, params={"session": unit.session}, json=payload
+        )
+    except httpx.HTTPError as e:
+        logger.warning(f"Turnstile {unit.name} unreachable: {e!r}")
+        return TurnstileDeviceResult(
+            name=unit.name,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            error=f"Connection error: {e!r}",
+        )
+
+    latency_ms = (time.perf_counter() - started) * 1000
+
+    if response.status_code != HTTPStatus.OK:
+        logger.warning(
+            f"Turnstile {unit.name} answered {response.status_code}: "
+            f"{response.text}"
+        )
+        return TurnstileDeviceResult(
+            name=unit.name,
+            status_code=response.status_code,
+            latency_ms=latency_ms,
+            error=response.text or f"HTTP {response.status_code}",
         )
-        try:
-            requests.post(url, json=payload, timeout=5)
-        except Exception:
-            continue
-
-    return {
-        "success": True,
-        "action": "turnstile_deactivation"
+
+    return TurnstileDeviceResult(
+        name=unit.name,
+        success=True,
+        status_code=response.status_code,
+        latency_ms=latency_ms,
+    )
+
+
+async def deactivate_user_turnstiles(
+    registration: str,
+) -> TurnstileDeactivationResult:
+    """Expires the user's access on every turnstile controller at once.
+
+    All controllers are contacted concurrently, so the call takes as long
+    as the slowest device rather than the sum of all of them.
+
+    Args:
+        registration (str): Employee registration, used as the user id
+            on the controllers.
+
+    Returns:
+        TurnstileDeactivationResult: Overall outcome plus one entry per
+            device, keyed by unit name.
+    """
+    logger.info(f"Deactivating turnstile access for {registration}")
+
+    try:
+        units = get_turnstile_units()
+    except ValueError as e:
+        logger.error(f"Invalid turnstile configuration: {e}")
+        return TurnstileDeactivationResult(error=str(e))
+
+    if not units:
+        return TurnstileDeactivationResult(
+            error="No turnstile units configured"
+        )
+
+    payload = {
+        "object": "users",
+        "values": {"end_time": EXPIRED_END_TIME},
+        "where": {"users": {"id": int(registration)}},
     }
+
+    client = http_clients.get(Upstream.TURNSTILE)
+    results = await asyncio.gather(
+        *(_deactivate_on_device(client, unit, payload) for unit in units)
+    )
+
+    return TurnstileDeactivationResult(
+        success=all(r.success for r in results),
+        devices={r.name: r for r in results},
+    )
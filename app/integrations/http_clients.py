@@ -0,0 +1,165 @@
+import importlib.util
+import logging
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+import httpx
+
+from app.core.config import settings
+from app.integrations.rate_limit import AsyncTokenBucket, rate_limit_hook
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional `h2` package (httpx[http2]).
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class Upstream(StrEnum):
+    """External HTTP systems the application talks to."""
+
+    SNIPEIT = "snipeit"
+    IFS_PRD = "ifs_prd"
+    IFS_TST = "ifs_tst"
+    INTOUCH = "intouch"
+    TURNSTILE = "turnstile"
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    """Connection settings for a single upstream."""
+
+    max_connections: int
+    max_keepalive_connections: int
+    timeout: float
+    base_url: str = ""
+    headers: dict[str, str] = field(default_factory=dict)
+    http2: bool = True
+    # Requests per second; 0 disables the limit.
+    rate_limit: float = 0.0
+
+
+def build_upstream_configs() -> dict[Upstream, UpstreamConfig]:
+    """Builds the per-upstream connection settings from the environment.
+
+    Returns:
+        dict[Upstream, UpstreamConfig]: Settings keyed by upstream.
+    """
+    return {
+        Upstream.SNIPEIT: UpstreamConfig(
+            base_url=settings.SNIPEIT_BASE_URL,
+            headers={
+                "Authorization": f"Bearer {settings.SNIPEIT_API_KEY}",
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            },
+            max_connections=settings.SNIPEIT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            # Term rendering happens synchronously on the Snipe-IT side.
+            timeout=settings.SNIPEIT_TIMEOUT,
+            rate_limit=settings.SNIPEIT_RATE_LIMIT,
+        ),
+        Upstream.IFS_PRD: UpstreamConfig(
+            base_url=settings.IFS_BASE_URL,
+            max_connections=settings.IFS_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            timeout=settings.IFS_TIMEOUT,
+            rate_limit=settings.IFS_RATE_LIMIT,
+        ),
+        Upstream.IFS_TST: UpstreamConfig(
+            base_url=settings.IFS_TST_BASE_URL,
+            max_connections=settings.IFS_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            timeout=settings.IFS_TIMEOUT,
+            rate_limit=settings.IFS_RATE_LIMIT,
+        ),
+        Upstream.INTOUCH: UpstreamConfig(
+            headers={"Authorization": f"Basic {settings.INTOUCH_TOKEN}"},
+            max_connections=settings.INTOUCH_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            timeout=settings.INTOUCH_TIMEOUT,
+            rate_limit=settings.INTOUCH_RATE_LIMIT,
+        ),
+        # ControlID controllers are embedded devices: HTTP/1.1 only. The
+        # limit is shared by every unit, which are all called at once.
+        Upstream.TURNSTILE: UpstreamConfig(
+            max_connections=settings.TURNSTILE_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.TURNSTILE_MAX_CONNECTIONS,
+            timeout=settings.TURNSTILE_TIMEOUT,
+            rate_limit=settings.TURNSTILE_RATE_LIMIT,
+            http2=False,
+        ),
+    }
+
+
+class HTTPClientRegistry:
+    """Holds one long-lived httpx.AsyncClient per upstream.
+
+    The app lifespan opens every client at startup and closes them on
+    shutdown; in between they are reused, so connections (TLS handshake,
+    DNS) are kept alive between calls. Code running outside the app
+    (scripts, tests) gets its client created on first use instead.
+    """
+
+    def __init__(self):
+        self._clients: dict[Upstream, httpx.AsyncClient] = {}
+        self._configs: dict[Upstream, UpstreamConfig] | None = None
+
+    def _build_client(self, upstream: Upstream) -> httpx.AsyncClient:
+        if self._configs is None:
+            self._configs = build_upstream_configs()
+        config = self._configs[upstream]
+
+        logger.info(f"Opening HTTP client for {upstream}")
+
+        event_hooks = {}
+        if config.rate_limit > 0:
+            bucket = AsyncTokenBucket(
+                rate=config.rate_limit,
+                burst=max(1, int(config.rate_limit)),
+            )
+            event_hooks["request"] = [rate_limit_hook(bucket)]
+
+        return httpx.AsyncClient(
+            base_url=config.base_url,
+            headers=config.headers,
+            http2=config.http2 and HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(
+                config.timeout, connect=settings.HTTP_CONNECT_TIMEOUT
+            ),
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+            ),
+            event_hooks=event_hooks,
+        )
+
+    def open(self) -> None:
+        """Creates the client of every upstream not opened yet."""
+        for upstream in Upstream:
+            self.get(upstream)
+
+    def get(self, upstream: Upstream) -> httpx.AsyncClient:
+        """Returns the shared client for an upstream, creating it if needed.
+
+        Args:
+            upstream (Upstream): Target system.
+
+        Returns:
+            httpx.AsyncClient: Client with the upstream's limits and timeouts.
+        """
+        client = self._clients.get(upstream)
+        if client is None or client.is_closed:
+            client = self._build_client(upstream)
+            self._clients[upstream] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Closes every open client."""
+        clients, self._clients = self._clients, {}
+        for upstream, client in clients.items():
+            await client.aclose()
+            logger.info(f"HTTP client for {upstream} closed")
+
+
+http_clients = HTTPClientRegistry()
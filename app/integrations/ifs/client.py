@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from app.core.config import settings
+from app.integrations.ifs.schemas import IFSTokenResponse
+
+logger = logging.getLogger(__name__)
+
+# (base_url, client_id, username)
+TokenKey = tuple[str, str, str]
+
+
+@dataclass
+class _CachedToken:
+    value: str
+    refresh_at: float
+
+
+class IFSTokenCache:
+    """Process-wide cache of IFS tokens, shared by every IFSService.
+
+    Tokens are reused until shortly before `expires_in` runs out. When
+    several requests need a token at once, only one of them calls the
+    token endpoint and the others wait for its result.
+
+    Args:
+        refresh_margin (float): Seconds before expiry at which a token is
+            renewed.
+        default_ttl (float): Lifetime assumed when IFS sends no usable
+            `expires_in`.
+    """
+
+    def __init__(self, *, refresh_margin: float, default_ttl: float):
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self._tokens: dict[TokenKey, _CachedToken] = {}
+        self._locks: dict[TokenKey, asyncio.Lock] = {}
+
+    def _lifetime(self, token: IFSTokenResponse) -> float:
+        try:
+            ttl = float(token.expires_in)
+        except (TypeError, ValueError):
+            ttl = self.default_ttl
+
+        # Never keep a short-lived token past half its lifetime
+        return max(0.0, ttl - min(self.refresh_margin, ttl / 2))
+
+    def _valid(self, key: TokenKey) -> str | None:
+        cached = self._tokens.get(key)
+        if cached is not None and time.monotonic() < cached.refresh_at:
+            return cached.value
+        return None
+
+    async def get(
+        self,
+        key: TokenKey,
+        fetch: Callable[[], Awaitable[IFSTokenResponse]],
+    ) -> str:
+        """Returns a valid token, calling `fetch` only when needed.
+
+        Args:
+            key (TokenKey): (base_url, client_id, username) of the account.
+            fetch (Callable[[], Awaitable[IFSTokenResponse]]): Requests a
+                new token from IFS.
+
+        Returns:
+            str: Token to send as Bearer.
+        """
+        if token := self._valid(key):
+            return token
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another request may have refreshed it while we waited
+            if token := self._valid(key):
+                return token
+
+            response = await fetch()
+            token = response.id_token or response.access_token
+            self._tokens[key] = _CachedToken(
+                value=token,
+                refresh_at=time.monotonic() + self._lifetime(response),
+            )
+            logger.info(f"IFS token refreshed for {key[2]}@{key[0]}")
+            return token
+
+    def invalidate(self, key: TokenKey, token: str) -> None:
+        """Drops a token rejected by IFS.
+
+        Only removes the entry if it still holds that token, so a token
+        already refreshed by a concurrent request is kept.
+
+        Args:
+            key (TokenKey): (base_url, client_id, username) of the account.
+            token (str): Token that was rejected.
+        """
+        cached = self._tokens.get(key)
+        if cached is not None and cached.value == token:
+            del self._tokens[key]
+
+
+ifs_token_cache = IFSTokenCache(
+    refresh_margin=settings.IFS_TOKEN_REFRESH_MARGIN,
+    default_ttl=settings.IFS_TOKEN_DEFAULT_TTL,
+)
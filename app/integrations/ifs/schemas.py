@@ -1,9 +1,10 @@
 from pydantic import BaseModel, Field
 
+
 class IFSUserResponse(BaseModel):
     context: str | None = Field(None, alias="@odata.context")
     etag: str | None = Field(None, alias="@odata.etag")
-    
+
     Identity: str
     Description: str | None = None
     Active: str | None = None
@@ -17,6 +18,7 @@ class IFSUserResponse(BaseModel):
     def is_active(self) -> bool:
         return self.Active == "TRUE"
 
+
 class IFSUserRequest(BaseModel):
     Etag: str | None = None
     Identify: str | None = None
@@ -25,31 +27,41 @@ class IFSUserRequest(BaseModel):
     validFrom: str = ""
     validTo: str = ""
 
+
 class IFSTokenRequest(BaseModel):
-     
+
     response_type: str = "id_token token"
     grant_type: str = "password"
     scope: str = "openid"
     username: str
-    password: str  
+    password: str
     client_id: str
     client_secret: str
-   
+
 
 class IFSTokenResponse(BaseModel):
-    access_token: str  
-    refresh_token: str | None = None  
+    access_token: str
+    refresh_token: str | None = None
     id_token: str | None = None
     token_type: str
-    expires_in: int | str 
+    expires_in: int | str
+
 
 class IFSPersonItem(BaseModel):
-    PersonId: str 
+    PersonId: str
     AlternativeName: str | None = None
 
+
 class IFSPersonUserResponse(BaseModel):
     value: list[IFSPersonItem] = []
 
+
 class IFSDesactiveUserRequest(BaseModel):
     Active: str
-    
\ No newline at end of file
+
+
+class IFSUserLookup(BaseModel):
+    """PersonId and FndUser record (with its ETag) of a registration."""
+
+    person_id: str
+    user: IFSUserResponse
@@ -1,34 +1,50 @@
 import logging
-import asyncio 
+from http import HTTPStatus
+
 import httpx
 
+from app.core.config import settings
+from app.integrations.http_clients import Upstream, http_clients
+from app.integrations.ifs.client import TokenKey, ifs_token_cache
 from app.integrations.ifs.schemas import (
-    IFSTokenResponse, 
-    IFSTokenRequest, 
-    IFSUserResponse, 
-    IFSUserRequest, 
+    IFSDesactiveUserRequest,
     IFSPersonUserResponse,
-    IFSDesactiveUserRequest 
+    IFSTokenRequest,
+    IFSTokenResponse,
+    IFSUserLookup,
+    IFSUserResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+
 class IFSService:
 
-    def __init__(self, base_url: str, username: str, password: str, client_id: str, client_secret: str): 
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        client_id: str,
+        client_secret: str,
+        client: httpx.AsyncClient | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.password = password
         self.client_id = client_id
         self.client_secret = client_secret
-        self._token = None
+        self.client = client
 
-    async def _get_token_ifs(self, client: httpx.AsyncClient) -> str:
+    @property
+    def _token_key(self) -> TokenKey:
+        return (self.base_url, self.client_id, self.username)
+
+    async def _request_token_ifs(
+        self, client: httpx.AsyncClient
+    ) -> IFSTokenResponse:
         url = f"{self.base_url}/openid-connect-provider/idp/token"
 
-        if self._token:
-            return self._token
-        
         payload = IFSTokenRequest(
             username=self.username,
             password=self.password,
@@ -43,128 +59,244 @@ class IFSService:
             "Content-Type": "application/x-www-form-urlencoded"
         }
 
-        response = await client.post(url, data=payload.model_dump(), headers=token_headers)
-        response.raise_for_status() 
+        response = await client.post(
+            url, data=payload.model_dump(), headers=token_headers
+        )
+        response.raise_for_status()
+
+        return IFSTokenResponse(**response.json())
+
+    async def _get_token_ifs(self, client: httpx.AsyncClient) -> str:
+        """
+        Returns the cached token of this IFS account, requesting a new one
+        only when it is missing or about to expire.
+        """
+        return await ifs_token_cache.get(
+            self._token_key, lambda: self._request_token_ifs(client)
+        )
+
+    async def _send_ifs(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        headers: dict,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Sends an authenticated request. If IFS answers 401 the cached token
+        is dropped and the request is retried once with a new token.
+        """
+        token = await self._get_token_ifs(client)
+        response = await client.request(
+            method,
+            url,
+            headers={**headers, "Authorization": f"Bearer {token}"},
+            **kwargs,
+        )
 
-        token_data = IFSTokenResponse(**response.json())
-        self._token = token_data.id_token
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            logger.info("IFS rejected the cached token, authenticating again")
+            ifs_token_cache.invalidate(self._token_key, token)
+            token = await self._get_token_ifs(client)
+            response = await client.request(
+                method,
+                url,
+                headers={**headers, "Authorization": f"Bearer {token}"},
+                **kwargs,
+            )
 
-        return self._token
-    
-    async def _get_person_user_ifs(self, registration: str, client: httpx.AsyncClient) -> IFSPersonUserResponse:
-        
-        url = f"{self.base_url}/main/ifsapplications/projection/v1/PersonHandling.svc/PersonInfoSet?$filter=AlternativeName%20eq%20'{registration}'"
+        return response
 
-        if not self._token:
-            await self._get_token_ifs(client) 
+    async def _get_person_user_ifs(
+        self, registration: str, client: httpx.AsyncClient
+    ) -> IFSPersonUserResponse:
+
+        url = (
+            f"{self.base_url}/main/ifsapplications/projection/v1/"
+            "PersonHandling.svc/PersonInfoSet"
+            f"?$filter=AlternativeName%20eq%20'{registration}'"
+        )
 
         logger.info(f"Searching PersonId for registration: {registration}")
 
         person_header = {
             "Accept": "application/json",
-            "Authorization": f"Bearer {self._token}"
         }
 
-        response = await client.get(url, headers=person_header)
+        response = await self._send_ifs(client, "GET", url, person_header)
         response.raise_for_status()
 
         person_data = IFSPersonUserResponse(**response.json())
         return person_data
-    
-    async def _get_user_ifs(self, registration: str, client: httpx.AsyncClient) -> IFSUserResponse:
-        
-        url = f"{self.base_url}/main/ifsapplications/projection/v1/UserRelatedData.svc/Reference_FndUser(Identity='{registration}')"
 
-        if not self._token:
-            await self._get_token_ifs(client) 
+    async def _get_user_ifs(
+        self, registration: str, client: httpx.AsyncClient
+    ) -> IFSUserResponse:
+
+        url = (
+            f"{self.base_url}/main/ifsapplications/projection/v1/"
+            f"UserRelatedData.svc/Reference_FndUser(Identity='{registration}')"
+        )
 
         logger.info(f"Searching for a collaborator in IFS: {registration}")
 
         search_headers = {
-            "Authorization": f"Bearer {self._token}",
             "Accept": "application/json"
         }
 
-        response = await client.get(url, headers=search_headers)
+        response = await self._send_ifs(client, "GET", url, search_headers)
         response.raise_for_status()
 
         user_data = IFSUserResponse(**response.json())
         return user_data
 
-    async def _patch_user_ifs(self, registration: str, etag: str, active: bool, client: httpx.AsyncClient) -> bool:
-        
-        url = f"{self.base_url}/main/ifsapplications/projection/v1/UserRelatedData.svc/Reference_FndUser(Identity='{registration}')"
+    async def _patch_user_ifs(
+        self,
+        registration: str,
+        etag: str,
+        active: bool,
+        client: httpx.AsyncClient,
+    ) -> bool:
 
-        if not self._token:
-            await self._get_token_ifs(client) 
+        url = (
+            f"{self.base_url}/main/ifsapplications/projection/v1/"
+            f"UserRelatedData.svc/Reference_FndUser(Identity='{registration}')"
+        )
 
         logger.info(f"Updating employee {registration} to status = {active}")
 
         patch_headers = {
-            "Authorization": f"Bearer {self._token}",
             "Accept": "application/json",
             "Content-Type": "application/json",
-            "If-Match": etag              
+            "If-Match": etag
         }
 
         status_string = str(active).upper()
         payload = IFSDesactiveUserRequest(Active=status_string)
 
-        response = await client.patch(
-            url, 
-            headers=patch_headers, 
-            json=payload.model_dump() 
+        response = await self._send_ifs(
+            client,
+            "PATCH",
+            url,
+            patch_headers,
+            json=payload.model_dump()
         )
-        
+
         response.raise_for_status()
 
         return response.status_code in (200, 204)
-    
-    async def disable_employee(self, registration: str, client: httpx.AsyncClient) -> bool:
+
+    async def lookup_user(
+        self, registration: str, client: httpx.AsyncClient | None = None
+    ) -> IFSUserLookup | None:
+        """
+        Resolves the PersonId and the FndUser record (including its ETag)
+        for a registration. Returns None when no person matches.
+        """
+        client = client or self.client
+
+        person_result = await self._get_person_user_ifs(registration, client)
+        if not person_result.value:
+            return None
+
+        person_id = person_result.value[0].PersonId
+        user_data = await self._get_user_ifs(person_id, client)
+
+        return IFSUserLookup(person_id=person_id, user=user_data)
+
+    async def disable_employee(
+        self,
+        registration: str,
+        client: httpx.AsyncClient | None = None,
+        lookup: IFSUserLookup | None = None,
+    ) -> bool:
         """
         Orchestrates the entire IFS deactivation process:
-        1. Finds the PersonId.
-        2. Retrieves the User Identity and ETag.
-        3. Sends the PATCH request to deactivate.
+        1. Finds the PersonId and the User Identity and ETag, unless an
+           earlier lookup is given.
+        2. Sends the PATCH request to deactivate. If the ETag changed since
+           the lookup (412), the user is reloaded and the PATCH retried once.
         """
+        client = client or self.client
         try:
-            person_result = await self._get_person_user_ifs(registration, client)
+            if lookup is None:
+                lookup = await self.lookup_user(registration, client)
 
-            if not person_result.value:
-                logger.warning(f"IFS Deactivation: No user found for registration {registration}")
+            if lookup is None:
+                logger.warning(
+                    "IFS Deactivation: No user found for registration "
+                    f"{registration}"
+                )
                 return False
-            
-            person_id = person_result.value[0].PersonId
-           
-            user_data = await self._get_user_ifs(person_id, client)
-
-            success = await self._patch_user_ifs(
-                registration=person_id,
-                etag=user_data.etag,
-                active=False,
-                client=client
-            )
-            return success
+
+            try:
+                return await self._patch_user_ifs(
+                    registration=lookup.person_id,
+                    etag=lookup.user.etag,
+                    active=False,
+                    client=client
+                )
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != HTTPStatus.PRECONDITION_FAILED:
+                    raise
+
+                logger.info(
+                    f"IFS ETag for {lookup.person_id} is stale, reloading user"
+                )
+                user_data = await self._get_user_ifs(lookup.person_id, client)
+
+                return await self._patch_user_ifs(
+                    registration=lookup.person_id,
+                    etag=user_data.etag,
+                    active=False,
+                    client=client
+                )
 
         except Exception as e:
-            logger.error(f"Failed to deactivate user {registration} in IFS: {str(e)}")
+            logger.error(
+                f"Failed to deactivate user {registration} in IFS: {str(e)}"
+            )
             return False
-        
+
     async def search_user(self, registration: str) -> bool:
         """
         Verifies if the user exists and is active in IFS.
-        Manages its own HTTP connection to be used independently.
+        Uses the shared HTTP client injected at construction.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                person_result = await self._get_person_user_ifs(registration, client)
-                if not person_result.value:
-                    return False
-                    
-                person_id = person_result.value[0].PersonId
-                user = await self._get_user_ifs(person_id, client)
-                
-                return user.is_active 
+            lookup = await self.lookup_user(registration)
+            if lookup is None:
+                return False
+
+            return lookup.user.is_active
         except Exception as e:
-            logger.error(f"Error fetching user status in IFS for {registration}: {e}")
-            return False
\ No newline at end of file
+            logger.error(
+                f"Error fetching user status in IFS for {registration}: {e}"
+            )
+            return False
+
+
+def get_ifs_service(upstream: Upstream = Upstream.IFS_PRD) -> IFSService:
+    """
+    Builds an IFSService for the PRD or TST environment, bound to the
+    shared HTTP client of that environment.
+    """
+    if upstream == Upstream.IFS_TST:
+        return IFSService(
+            base_url=settings.IFS_TST_BASE_URL,
+            username=settings.IFS_TST_USERNAME,
+            password=settings.IFS_TST_PASSWORD,
+            client_id=settings.IFS_TST_CLIENT_ID,
+            client_secret=settings.IFS_TST_CLIENT_SECRET,
+            client=http_clients.get(Upstream.IFS_TST),
+        )
+
+    return IFSService(
+        base_url=settings.IFS_BASE_URL,
+        username=settings.IFS_USERNAME,
+        password=settings.IFS_PASSWORD,
+        client_id=settings.IFS_CLIENT_ID,
+        client_secret=settings.IFS_CLIENT_SECRET,
+        client=http_clients.get(Upstream.IFS_PRD),
+    )
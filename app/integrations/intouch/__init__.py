@@ -1,9 +1,8 @@
 from .service import (
-    search_user,
     deactivate_user_intouch,
+    search_user,
 )
 
-
 __all__ = [
     "search_user",
     "deactivate_user_intouch",
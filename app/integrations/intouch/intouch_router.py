@@ -2,10 +2,10 @@ from http import HTTPStatus
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 
-#from app.enums import EmailActions
-from app.modules.users import Current_user
 from app.integrations.intouch import service
-from app.modules.shared.email_service import send_email
+
+# from app.enums import EmailActions
+from app.modules.users import Current_user
 
 router = APIRouter(prefix="/intouch", tags=["Intouch"])
 
@@ -15,7 +15,7 @@ async def search_user(
     current_user: Current_user,
     registration: str
 ):
-    res_intouch = service.search_user(registration)
+    res_intouch = await service.search_user(registration)
 
     if not res_intouch:
         raise HTTPException(
@@ -40,8 +40,8 @@ async def deactivate_user_intouch(
             detail="Error while deactivating user"
         )
 
-    #action = EmailActions.get_by_id(3)
-    #background_tasks.add_task(send_email, registration, action)
+    # action = EmailActions.get_by_id(3)
+    # background_tasks.add_task(send_email, registration, action)
 
     return {
         "message": "User successfully deactivated",
@@ -63,8 +63,8 @@ async def activate_user_intouch(
             detail=res_intouch.error
         )
 
-    #action = EmailActions.get_by_id(2)
-    #background_tasks.add_task(send_email, registration, action)
+    # action = EmailActions.get_by_id(2)
+    # background_tasks.add_task(send_email, registration, action)
 
     return {
         "message": "User successfully activated",
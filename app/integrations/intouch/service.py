@@ -1,13 +1,16 @@
 from http import HTTPStatus
-import re
-
-import requests
 from logging import getLogger
+
+import httpx
+
 from app.core import settings
+from app.integrations.http_clients import Upstream, http_clients
+from app.integrations.registration import registration_variants
+
 from .schemas import (
-    InTouchUserSearchModel,
     InTouchActivateUserModel,
-    InTouchDeactivateUserModel
+    InTouchDeactivateUserModel,
+    InTouchUserSearchModel,
 )
 
 logger = getLogger("uvcorn.error")
@@ -28,6 +31,10 @@ def _get_headers(content_type: str | None = None) -> dict:
     return headers
 
 
+def _get_client() -> httpx.AsyncClient:
+    return http_clients.get(Upstream.INTOUCH)
+
+
 def _validate_config() -> dict | None:
     if not settings.INTOUCH_TOKEN:
         return {"success": False, "error": "InTouch token not configured"}
@@ -36,55 +43,45 @@ def _validate_config() -> dict | None:
     return None
 
 
-def search_user(registration: str) -> InTouchUserSearchModel:
+async def search_user(registration: str) -> InTouchUserSearchModel:
     logger.info(f"Searching InTouch user: {registration}")
 
     if err := _validate_config():
         return InTouchUserSearchModel(error=str(err), registration="")
 
+    variants = registration_variants(registration)
 
-    #adding regex to clean registration
-
-    base_registration = re.sub(r'\D', '', registration).lstrip('0')
-
-    if not base_registration:
+    if not variants:
         return InTouchUserSearchModel(
             success=False,
             found=False,
             error="Invalid registration format."
         )
-    
-    padded_num = base_registration.zfill(6)
 
-    filter_query = (
-
-        f'profile.employeeid eq "{base_registration}" or '
-        f'profile.employeeid eq "{padded_num}" or '
-        f'profile.employeeid eq "ctb{base_registration}" or '
-        f'profile.employeeid eq "ctb{padded_num}" or '
-        f'profile.employeeid eq "CTB{padded_num}"'
+    filter_query = " or ".join(
+        f'profile.employeeid eq "{variant}"' for variant in variants
     )
 
     try:
 
-        response = requests.get(
+        response = await _get_client().get(
             settings.INTOUCH_URL,
             params={
                 "filter": filter_query,
-                "query": "CTB" # i searched for the location directly using the staffbase parameter
+                # i searched for the location directly using the
+                # staffbase parameter
+                "query": "CTB",
             },
             headers=_get_headers(),
-            timeout=10
             )
-        
-    except requests.RequestException as e:
+
+    except httpx.HTTPError as e:
         logger.error(f"Intouch connection error: {e}")
         return InTouchUserSearchModel(
             success=False,
             error=f"Connection error: {str(e)}"
         )
 
-
     if response.status_code != HTTPStatus.OK:
         return InTouchUserSearchModel(
             success=False,
@@ -105,11 +102,10 @@ def search_user(registration: str) -> InTouchUserSearchModel:
         return InTouchUserSearchModel(
             success=False,
             found=False,
-            error=(
-                "User not found or does not belong to the CTB unit." # changing responsability to check
-                )
+            # changing responsability to check
+            error="User not found or does not belong to the CTB unit.",
         )
-    
+
     raw_user = list_users[0]
 
     status = raw_user.get('status')
@@ -126,9 +122,10 @@ def search_user(registration: str) -> InTouchUserSearchModel:
         role=raw_user.get('position'),
         current_status=status,
         is_active=status in ACTIVE_STATUSES,
-        registration=base_registration,
+        registration=variants[0],
     )
 
+
 async def activate_user_intouch(registration: str) -> InTouchActivateUserModel:
 
     logger.info(f"Activating InTouch user: {registration}")
@@ -136,7 +133,7 @@ async def activate_user_intouch(registration: str) -> InTouchActivateUserModel:
     if err := _validate_config():
         return InTouchActivateUserModel(error=str(err))
 
-    data = search_user(registration)
+    data = await search_user(registration)
     if not data or not data.success:
         return InTouchActivateUserModel(success=False, error="User not found.")
 
@@ -167,11 +164,10 @@ async def activate_user_intouch(registration: str) -> InTouchActivateUserModel:
     }
 
     try:
-        resp = requests.put(
+        resp = await _get_client().put(
             url_update,
             json=payload,
             headers=headers_update,
-            timeout=10
         )
 
         if resp.status_code in {HTTPStatus.OK, HTTPStatus.NO_CONTENT}:
@@ -194,16 +190,22 @@ async def activate_user_intouch(registration: str) -> InTouchActivateUserModel:
         )
 
 
-async def deactivate_user_intouch(registration: str) -> InTouchDeactivateUserModel:
+async def deactivate_user_intouch(
+    registration: str,
+    user: InTouchUserSearchModel | None = None,
+) -> InTouchDeactivateUserModel:
 
     logger.info(f"Deactivating InTouch user: {registration}")
 
     if err := _validate_config():
         return InTouchDeactivateUserModel(error=str(err))
 
-    data = search_user(registration)
+    # reuse an earlier search when the caller already has one
+    data = user if user and user.success else await search_user(registration)
     if not data or not data.success:
-        return InTouchDeactivateUserModel(success=False, error="User not found.")
+        return InTouchDeactivateUserModel(
+            success=False, error="User not found."
+        )
 
     user_id = data.id_system
     name = data.name
@@ -224,11 +226,10 @@ async def deactivate_user_intouch(registration: str) -> InTouchDeactivateUserMod
                 )
             }
 
-            resp = requests.put(
+            resp = await _get_client().put(
                 url_update,
                 json=payload,
                 headers=headers_update,
-                timeout=10
             )
             if resp.status_code in {HTTPStatus.OK, HTTPStatus.NO_CONTENT}:
                 return InTouchDeactivateUserModel(
@@ -241,10 +242,9 @@ async def deactivate_user_intouch(registration: str) -> InTouchDeactivateUserMod
                         error=f"Error during deactivation: {resp.text}"
             )
         if status in DELETABLE_STATUSES:
-            resp = requests.delete(
+            resp = await _get_client().delete(
                 f"{settings.INTOUCH_URL}/{user_id}",
                 headers=_get_headers(),
-                timeout=10,
             )
             if resp.status_code in {HTTPStatus.OK, HTTPStatus.NO_CONTENT}:
                 return InTouchDeactivateUserModel(
@@ -269,7 +269,7 @@ async def deactivate_user_intouch(registration: str) -> InTouchDeactivateUserMod
             error=f"Unknown: '{status}' - operation canceled for safety",
         )
 
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         return InTouchDeactivateUserModel(
             success=False,
             error=f"Connection error: {str(e)}"
@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+import httpx
+
+
+class AsyncTokenBucket:
+    """Token bucket limiting how many requests start per second.
+
+    Callers wait in acquire() until a token is available, so bursts are
+    smoothed out instead of rejected.
+
+    Args:
+        rate (float): Tokens added per second.
+        burst (int): Maximum tokens that can accumulate.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Waits until a token is available and takes it."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+def rate_limit_hook(bucket: AsyncTokenBucket):
+    """Builds an httpx request event hook that waits on the bucket.
+
+    Args:
+        bucket (AsyncTokenBucket): Bucket shared by every request of a client.
+
+    Returns:
+        Callable: Hook for `event_hooks={"request": [...]}`.
+    """
+
+    async def hook(request: httpx.Request) -> None:
+        await bucket.acquire()
+
+    return hook
@@ -0,0 +1,29 @@
+import re
+
+
+def registration_variants(registration: str) -> list[str]:
+    """Returns the forms an employee registration is stored as upstream.
+
+    The digits are kept without leading zeros, zero-padded to six digits
+    and prefixed with `ctb`/`CTB`, e.g. "42" -> "42", "000042", "ctb42",
+    "ctb000042", "CTB000042".
+
+    Args:
+        registration (str): Registration as typed by the operator.
+
+    Returns:
+        list[str]: Variants to match exactly, or an empty list if the
+        registration has no digits.
+    """
+    base = re.sub(r"\D", "", registration).lstrip("0")
+    if not base:
+        return []
+
+    padded = base.zfill(6)
+    return list(dict.fromkeys([
+        base,
+        padded,
+        f"ctb{base}",
+        f"ctb{padded}",
+        f"CTB{padded}",
+    ]))
@@ -1,10 +1,11 @@
-from .schemas import GenerateTermRequest, CheckinAssetRequest
+from .cache import snipeit_cache
+from .schemas import CheckinAssetRequest, GenerateTermRequest
 from .service import SnipeItService, get_snipeit_service
 
-
 __all__ = [
     "GenerateTermRequest",
     "SnipeItService",
     "get_snipeit_service",
-    "CheckinAssetRequest"
+    "CheckinAssetRequest",
+    "snipeit_cache",
 ]
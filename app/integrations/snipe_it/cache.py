@@ -0,0 +1,50 @@
+from app.core.cache import SingleFlightCache
+from app.core.config import settings
+
+
+class SnipeItCache:
+    """
+    Caches of Snipe-IT lookups that rarely change during an offboarding.
+
+    - templates: term templates list (long TTL)
+    - users: registration -> user row (short TTL, dropped on checkin/checkout)
+    - asset_ids: asset tag -> asset id (short TTL)
+
+    Concurrent misses for the same key share a single request.
+    """
+
+    def __init__(
+        self, *, template_ttl: float, lookup_ttl: float, maxsize: int
+    ):
+        self.templates: SingleFlightCache[str, list] = SingleFlightCache(
+            ttl=template_ttl, maxsize=1
+        )
+        self.users: SingleFlightCache[str, dict] = SingleFlightCache(
+            ttl=lookup_ttl, maxsize=maxsize
+        )
+        self.asset_ids: SingleFlightCache[str, int] = SingleFlightCache(
+            ttl=lookup_ttl, maxsize=maxsize
+        )
+
+    def invalidate_user(self, registration: str) -> None:
+        """
+        Drops the cached user of a registration after its assets changed.
+        """
+        self.users.invalidate(str(registration))
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Hit/miss counters and sizes of each cache.
+        """
+        return {
+            "templates": self.templates.stats(),
+            "users": self.users.stats(),
+            "asset_ids": self.asset_ids.stats(),
+        }
+
+
+snipeit_cache = SnipeItCache(
+    template_ttl=settings.SNIPEIT_TEMPLATE_CACHE_TTL,
+    lookup_ttl=settings.SNIPEIT_LOOKUP_CACHE_TTL,
+    maxsize=settings.SNIPEIT_CACHE_SIZE,
+)
@@ -1,27 +1,27 @@
-import httpx
-from app.core.config import settings
-from app.integrations.snipe_it.schemas import GenerateTermRequest
 import logging
 from datetime import datetime
 
+import httpx
+
+from app.integrations.http_clients import Upstream, http_clients
+
+from .cache import snipeit_cache
+
 logger = logging.getLogger(__name__)
 
 
 class SnipeItService:
-    def __init__(self, base_url: str):
-        self.base_url = base_url.rstrip("/")
-        self.headers = {
-            "Authorization": f"Bearer {settings.SNIPEIT_API_KEY}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
 
-    async def _get_user_by_registration(
-        self,
-        client: httpx.AsyncClient,
-        registration: str
-    ) -> int:
-        response = await client.get(
+    async def _get_user_by_registration(self, registration: str) -> dict:
+        return await snipeit_cache.users.get_or_load(
+            str(registration),
+            lambda: self._fetch_user_by_registration(registration),
+        )
+
+    async def _fetch_user_by_registration(self, registration: str) -> dict:
+        response = await self.client.get(
             "users",
             params={"search": registration, "limit": 10}
         )
@@ -30,7 +30,8 @@ class SnipeItService:
         data = response.json()
         if data.get("total", 0) == 0:
             raise ValueError(
-                f"Usuário com matrícula '{registration}' não encontrado no Snipe-IT."
+                f"Usuário com matrícula '{registration}' não encontrado "
+                "no Snipe-IT."
             )
 
         rows = data.get("rows", [])
@@ -44,54 +45,64 @@ class SnipeItService:
         )
         return rows[0]
 
-    async def _get_asset_by_tag(
-        self,
-        client: httpx.AsyncClient,
-        asset_tag: str
-    ) -> int:
-        response = await client.get(f"hardware/bytag/{asset_tag}")
+    async def _get_asset_by_tag(self, asset_tag: str) -> int:
+        return await snipeit_cache.asset_ids.get_or_load(
+            asset_tag, lambda: self._fetch_asset_id(asset_tag)
+        )
+
+    async def _fetch_asset_id(self, asset_tag: str) -> int:
+        response = await self.client.get(f"hardware/bytag/{asset_tag}")
         response.raise_for_status()
         return response.json().get("id")
 
-    async def search_assets_by_user(self, registration: str):
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers
-        ) as client:
-            user = await self._get_user_by_registration(client, registration)
-            user_id = user["id"]
+    async def find_user(self, registration: str) -> dict:
+        """
+        Busca o usuário do Snipe-IT pela matrícula (employee_num).
+        """
+        return await self._get_user_by_registration(registration)
 
-            response = await client.get(
-                f"users/{user_id}/assets",
-                params={"limit": 500}
-            )
-            response.raise_for_status()
+    async def get_user_assets(self, user_id: int) -> list[dict]:
+        """
+        Lista os ativos atribuídos a um usuário do Snipe-IT.
+        """
+        response = await self.client.get(
+            f"users/{user_id}/assets",
+            params={"limit": 500}
+        )
+        response.raise_for_status()
 
-            assets = response.json().get("rows", [])
-            logger.info(
-                f"{len(assets)} ativo(s) encontrado(s) para matrícula {registration}."
-            )
-            return assets
+        return response.json().get("rows", [])
+
+    async def search_assets_by_user(self, registration: str):
+        user = await self.find_user(registration)
+        assets = await self.get_user_assets(user["id"])
+
+        logger.info(
+            f"{len(assets)} ativo(s) encontrado(s) para matrícula "
+            f"{registration}."
+        )
+        return assets
 
     async def checkin_asset(
         self,
         registration: str,
         asset_tag: str,
-        note: str = ""
+        note: str = "",
+        asset_id: int | None = None,
     ):
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers
-        ) as client:
-            asset_id = await self._get_asset_by_tag(client, asset_tag)
+        if asset_id is None:
+            asset_id = await self._get_asset_by_tag(asset_tag)
 
-            payload = {
-                "note": note,
-            }
+        payload = {
+            "note": note,
+        }
 
-            response = await client.post(
-                f"hardware/{asset_id}/checkin", json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.post(
+            f"hardware/{asset_id}/checkin", json=payload
+        )
+        snipeit_cache.invalidate_user(registration)
+        response.raise_for_status()
+        return response.json()
 
     async def checkout_asset(
         self,
@@ -99,84 +110,85 @@ class SnipeItService:
         asset_tag: str,
         note: str = "Alocado via API (Onboarding)"
     ):
-        async with httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self.headers
-        ) as client:
-            user_id = await self._get_user_by_registration(
-                client, registration
-            )
-            asset_id = await self._get_asset_by_tag(client, asset_tag)
+        user = await self._get_user_by_registration(registration)
+        asset_id = await self._get_asset_by_tag(asset_tag)
 
-            payload = {
-                "checkout_to_type": "user",
-                "assigned_user": user_id,
-                "note": note
-            }
+        payload = {
+            "checkout_to_type": "user",
+            "assigned_user": user["id"],
+            "note": note
+        }
 
-            response = await client.post(
-                f"hardware/{asset_id}/checkout",
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.post(
+            f"hardware/{asset_id}/checkout",
+            json=payload
+        )
+        snipeit_cache.invalidate_user(registration)
+        response.raise_for_status()
+        return response.json()
 
     async def update_user_notes(
         self,
         registration: str,
         performed_by: str,
+        user_id: int | None = None,
     ) -> None:
-        """Updates the Snipe-IT user notes field to record the offboarding event.
+        """Updates the Snipe-IT user notes to record the offboarding event.
 
-        Sets a note on the user record indicating who performed the offboarding
-        and when it occurred, using the Snipe-IT user update endpoint.
+        Sets a note on the user record indicating who performed the
+        offboarding and when it occurred, using the Snipe-IT user update
+        endpoint.
 
         Args:
             registration (str): Employee registration number.
-            performed_by (str): Username of the person who performed the offboarding.
+            performed_by (str): Username of the person who performed the
+                offboarding.
+            user_id (int | None): Snipe-IT user id, when already known.
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers
-        ) as client:
-            user = await self._get_user_by_registration(client, registration)
+        if user_id is None:
+            user = await self._get_user_by_registration(registration)
             user_id = user["id"]
 
-            timestamp = datetime.now().strftime("%d/%m/%Y %H:%M")
-            note = (
-                f"Desativado via Offboarding System em {timestamp} "
-                f"por {performed_by}."
-            )
+        timestamp = datetime.now().strftime("%d/%m/%Y %H:%M")
+        note = (
+            f"Desativado via Offboarding System em {timestamp} "
+            f"por {performed_by}."
+        )
 
-            response = await client.patch(
-                f"users/{user_id}",
-                json={"notes": note}
-            )
+        response = await self.client.patch(
+            f"users/{user_id}",
+            json={"notes": note}
+        )
 
-            if not response.is_success:
-                logger.warning(
-                    f"Falha ao atualizar notas do usuário {registration} "
-                    f"no Snipe-IT: {response.status_code} — {response.text}"
-                )
-            else:
-                logger.info(
-                    f"Notas do usuário {registration} atualizadas no Snipe-IT."
-                )
+        if not response.is_success:
+            logger.warning(
+                f"Falha ao atualizar notas do usuário {registration} "
+                f"no Snipe-IT: {response.status_code} — {response.text}"
+            )
+        else:
+            logger.info(
+                f"Notas do usuário {registration} atualizadas no Snipe-IT."
+            )
 
     async def get_templates(self) -> list:
         """
         Busca todos os templates disponíveis na API customizada do Snipe-IT.
+        A lista fica em cache por SNIPEIT_TEMPLATE_CACHE_TTL segundos.
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers
-        ) as client:
-            response = await client.get("terms/templates")
-            response.raise_for_status()
+        return await snipeit_cache.templates.get_or_load(
+            "templates", self._fetch_templates
+        )
+
+    async def _fetch_templates(self) -> list:
+        response = await self.client.get("terms/templates")
+        response.raise_for_status()
 
-            return response.json().get("templates", [])
+        return response.json().get("templates", [])
 
     async def get_template_id_by_type(self, term_type: str) -> int:
         """
-        Busca o ID de um template pelo seu tipo exato (ex: 'checkin' ou 'checkout').
+        Busca o ID de um template pelo seu tipo exato
+        (ex: 'checkin' ou 'checkout').
         """
         templates = await self.get_templates()
 
@@ -195,30 +207,27 @@ class SnipeItService:
         template_id: int,
         asset_tag: str
     ):
-        print(f"Tentando conectar em: {self.base_url}/api/v1/terms/generate")
-        async with httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self.headers
-        ) as client:
-            payload = {
-                "employee_num": employee_num,
-                "template_id": template_id,
-                "asset_tag": asset_tag
-            }
-
-            response = await client.post(
-                "terms/generate",
-                json=payload
-            )
-            response.raise_for_status()
+        logger.debug(
+            f"Tentando conectar em: {self.client.base_url}terms/generate"
+        )
+        payload = {
+            "employee_num": employee_num,
+            "template_id": template_id,
+            "asset_tag": asset_tag
+        }
+
+        response = await self.client.post(
+            "terms/generate",
+            json=payload
+        )
+        response.raise_for_status()
 
-            return response.content
+        return response.content
 
 
 def get_snipeit_service() -> SnipeItService:
     """
-    Instancia o serviço do Snipe-IT usando as credenciais do sistema (.env)
+    Instancia o serviço do Snipe-IT com o cliente HTTP compartilhado,
+    já configurado com as credenciais do sistema (.env)
     """
-    return SnipeItService(
-        base_url=settings.SNIPEIT_BASE_URL,
-    )
+    return SnipeItService(client=http_clients.get(Upstream.SNIPEIT))
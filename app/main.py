@@ -1,28 +1,45 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from app.modules.audit import router as audit_router
-from app.core.database import init_db
+from app.core import health
+from app.core.database import dispose_async_engine, init_db
 from app.integrations.active_directory import aduser_router
+from app.integrations.active_directory.pool import ldap_pool
+from app.integrations.http_clients import http_clients
 from app.integrations.intouch import intouch_router
+from app.modules.audit import router as audit_router
+from app.modules.audit.cleanup.scheduler import start_scheduler
+from app.modules.audit.export_pool import export_pool
+from app.modules.audit.writer import audit_writer
 from app.modules.offboarding import router as offboarding_router
+from app.modules.offboarding.worker import offboarding_workers
 from app.modules.onboarding import router as onboarding_router
-from app.core import health
-from app.modules.users import user_router
 from app.modules.users import (
     auth_router,
+    user_router,
 )
-from app.modules.audit.cleanup.scheduler import start_scheduler
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db()
+    audit_writer.start()
     start_scheduler()
+    await run_in_threadpool(ldap_pool.open)
+    http_clients.open()
+    await offboarding_workers.start()
+    export_pool.start()
     yield
+    await run_in_threadpool(export_pool.stop)
+    await offboarding_workers.stop()
+    await http_clients.aclose()
+    await run_in_threadpool(ldap_pool.close)
+    await run_in_threadpool(audit_writer.stop)
+    await dispose_async_engine()
 
 
 app = FastAPI(lifespan=lifespan)
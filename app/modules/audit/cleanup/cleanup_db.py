@@ -3,8 +3,9 @@ from datetime import datetime, timezone
 from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
-from app.modules.audit.model import AuditLog
 from app.core import SessionLocal
+from app.modules.audit.model import AuditLog
+
 from .retention import RETENTION_POLICY
 
 
@@ -1,6 +1,11 @@
+from datetime import datetime
+
 from apscheduler.schedulers.background import BackgroundScheduler
 
+from app.core.config import settings
+from app.integrations.active_directory.snapshot import sync_directory_snapshot
 from app.modules.audit.cleanup.cleanup_db import cleanup_audit_logs_db
+from app.modules.offboarding.term_store import cleanup_term_files
 
 scheduler = BackgroundScheduler()
 
@@ -14,4 +19,22 @@ def start_scheduler():
         replace_existing=True,
     )
 
+    scheduler.add_job(
+        cleanup_term_files,
+        trigger="cron",
+        hour=3,
+        id="term_cleanup",
+        replace_existing=True,
+    )
+
+    if settings.AD_SNAPSHOT_ENABLED:
+        scheduler.add_job(
+            sync_directory_snapshot,
+            trigger="interval",
+            seconds=settings.AD_SNAPSHOT_SYNC_INTERVAL,
+            next_run_time=datetime.now(),
+            id="ad_snapshot_sync",
+            replace_existing=True,
+        )
+
     scheduler.start()
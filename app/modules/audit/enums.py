@@ -41,3 +41,11 @@ class AuditStatus(str, Enum):
     DENIED = "DENIED"
     PARTIAL = "PARTIAL"
     VALIDATION_ERROR = "VALIDATION_ERROR"
+
+
+class AuditExportStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
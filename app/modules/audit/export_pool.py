@@ -0,0 +1,157 @@
+import logging
+import multiprocessing
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+
+from .enums import AuditExportStatus
+from .service import abort_export_job, export_audit_logs_task
+
+logger = logging.getLogger(__name__)
+
+# Formats whose rendering is CPU-bound (ReportLab layout, openpyxl cells)
+POOLED_FORMATS = frozenset({"pdf", "xlsx"})
+# Worker processes are replaced after this many exports, returning the
+# memory of large renders to the OS
+MAX_EXPORTS_PER_PROCESS = 20
+
+
+class ExportQueueFull(Exception):
+    """The export pool already has max_queue exports waiting."""
+
+
+def _init_worker() -> None:
+    # Shutdown is driven by the API process, not by Ctrl+C in each worker
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+class ExportProcessPool:
+    """Runs CPU-bound audit exports in separate processes.
+
+    Rendering a PDF or XLSX report holds the GIL for its whole duration;
+    in a worker process it no longer slows down request handling. The
+    workers only receive the job id and read the logs and record the
+    outcome themselves (see export_audit_logs_task).
+
+    Args:
+        size (int): Worker processes; 0 disables the pool.
+        max_queue (int): Exports allowed to wait for a free worker.
+    """
+
+    def __init__(self, *, size: int, max_queue: int):
+        self.size = max(0, size)
+        self.max_queue = max(0, max_queue)
+        self._executor: ProcessPoolExecutor | None = None
+        self._futures: dict[UUID, Future] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> None:
+        """Creates the executor; processes are spawned on first use."""
+        if self.size == 0 or self._executor is not None:
+            return
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.size,
+            # The API process runs threads (scheduler, LDAP pool), which
+            # forking would copy in an undefined state
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            max_tasks_per_child=MAX_EXPORTS_PER_PROCESS,
+        )
+        logger.info(f"Export pool started with {self.size} process(es)")
+
+    def stop(self) -> None:
+        """Waits for running exports and drops the queued ones.
+
+        Queued exports are marked failed, so identical requests made
+        after the restart start a new export instead of reusing them.
+        """
+        if self._executor is None:
+            return
+
+        with self._lock:
+            futures = dict(self._futures)
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+
+        dropped = [
+            job_id for job_id, future in futures.items() if future.cancelled()
+        ]
+        if dropped:
+            self._fail(dropped, "Interrupted by shutdown")
+
+        logger.info("Export pool stopped")
+
+    def submit(self, job_id: UUID) -> None:
+        """Queues an export job.
+
+        Raises:
+            ExportQueueFull: If size + max_queue exports are already
+                running or waiting.
+        """
+        if self._executor is None:
+            raise RuntimeError("Export pool is not running")
+
+        with self._lock:
+            if len(self._futures) >= self.size + self.max_queue:
+                raise ExportQueueFull()
+
+            future = self._executor.submit(
+                export_audit_logs_task, job_id=job_id
+            )
+            self._futures[job_id] = future
+
+        future.add_done_callback(lambda f: self._done(job_id, f))
+
+    def cancel(self, job_id: UUID) -> bool:
+        """Removes an export from the queue if it has not started.
+
+        A running export is stopped through its job status instead
+        (see abort_export_job).
+        """
+        with self._lock:
+            future = self._futures.get(job_id)
+
+        return future is not None and future.cancel()
+
+    def _done(self, job_id: UUID, future: Future) -> None:
+        with self._lock:
+            if self._futures.get(job_id) is future:
+                del self._futures[job_id]
+
+        # The task records its own errors; this is the worker process
+        # dying, which would leave the job running forever
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Export {job_id} worker error: {future.exception()}")
+            self._fail([job_id], "Export process terminated unexpectedly")
+
+    @staticmethod
+    def _fail(job_ids: list[UUID], error: str) -> None:
+        session = SessionLocal()
+        try:
+            for job_id in job_ids:
+                abort_export_job(
+                    session,
+                    job_id,
+                    status=AuditExportStatus.FAILED,
+                    error=error,
+                )
+        except Exception as e:
+            logger.error(f"Could not mark exports {job_ids} as failed: {e}")
+        finally:
+            session.close()
+
+
+export_pool = ExportProcessPool(
+    size=settings.AUDIT_EXPORT_PROCESSES,
+    max_queue=settings.AUDIT_EXPORT_MAX_QUEUE,
+)
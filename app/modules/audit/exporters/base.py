@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
-
+from typing import BinaryIO
 
 ACTION_LABELS = {
     "system_login": "Login",
@@ -37,3 +37,12 @@ COLUMN_HEADERS = {
 class AuditLogExporter(ABC):
     @abstractmethod
     def export(self, logs: Iterable[dict]) -> bytes: ...
+
+    def export_stream(self, logs: Iterable[dict], out: BinaryIO) -> None:
+        """Writes the export to `out` while consuming `logs`.
+
+        Formats that can be produced row by row override this so the
+        logs are never all in memory. This default materialises them and
+        delegates to export().
+        """
+        out.write(self.export(list(logs)))
@@ -1,21 +1,28 @@
 import csv
 import io
+from typing import BinaryIO, Iterable
 
 from .base import AuditLogExporter
 
 
 class CSVExporter(AuditLogExporter):
     def export(self, logs: list[dict]) -> bytes:  # noqa: PLR6301
-        if not logs:
-            return b""
+        output = io.BytesIO()
+        self.export_stream(logs, output)
+        return output.getvalue()
 
-        output = io.StringIO()
-        writer = csv.DictWriter(
-            output,
-            fieldnames=logs[0].keys(),
-        )
+    def export_stream(  # noqa: PLR6301
+        self, logs: Iterable[dict], out: BinaryIO
+    ) -> None:
+        text = io.TextIOWrapper(out, encoding="utf-8", newline="")
+        writer = None
 
-        writer.writeheader()
-        writer.writerows(logs)
-
-        return output.getvalue().encode("utf-8")
+        try:
+            for log in logs:
+                if writer is None:
+                    writer = csv.DictWriter(text, fieldnames=log.keys())
+                    writer.writeheader()
+                writer.writerow(log)
+        finally:
+            text.flush()
+            text.detach()
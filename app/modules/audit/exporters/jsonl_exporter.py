@@ -1,10 +1,21 @@
+import io
 import json
-from typing import Iterable
+from typing import BinaryIO, Iterable
 
 from .base import AuditLogExporter
 
 
 class JSONLExporter(AuditLogExporter):
     def export(self, logs: Iterable[dict]) -> bytes:  # noqa: PLR6301
-        lines = [json.dumps(log, ensure_ascii=False) for log in logs]
-        return ("\n".join(lines)).encode("utf-8")
+        output = io.BytesIO()
+        self.export_stream(logs, output)
+        return output.getvalue()
+
+    def export_stream(  # noqa: PLR6301
+        self, logs: Iterable[dict], out: BinaryIO
+    ) -> None:
+        separator = b""
+        for log in logs:
+            line = json.dumps(log, ensure_ascii=False).encode("utf-8")
+            out.write(separator + line)
+            separator = b"\n"
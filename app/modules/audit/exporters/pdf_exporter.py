@@ -1,17 +1,23 @@
 import io
+from typing import Any, Iterable
+
+from reportlab.lib import colors  # type: ignore
+from reportlab.lib.pagesizes import A4, landscape  # type: ignore
+from reportlab.lib.styles import getSampleStyleSheet  # type: ignore
 from reportlab.platypus import (  # type: ignore
-    SimpleDocTemplate,
     Paragraph,
+    SimpleDocTemplate,
     Spacer,
     Table,
-    TableStyle
+    TableStyle,
+)
+
+from .base import (
+    ACTION_LABELS,
+    COLUMN_HEADERS,
+    STATUS_LABELS,
+    AuditLogExporter,
 )
-from typing import Iterable, Any
-from reportlab.lib.styles import getSampleStyleSheet  # type: ignore
-from reportlab.lib.pagesizes import landscape, A4  # type: ignore
-from reportlab.lib import colors  # type: ignore
-from .base import AuditLogExporter
-from .base import ACTION_LABELS, COLUMN_HEADERS, STATUS_LABELS
 
 
 class PDFExporter(AuditLogExporter):
@@ -51,7 +57,7 @@ class PDFExporter(AuditLogExporter):
                 ) for h in headers]
             ]
 
-            for log in logs:
+            for log in log_list:
                 row = []
                 row.append(
                     Paragraph(str(log.get("created_at")), styles["Normal"])
@@ -1,56 +1,93 @@
 import io
-from openpyxl import Workbook # type: ignore
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from typing import Any, BinaryIO, Iterable
+
+from openpyxl import Workbook  # type: ignore
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.utils import get_column_letter
-from .base import AuditLogExporter
-from typing import Iterable, Any
+
 # Importamos os mapeamentos que criamos anteriormente
-from .base import ACTION_LABELS, COLUMN_HEADERS, STATUS_LABELS
+from .base import (
+    ACTION_LABELS,
+    COLUMN_HEADERS,
+    STATUS_LABELS,
+    AuditLogExporter,
+)
 
+DISPLAY_COLUMNS = [
+    "created_at",
+    "username",
+    "action",
+    "target_username",
+    "target_registration",
+    "status",
+    "ip_address",
+    "message"
+]
 
-class XLSXExporter(AuditLogExporter):
-    def export(self, logs: Iterable[dict[str, Any]]) -> bytes:
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Audit Logs"
+# Rows are streamed, so widths cannot be measured from the data;
+# these fit the usual content of each column (capped at 50 as before)
+COLUMN_WIDTHS = {
+    "created_at": 28,
+    "username": 20,
+    "action": 30,
+    "target_username": 28,
+    "target_registration": 14,
+    "status": 12,
+    "ip_address": 16,
+    "message": 50,
+}
 
-        log_list = list(logs)
 
-        display_columns = [
-            "created_at",
-            "username",
-            "action",
-            "target_username",
-            "target_registration",
-            "status",
-            "ip_address",
-            "message"
-        ]
+class XLSXExporter(AuditLogExporter):
+    def export(self, logs: Iterable[dict[str, Any]]) -> bytes:
+        buffer = io.BytesIO()
+        self.export_stream(logs, buffer)
+        return buffer.getvalue()
 
-        if not log_list:
-            buffer = io.BytesIO()
-            wb.save(buffer)
-            buffer.seek(0)
-            return buffer.read()
+    def export_stream(  # noqa: PLR6301
+        self, logs: Iterable[dict[str, Any]], out: BinaryIO
+    ) -> None:
+        """Writes the workbook in openpyxl write-only mode.
 
-        friendly_headers = [COLUMN_HEADERS.get(col, col) for col in display_columns]
-        ws.append(friendly_headers)
+        Rows are flushed to disk as they are appended instead of being
+        kept as cell objects, so memory stays flat for large exports.
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Audit Logs")
 
         header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="2C3E50", end_color="2C3E50", fill_type="solid")
+        header_fill = PatternFill(
+            start_color="2C3E50", end_color="2C3E50", fill_type="solid"
+        )
         thin_border = Border(
             left=Side(style='thin'), right=Side(style='thin'),
             top=Side(style='thin'), bottom=Side(style='thin')
         )
 
-        for col_num in range(1, len(friendly_headers) + 1):
-            cell = ws.cell(row=1, column=col_num)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            cell.border = thin_border
+        for col_num, column in enumerate(DISPLAY_COLUMNS, 1):
+            ws.column_dimensions[get_column_letter(col_num)].width = (
+                COLUMN_WIDTHS[column]
+            )
+
+        rows = 0
+        for log in logs:
+            if rows == 0:
+                ws.freeze_panes = "A2"
+                header = []
+                for col in DISPLAY_COLUMNS:
+                    cell = WriteOnlyCell(
+                        ws, value=COLUMN_HEADERS.get(col, col)
+                    )
+                    cell.font = header_font
+                    cell.fill = header_fill
+                    cell.alignment = Alignment(
+                        horizontal="center", vertical="center"
+                    )
+                    cell.border = thin_border
+                    header.append(cell)
+                ws.append(header)
 
-        for log in log_list:
             row_data = [
                 str(log.get("created_at")),
                 log.get("username"),
@@ -63,31 +100,18 @@ class XLSXExporter(AuditLogExporter):
             ]
 
             sanitized_row = [
-                (f"'{str(val)}" if str(val).startswith(("=", "+", "-", "@")) else val)
+                (
+                    f"'{str(val)}"
+                    if str(val).startswith(("=", "+", "-", "@"))
+                    else val
+                )
                 for val in row_data
             ]
             ws.append(sanitized_row)
+            rows += 1
 
-        ws.auto_filter.ref = ws.dimensions
-        ws.freeze_panes = "A2"
-
-        for col_num, column in enumerate(ws.columns, 1):
-            max_length = 0
-            column_letter = get_column_letter(col_num)
+        if rows:
+            last_column = get_column_letter(len(DISPLAY_COLUMNS))
+            ws.auto_filter.ref = f"A1:{last_column}{rows + 1}"
 
-            for cell in column:
-                try:
-                    if cell.value:
-                        length = len(str(cell.value))
-                        if length > max_length:
-                            max_length = length
-                except:
-                    pass
-
-            adjusted_width = min(max(max_length + 2, 12), 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
-
-        buffer = io.BytesIO()
-        wb.save(buffer)
-        buffer.seek(0)
-        return buffer.read()
\ No newline at end of file
+        wb.save(out)
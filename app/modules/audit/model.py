@@ -1,16 +1,26 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Float, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.modules.shared import SqliteUUID
 from app.core import table_registry
+from app.modules.shared import SqliteDateTime, SqliteUUID
 
 
 @table_registry.mapped
 class AuditLog:
     __tablename__ = "audit_logs"
+    # Listing is newest first (created_at, id), optionally filtered by one
+    # of these columns, so each index serves both the filter and the sort
+    __table_args__ = (
+        Index("ix_audit_logs_created_at_id", "created_at", "id"),
+        Index("ix_audit_logs_action_created_at", "action", "created_at", "id"),
+        Index("ix_audit_logs_status_created_at", "status", "created_at", "id"),
+        Index(
+            "ix_audit_logs_username_created_at", "username", "created_at", "id"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     action: Mapped[str] = mapped_column(String, nullable=False)
@@ -32,6 +42,39 @@ class AuditLog:
     ip_address: Mapped[str | None]
     user_agent: Mapped[str | None]
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        SqliteDateTime(),
+        server_default=func.now(),
+    )
+
+
+@table_registry.mapped
+class AuditExportJob:
+    """A background audit log export.
+
+    Requests with the same format and filters share a job while it runs
+    or shortly after it finished (see filters_hash).
+    """
+
+    __tablename__ = "audit_export_jobs"
+
+    id: Mapped[UUID] = mapped_column(SqliteUUID(), primary_key=True)
+    format: Mapped[str] = mapped_column(String(10), nullable=False)
+    # JSON AuditLogListFilters the export was requested with
+    filters: Mapped[str] = mapped_column(Text, nullable=False)
+    # SHA-256 of format + filters, used to find identical requests
+    filters_hash: Mapped[str] = mapped_column(String(64), index=True)
+    filename: Mapped[str] = mapped_column(String(100), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    rows_written: Mapped[int] = mapped_column(Integer, default=0)
+    bytes_written: Mapped[int] = mapped_column(Integer, default=0)
+    duration: Mapped[float | None] = mapped_column(Float)
+    error: Mapped[str | None] = mapped_column(Text)
+
+    requested_by_id: Mapped[UUID | None] = mapped_column(SqliteUUID())
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
         server_default=func.now(),
     )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime)
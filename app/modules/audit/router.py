@@ -1,23 +1,29 @@
 from datetime import timedelta
-from uuid import uuid4
+from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
 from fastapi.responses import FileResponse
 
 from app.core.database import Db_session
-from .enums import AuditAction, AuditStatus
+from app.modules.users import Admin_user
+
+from .deps import Audit_log_list_filters
+from .enums import AuditAction, AuditExportStatus, AuditStatus
+from .export_pool import POOLED_FORMATS, ExportQueueFull, export_pool
 from .schemas import (
+    AuditExportJobResponse,
     AuditLogCreate,
-    ExportContext,
+    AuditLogExportedStatus,
     AuditLogList,
-    AuditLogExportedStatus
+    ExportContext,
 )
-from app.modules.users import Admin_user
-from .deps import Audit_log_list_filters
 from .service import (
+    abort_export_job,
     create_audit_log,
+    create_export_job,
     export_audit_logs_task,
     fetch_audit_logs,
+    fetch_export_job,
     safe_export_path,
 )
 
@@ -46,10 +52,13 @@ def list_logs(
     if filters.date_from and not filters.date_to:
         filters.date_to = filters.date_from + timedelta(days=1)
 
-    result = fetch_audit_logs(
-        session=session,
-        filters=filters
-    )
+    try:
+        result = fetch_audit_logs(
+            session=session,
+            filters=filters
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return result
 
@@ -80,39 +89,109 @@ def export_audit_logs_async(
     if context.filters.date_from and not context.filters.date_to:
         context.filters.date_to = context.filters.date_from + timedelta(days=1)
 
-    job_id = uuid4().hex
-    filename = f"audit_logs_{job_id}.{context.format}"
-
-    background_tasks.add_task(
-        export_audit_logs_task,
-        format=context.format,
-        filters=context.filters,
-        filename=filename,
+    job, reused = create_export_job(
+        session,
+        context=context,
+        requested_by_id=current_user.id,
     )
 
+    if not reused:
+        if context.format in POOLED_FORMATS and export_pool.enabled:
+            try:
+                export_pool.submit(job.id)
+            except ExportQueueFull:
+                abort_export_job(
+                    session,
+                    job.id,
+                    status=AuditExportStatus.FAILED,
+                    error="Export queue is full",
+                )
+                raise HTTPException(
+                    status_code=503,
+                    detail="Too many exports in progress, try again later",
+                    headers={"Retry-After": "30"},
+                )
+        else:
+            background_tasks.add_task(export_audit_logs_task, job_id=job.id)
+
     create_audit_log(
         session,
         AuditLogCreate(
             action=AuditAction.EXPORT_AUDIT_LOGS,
             status=AuditStatus.SUCCESS,
-            message=f"Audit log export started ({context.format} format)",
+            message=(
+                f"Audit log export reused ({context.format} format)"
+                if reused else
+                f"Audit log export started ({context.format} format)"
+            ),
             user_id=current_user.id,
             username=current_user.username,
-            resource=filename,
+            resource=job.filename,
             ip_address=request.client.host if request.client else None,
             user_agent=request.headers.get("user-agent")
         ),
     )
 
     return AuditLogExportedStatus(
-        job_id=job_id,
-        status="processing",
+        job_id=job.id.hex,
+        status=job.status,
         format=context.format,
-        download_url=f"/logs/export/{filename}",
+        download_url=f"/logs/export/{job.filename}",
+        status_url=f"/logs/export/jobs/{job.id.hex}",
+        reused=reused,
         message='''Export is being processed.
-        Check download_url in a few moments.'''
+        Check status_url until it succeeds, then use download_url.'''
+    )
+
+
+@router.get("/export/jobs/{job_id}")
+def get_export_job(
+    job_id: UUID,
+    session: Db_session,
+    _: Admin_user,
+) -> AuditExportJobResponse:
+    job = fetch_export_job(session, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Export job not found")
+
+    return job
+
+
+@router.delete("/export/jobs/{job_id}")
+def cancel_export_job(
+    job_id: UUID,
+    session: Db_session,
+    current_user: Admin_user,
+    request: Request,
+) -> AuditExportJobResponse:
+    job = fetch_export_job(session, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Export job not found")
+
+    if not abort_export_job(session, job_id):
+        raise HTTPException(
+            status_code=409,
+            detail=f"Export job already {job.status}"
+        )
+
+    export_pool.cancel(job_id)
+
+    create_audit_log(
+        session,
+        AuditLogCreate(
+            action=AuditAction.EXPORT_AUDIT_LOGS,
+            status=AuditStatus.SUCCESS,
+            message=f"Audit log export cancelled ({job.format} format)",
+            user_id=current_user.id,
+            username=current_user.username,
+            resource=job.filename,
+            ip_address=request.client.host if request.client else None,
+            user_agent=request.headers.get("user-agent")
+        ),
     )
 
+    return fetch_export_job(session, job_id)
+
 
 @router.get("/export/{filename}")
 def download_export(
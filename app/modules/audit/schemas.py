@@ -29,6 +29,12 @@ class AuditLogListFilters(BaseModel):
     date_to: datetime | None = None
     page: int = 1
     limit: int = 100
+    # Opaque next_cursor of the previous page; switches to keyset paging,
+    # where `page` is ignored. Use "" to request the first page.
+    cursor: str | None = None
+    # exact: count on every request; cached: reuse a recent count of the
+    # same filters; none: skip counting (total and pages are null)
+    count: Literal["exact", "cached", "none"] = "exact"
 
 
 class ExportContext(BaseModel):
@@ -41,7 +47,8 @@ class AuditLogList(BaseModel):
     total: int | None
     page: int
     limit: int
-    pages: int
+    pages: int | None
+    next_cursor: str | None = None
 
 
 class AuditLogExportedStatus(BaseModel):
@@ -49,4 +56,21 @@ class AuditLogExportedStatus(BaseModel):
     status: str
     format: Literal["csv", "jsonl", "pdf", "xlsx"]
     download_url: str
+    status_url: str
+    reused: bool = False
     message: str
+
+
+class AuditExportJobResponse(BaseModel):
+    job_id: str
+    status: str
+    format: str
+    filename: str
+    download_url: str | None = None
+    rows_written: int
+    bytes_written: int
+    duration: float | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
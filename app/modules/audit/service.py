@@ -1,127 +1,602 @@
+import base64
+import hashlib
+import json
+import os
 import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from logging import getLogger
 from pathlib import Path
+from typing import Iterable, Iterator
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, func
+from sqlalchemy import Select, and_, func, literal, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from logging import getLogger
 
-from app.modules.audit.model import AuditLog
-from app.modules.audit.exporters import CSVExporter, JSONLExporter, PDFExporter, XLSXExporter
-from app.core.database import SessionLocal
-from .schemas import AuditLogCreate, AuditLogListFilters, AuditLogList
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import (
+    SessionLocal,
+    commit_or_stage,
+    commit_or_stage_async,
+)
+from app.modules.audit.exporters import (
+    CSVExporter,
+    JSONLExporter,
+    PDFExporter,
+    XLSXExporter,
+)
+from app.modules.audit.model import AuditExportJob, AuditLog
+
+from .enums import AuditExportStatus
 from .exporters.serializer import audit_log_to_dict
+from .schemas import (
+    AuditExportJobResponse,
+    AuditLogCreate,
+    AuditLogList,
+    AuditLogListFilters,
+    ExportContext,
+)
+from .writer import audit_writer
 
 logger = getLogger(__name__)
 
 EXPORT_DIR = Path("exports")
 EXPORT_DIR.mkdir(exist_ok=True)
 FILENAME_RE = re.compile(r"^[a-zA-Z0-9._-]+$")
+EXPORT_BATCH_SIZE = 1000
+
+# Fields that select a page rather than which logs match
+PAGINATION_FIELDS = {"page", "limit", "cursor", "count"}
+
+_export_job_lock = threading.Lock()
+_count_cache: TTLCache[str, int] = TTLCache(
+    ttl=settings.AUDIT_LOG_COUNT_CACHE_TTL,
+    maxsize=256,
+)
 
 
 def create_audit_log(
     db: Session,
-    data: AuditLogCreate
+    data: AuditLogCreate,
+    *,
+    durable: bool | None = None,
 ):
-    log = AuditLog(**data.model_dump())
+    """Records an audit log.
 
-    db.add(log)
-    db.commit()
+    Durable logs are committed before returning, or staged until the end
+    of the caller's unit_of_work if one is open. Others are handed to
+    audit_writer and inserted with the next batch; if the writer is not
+    running or its queue is full they are committed here as well, which
+    also slows down callers while the writer catches up.
 
+    Args:
+        db (Session): Database session; committed on synchronous writes.
+        data (AuditLogCreate): Log to record.
+        durable (bool | None): Force or skip the synchronous write. By
+            default only the actions in AUDIT_ASYNC_ACTIONS are batched.
+    """
+    values = _audit_log_values(data)
 
-def fetch_audit_logs(
-    session: Session,
+    if not _is_durable(data, durable) and audit_writer.submit(values):
+        return
+
+    db.add(AuditLog(**values))
+    commit_or_stage(db)
+
+
+async def create_audit_log_async(
+    db: AsyncSession,
+    data: AuditLogCreate,
     *,
-    filters: AuditLogListFilters
-) -> AuditLogList:
-    offset = (filters.page - 1) * filters.limit
+    durable: bool | None = None,
+):
+    """Async variant of create_audit_log, for handlers on the event loop.
+
+    Args:
+        db (AsyncSession): Database session; committed on synchronous writes.
+        data (AuditLogCreate): Log to record.
+        durable (bool | None): Force or skip the synchronous write.
+    """
+    values = _audit_log_values(data)
+
+    if not _is_durable(data, durable) and audit_writer.submit(values):
+        return
+
+    db.add(AuditLog(**values))
+    await commit_or_stage_async(db)
+
+
+def _is_durable(data: AuditLogCreate, durable: bool | None) -> bool:
+    if durable is None:
+        return data.action not in settings.AUDIT_ASYNC_ACTIONS
+    return durable
 
-    base_stmt = select(AuditLog)
 
+def _audit_log_values(data: AuditLogCreate) -> dict:
+    # Set now, since a batched log is only inserted later
+    return {**data.model_dump(), "created_at": datetime.now(timezone.utc)}
+
+
+def _apply_filters(stmt: Select, filters: AuditLogListFilters) -> Select:
     if filters.action:
-        base_stmt = base_stmt.where(AuditLog.action == filters.action)
+        stmt = stmt.where(AuditLog.action == filters.action)
 
     if filters.username:
-        base_stmt = base_stmt.where(AuditLog.username == filters.username)
+        stmt = stmt.where(AuditLog.username == filters.username)
 
     if filters.status:
-        base_stmt = base_stmt.where(AuditLog.status == filters.status)
+        stmt = stmt.where(AuditLog.status == filters.status)
 
     if filters.date_from:
-        base_stmt = base_stmt.where(AuditLog.created_at >= filters.date_from)
+        stmt = stmt.where(AuditLog.created_at >= filters.date_from)
 
     if filters.date_to:
-        base_stmt = base_stmt.where(AuditLog.created_at <= filters.date_to)
+        stmt = stmt.where(AuditLog.created_at <= filters.date_to)
+
+    return stmt
+
+
+def _filters_key(filters: AuditLogListFilters) -> dict:
+    return filters.model_dump(mode="json", exclude=PAGINATION_FIELDS)
+
+
+def _encode_cursor(log: AuditLog) -> str:
+    payload = json.dumps([log.created_at.isoformat(), log.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, log_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), int(log_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _older_than(created_at: datetime, log_id: int):
+    """Keyset condition for the logs listed after (created_at, log_id)."""
+    return tuple_(AuditLog.created_at, AuditLog.id) < tuple_(
+        literal(created_at, AuditLog.created_at.type),
+        literal(log_id, AuditLog.id.type),
+    )
+
+
+def _count_audit_logs(
+    session: Session,
+    base_stmt: Select,
+    filters: AuditLogListFilters,
+) -> int | None:
+    if filters.count == "none":
+        return None
+
+    key = json.dumps(_filters_key(filters), sort_keys=True)
+    if filters.count == "cached":
+        total = _count_cache.get(key)
+        if total is not None:
+            return total
 
     count_stmt = select(func.count()).select_from(base_stmt.subquery())
     total = session.execute(count_stmt).scalar() or 0
+    _count_cache.set(key, total)
+    return total
 
-    stmt = (
-        base_stmt
-        .order_by(AuditLog.created_at.desc())
-        .offset(offset)
-        .limit(filters.limit)
-    )
 
-    logs = session.execute(stmt).scalars().all()
+def fetch_audit_logs(
+    session: Session,
+    *,
+    filters: AuditLogListFilters
+) -> AuditLogList:
+    """Lists audit logs, newest first.
+
+    Pages are selected by OFFSET from `page`, or, when `cursor` is set,
+    by seeking past the last (created_at, id) of the previous page, which
+    costs the same on every page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    base_stmt = _apply_filters(select(AuditLog), filters)
+    total = _count_audit_logs(session, base_stmt, filters)
+
+    stmt = base_stmt.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+    next_cursor = None
+
+    if filters.cursor is not None:
+        if filters.cursor:
+            created_at, log_id = _decode_cursor(filters.cursor)
+            stmt = stmt.where(_older_than(created_at, log_id))
+
+        # One extra row tells whether there is a next page
+        logs = session.execute(stmt.limit(filters.limit + 1)).scalars().all()
+        if len(logs) > filters.limit:
+            logs = logs[:filters.limit]
+            next_cursor = _encode_cursor(logs[-1])
+    else:
+        offset = (filters.page - 1) * filters.limit
+        logs = session.execute(
+            stmt.offset(offset).limit(filters.limit)
+        ).scalars().all()
 
     return AuditLogList(
         items=[audit_log_to_dict(log) for log in logs],
         total=total,
         page=filters.page,
         limit=filters.limit,
-        pages=(total // filters.limit) + (1 if total % filters.limit else 0)
+        pages=(
+            (total // filters.limit) + (1 if total % filters.limit else 0)
+            if total is not None else None
+        ),
+        next_cursor=next_cursor,
     )
 
 
 def fetch_all_logs_for_export(session: Session, filters: AuditLogListFilters):
-    base_stmt = select(AuditLog)
+    return list(iter_logs_for_export(session, filters))
 
-    if filters.action:
-        base_stmt = base_stmt.where(AuditLog.action == filters.action)
 
-    if filters.username:
-        base_stmt = base_stmt.where(AuditLog.username == filters.username)
+def iter_logs_for_export(
+    session: Session,
+    filters: AuditLogListFilters,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[dict]:
+    """Yields the filtered audit logs, newest first, as export rows.
+
+    Only the columns are selected (no ORM instances enter the identity
+    map) and rows are read `batch_size` at a time with keyset pagination
+    on (created_at, id). Memory does not grow with the number of logs,
+    and no cursor stays open between batches, so a long export does not
+    hold a read lock on SQLite while the API writes.
+
+    Args:
+        session (Session): Database session.
+        filters (AuditLogListFilters): Filters of the export.
+        batch_size (int): Rows fetched per query.
+
+    Yields:
+        dict: Log serialized by audit_log_to_dict.
+    """
+    base_stmt = (
+        _apply_filters(select(*AuditLog.__table__.columns), filters)
+        .order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+        .limit(batch_size)
+    )
 
-    if filters.status:
-        base_stmt = base_stmt.where(AuditLog.status == filters.status)
+    stmt = base_stmt
+    while True:
+        rows = session.execute(stmt).all()
+        for row in rows:
+            yield audit_log_to_dict(row)
 
-    if filters.date_from:
-        base_stmt = base_stmt.where(AuditLog.created_at >= filters.date_from)
+        if len(rows) < batch_size:
+            return
 
-    if filters.date_to:
-        base_stmt = base_stmt.where(AuditLog.created_at <= filters.date_to)
+        stmt = base_stmt.where(_older_than(rows[-1].created_at, rows[-1].id))
+
+
+def export_filters_hash(format: str, filters: AuditLogListFilters) -> str:
+    """Identifies an export by its format and filters.
 
-    logs = session.execute(
-        base_stmt.order_by(AuditLog.created_at.desc())
-    ).scalars().all()
+    Pagination fields are ignored, since exports are never paginated.
+    """
+    payload = json.dumps(
+        {"format": format, "filters": _filters_key(filters)},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
-    return [audit_log_to_dict(log) for log in logs]
 
+def _find_reusable_export_job(
+    session: Session, filters_hash: str
+) -> AuditExportJob | None:
+    now = _utcnow()
+    stmt = (
+        select(AuditExportJob)
+        .where(AuditExportJob.filters_hash == filters_hash)
+        .where(or_(
+            and_(
+                AuditExportJob.status.in_(
+                    [AuditExportStatus.PENDING, AuditExportStatus.RUNNING]
+                ),
+                AuditExportJob.created_at >= now - timedelta(
+                    seconds=settings.AUDIT_EXPORT_JOB_TIMEOUT
+                ),
+            ),
+            and_(
+                AuditExportJob.status == AuditExportStatus.SUCCEEDED,
+                AuditExportJob.finished_at >= now - timedelta(
+                    seconds=settings.AUDIT_EXPORT_REUSE_WINDOW
+                ),
+            ),
+        ))
+        .order_by(AuditExportJob.created_at.desc())
+    )
+
+    for job in session.execute(stmt).scalars():
+        if (
+            job.status != AuditExportStatus.SUCCEEDED
+            or (EXPORT_DIR / job.filename).is_file()
+        ):
+            return job
 
-def export_audit_logs_task(
+    return None
+
+
+def create_export_job(
+    session: Session,
     *,
-    format: str,
-    filters: AuditLogListFilters,
-    filename: str,
-):
-    session = SessionLocal()
+    context: ExportContext,
+    requested_by_id: UUID | None,
+) -> tuple[AuditExportJob, bool]:
+    """Registers an export, or returns an identical one to share.
+
+    A job with the same format and filters is reused while it is pending
+    or running, and for AUDIT_EXPORT_REUSE_WINDOW seconds after it
+    succeeded, so repeated requests do not scan the audit table again.
+
+    Args:
+        session (Session): Database session.
+        context (ExportContext): Requested format and filters.
+        requested_by_id (UUID | None): User requesting the export.
+
+    Returns:
+        tuple[AuditExportJob, bool]: The job, and whether it was reused
+        (if not, the caller must schedule export_audit_logs_task).
+    """
+    filters_hash = export_filters_hash(context.format, context.filters)
+
+    # Serializes lookup and insert so simultaneous requests of this
+    # process cannot both miss and start the same export
+    with _export_job_lock:
+        job = _find_reusable_export_job(session, filters_hash)
+        if job is not None:
+            return job, True
+
+        job_id = uuid4()
+        job = AuditExportJob(
+            id=job_id,
+            format=context.format,
+            filters=context.filters.model_dump_json(),
+            filters_hash=filters_hash,
+            filename=f"audit_logs_{job_id.hex}.{context.format}",
+            status=AuditExportStatus.PENDING,
+            rows_written=0,
+            bytes_written=0,
+            requested_by_id=requested_by_id,
+        )
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+
+    return job, False
+
+
+def to_export_job_response(job: AuditExportJob) -> AuditExportJobResponse:
+    """Converts an export job to its API schema."""
+    return AuditExportJobResponse(
+        job_id=job.id.hex,
+        status=job.status,
+        format=job.format,
+        filename=job.filename,
+        download_url=(
+            f"/logs/export/{job.filename}"
+            if job.status == AuditExportStatus.SUCCEEDED else None
+        ),
+        rows_written=job.rows_written,
+        bytes_written=job.bytes_written,
+        duration=job.duration,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+def fetch_export_job(
+    session: Session, job_id: UUID
+) -> AuditExportJobResponse | None:
+    job = session.get(AuditExportJob, job_id)
+    return to_export_job_response(job) if job else None
+
+
+def _update_export_job(
+    session: Session,
+    job_id: UUID,
+    expected: Iterable[AuditExportStatus],
+    **values,
+) -> bool:
+    """Updates a job only if it is still in one of the expected states.
+
+    Every state change goes through here, so a cancellation racing with
+    the export always has a single winner.
+    """
+    result = session.execute(
+        update(AuditExportJob)
+        .where(AuditExportJob.id == job_id)
+        .where(AuditExportJob.status.in_(list(expected)))
+        .values(**values)
+    )
+    session.commit()
+    return result.rowcount == 1
+
+
+def abort_export_job(
+    session: Session,
+    job_id: UUID,
+    *,
+    status: AuditExportStatus = AuditExportStatus.CANCELLED,
+    error: str | None = None,
+) -> bool:
+    """Stops a pending or running export.
+
+    A running export notices it at its next progress update, discards
+    its partial file and exits.
+
+    Args:
+        session (Session): Database session.
+        job_id (UUID): Export job.
+        status (AuditExportStatus): Final status to record.
+        error (str | None): Reason stored on the job.
+
+    Returns:
+        bool: False if the job does not exist or already finished.
+    """
+    return _update_export_job(
+        session,
+        job_id,
+        [AuditExportStatus.PENDING, AuditExportStatus.RUNNING],
+        status=status,
+        error=error,
+        finished_at=_utcnow(),
+    )
+
+
+class ExportCancelled(Exception):
+    """The job of a running export was cancelled."""
+
+
+class _ExportProgress:
+    """Counts exported rows and stores the count every batch.
+
+    Storing the count doubles as a cancellation check: the update only
+    applies while the job is still running.
+    """
+
+    def __init__(self, session: Session, job_id: UUID):
+        self.session = session
+        self.job_id = job_id
+        self.count = 0
+
+    def track(self, rows: Iterable[dict]) -> Iterator[dict]:
+        for row in rows:
+            yield row
+            self.count += 1
+            if self.count % EXPORT_BATCH_SIZE == 0 and not _update_export_job(
+                self.session,
+                self.job_id,
+                [AuditExportStatus.RUNNING],
+                rows_written=self.count,
+            ):
+                raise ExportCancelled()
+
+
+def _write_export(
+    session: Session, job_id: UUID, progress: _ExportProgress
+) -> tuple[str, Path]:
+    """Writes an export under a temporary name.
+
+    The file is renamed when complete, so a download never sees a
+    partial file.
+
+    Returns:
+        tuple[str, Path]: The temporary file and the path to publish it
+            under.
+    """
+    job = session.get(AuditExportJob, job_id)
+    filters = AuditLogListFilters.model_validate_json(job.filters)
+    exporter = {
+        "csv": CSVExporter(),
+        "jsonl": JSONLExporter(),
+        "pdf": PDFExporter(),
+        "xlsx": XLSXExporter(),
+    }[job.format]
+
+    fd, tmp_name = tempfile.mkstemp(dir=EXPORT_DIR, suffix=".part")
     try:
-        logs = fetch_all_logs_for_export(session, filters)
+        with os.fdopen(fd, "wb") as tmp:
+            exporter.export_stream(
+                progress.track(iter_logs_for_export(session, filters)), tmp
+            )
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
-        exporter = {
-            "csv": CSVExporter(),
-            "jsonl": JSONLExporter(),
-            "pdf": PDFExporter(),
-            "xlsx": XLSXExporter(),
-        }[format]
+    return tmp_name, EXPORT_DIR / job.filename
+
+
+def _run_export(session: Session, job_id: UUID) -> None:
+    started = time.monotonic()
+    progress = _ExportProgress(session, job_id)
+
+    def fail(phase: str, e: Exception) -> None:
+        session.rollback()
+        logger.error(f"EXPORT ERROR ({phase}): {e}")
+        _update_export_job(
+            session,
+            job_id,
+            [AuditExportStatus.RUNNING],
+            status=AuditExportStatus.FAILED,
+            error=str(e) or type(e).__name__,
+            rows_written=progress.count,
+            duration=round(time.monotonic() - started, 3),
+            finished_at=_utcnow(),
+        )
+
+    if not _update_export_job(
+        session,
+        job_id,
+        [AuditExportStatus.PENDING],
+        status=AuditExportStatus.RUNNING,
+        started_at=_utcnow(),
+    ):
+        logger.info(f"Export {job_id} is no longer pending, skipped")
+        return
 
-        data = exporter.export(logs)
+    try:
+        tmp_name, file_path = _write_export(session, job_id, progress)
+    except ExportCancelled:
+        logger.info(f"Export {job_id} cancelled")
+        return
+    except Exception as e:
+        fail("write", e)
+        return
 
-        file_path = EXPORT_DIR / filename
-        file_path.write_bytes(data)
+    try:
+        os.replace(tmp_name, file_path)
+    except OSError as e:
+        Path(tmp_name).unlink(missing_ok=True)
+        fail("rename", e)
+        return
+
+    try:
+        succeeded = _update_export_job(
+            session,
+            job_id,
+            [AuditExportStatus.RUNNING],
+            status=AuditExportStatus.SUCCEEDED,
+            rows_written=progress.count,
+            bytes_written=file_path.stat().st_size,
+            duration=round(time.monotonic() - started, 3),
+            finished_at=_utcnow(),
+        )
+    except Exception as e:
+        file_path.unlink(missing_ok=True)
+        fail("status update", e)
+        return
+
+    if not succeeded:
+        file_path.unlink(missing_ok=True)
+        logger.info(f"Export {job_id} cancelled")
+
+
+def export_audit_logs_task(*, job_id: UUID):
+    """Runs an export job and records its outcome on the job.
+
+    Called from BackgroundTasks, or in a worker process of export_pool
+    for CPU-bound formats, so it only relies on the job id.
+    """
+    session = SessionLocal()
+    try:
+        _run_export(session, job_id)
     except Exception as e:
         logger.error(f"EXPORT ERROR: {e}")
-        raise
     finally:
         session.close()
 
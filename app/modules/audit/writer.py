@@ -0,0 +1,178 @@
+import logging
+import queue
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+
+from .model import AuditLog
+
+logger = logging.getLogger(__name__)
+
+_STOP: Any = object()
+# Attempts to insert a batch before its logs are dropped
+MAX_ATTEMPTS = 3
+
+
+class AuditLogWriter:
+    """Writes audit logs in batches from a background thread.
+
+    Logs submitted to the writer are kept in a bounded in-memory queue
+    and inserted with a single INSERT and commit per batch, when
+    batch_size logs are waiting or flush_interval seconds after the first
+    one arrived. Queued logs are lost if the process is killed, so only
+    actions whose loss is acceptable should go through here (see
+    create_audit_log); the rest are still written synchronously.
+
+    Args:
+        batch_size (int): Maximum logs inserted per transaction.
+        flush_interval (float): Maximum seconds a log waits in the queue.
+        max_queue (int): Logs held in memory; when full, submit() refuses
+            new logs so the caller writes them itself.
+    """
+
+    def __init__(
+        self, *, batch_size: int, flush_interval: float, max_queue: int
+    ):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_queue))
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+        self.rejected = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts the writer thread."""
+        with self._lock:
+            if self.running:
+                return
+
+            self._thread = threading.Thread(
+                target=self._run, name="audit-log-writer", daemon=True
+            )
+            self._thread.start()
+
+        logger.info("Audit log writer started")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Writes the queued logs and stops the thread."""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+
+            self._queue.put(_STOP)
+            thread.join(timeout)
+            self._thread = None
+
+        if thread.is_alive():
+            logger.error(
+                f"Audit log writer did not flush within {timeout}s, "
+                f"{self._queue.qsize()} log(s) lost"
+            )
+        else:
+            logger.info(f"Audit log writer stopped: {self.stats()}")
+
+    def submit(self, values: dict) -> bool:
+        """Queues a log for the next batch.
+
+        Args:
+            values (dict): AuditLog column values, including created_at.
+
+        Returns:
+            bool: False if the writer is not running or its queue is full;
+            the caller must then write the log itself.
+        """
+        if not self.running:
+            return False
+
+        try:
+            self._queue.put_nowait(values)
+        except queue.Full:
+            self.rejected += 1
+            return False
+
+        return True
+
+    def stats(self) -> dict[str, int]:
+        """Returns the queue size and the written/dropped/rejected counters."""
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "rejected": self.rejected,
+        }
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._write(batch)
+
+        # Logs submitted while stopping
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                batch.append(item)
+        for start in range(0, len(batch), self.batch_size):
+            self._write(batch[start:start + self.batch_size])
+
+    def _write(self, batch: list[dict]) -> None:
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            session = SessionLocal()
+            try:
+                session.execute(insert(AuditLog), batch)
+                session.commit()
+                self.written += len(batch)
+                return
+            except Exception as e:
+                session.rollback()
+                logger.error(
+                    f"Audit log batch of {len(batch)} failed "
+                    f"(attempt {attempt}/{MAX_ATTEMPTS}): {e}"
+                )
+            finally:
+                session.close()
+
+            time.sleep(0.5 * attempt)
+
+        self.dropped += len(batch)
+        logger.error(f"Dropped {len(batch)} audit log(s): {batch}")
+
+
+audit_writer = AuditLogWriter(
+    batch_size=settings.AUDIT_WRITER_BATCH_SIZE,
+    flush_interval=settings.AUDIT_WRITER_FLUSH_INTERVAL,
+    max_queue=settings.AUDIT_WRITER_MAX_QUEUE,
+)
@@ -9,3 +9,13 @@ class OffboardingSystem(StrEnum):
     EQUIPMENT = "Equipamentos"
     ACCESS = "Acesso"
     IFS = "IFS"
+
+
+class OffboardingJobStatus(StrEnum):
+    """Lifecycle of a queued offboarding job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    PARTIAL = "partial"
+    FAILED = "failed"
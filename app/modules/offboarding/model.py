@@ -1,9 +1,11 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, String, func
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..users.model import SqliteUUID, table_registry
+from .enums import OffboardingJobStatus
 
 
 @table_registry.mapped_as_dataclass
@@ -40,7 +42,8 @@ class RevokedAccess:
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
     offboarding_id: Mapped[int] = mapped_column(
         ForeignKey("offboarding_records.id", ondelete="CASCADE"),
-        index=True
+        index=True,
+        init=False,
     )
 
     system_name: Mapped[str] = mapped_column(String(100))
@@ -52,3 +55,58 @@ class RevokedAccess:
     offboarding: Mapped["OffboardingRecord"] = relationship(
         back_populates="revoked_accesses", init=False
     )
+
+
+@table_registry.mapped_as_dataclass
+class OffboardingJob:
+    """An offboarding queued for the background workers.
+
+    Progress is stored per step, so a job picked up again after a restart
+    only runs the steps that have not completed yet.
+    """
+
+    __tablename__ = "offboarding_jobs"
+
+    registration: Mapped[str] = mapped_column(String(50), index=True)
+    requested_by_id: Mapped[uuid.UUID] = mapped_column(
+        SqliteUUID, ForeignKey("users.id")
+    )
+    ip_address: Mapped[str | None] = mapped_column(String(100))
+    user_agent: Mapped[str | None] = mapped_column(String(255))
+    target_username: Mapped[str | None] = mapped_column(
+        String(100), default=None
+    )
+
+    status: Mapped[str] = mapped_column(
+        String(20), default=OffboardingJobStatus.QUEUED, index=True
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    # JSON list of the systems already revoked by earlier attempts
+    completed_steps: Mapped[str] = mapped_column(Text, default="[]")
+    # JSON list of GeneratedTerm produced so far
+    terms: Mapped[str] = mapped_column(Text, default="[]")
+    # JSON OffboardingResult, set when the job finishes
+    result: Mapped[str | None] = mapped_column(Text, default=None)
+    error: Mapped[str | None] = mapped_column(Text, default=None)
+
+    next_attempt_at: Mapped[datetime | None] = mapped_column(
+        DateTime, default=None, index=True
+    )
+    locked_by: Mapped[str | None] = mapped_column(String(100), default=None)
+    locked_at: Mapped[datetime | None] = mapped_column(DateTime, default=None)
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime, default=None
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, init=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, init=False, server_default=func.now(), onupdate=func.now()
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        SqliteUUID(),
+        primary_key=True,
+        default_factory=uuid.uuid4,
+    )
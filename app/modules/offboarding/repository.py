@@ -1,8 +1,22 @@
-from sqlalchemy import select, func
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Select, and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from .model import OffboardingRecord, RevokedAccess
-from .schemas import OffboardingContext, OffboardingHistoryItem, OffboardingHistoryResponse
+from app.core.database import commit_or_stage, commit_or_stage_async
+
+from .enums import OffboardingJobStatus
+from .model import OffboardingJob, OffboardingRecord, RevokedAccess
+from .schemas import (
+    OffboardingContext,
+    OffboardingHistoryItem,
+    OffboardingHistoryResponse,
+    OffboardingJobResponse,
+    OffboardingResult,
+)
 
 
 def create_offboarding_record(
@@ -11,6 +25,8 @@ def create_offboarding_record(
 ) -> OffboardingRecord:
     """Creates an offboarding record and its associated revoked access entries.
 
+    Inside a unit_of_work the rows are only staged and committed with it.
+
     Args:
         session (Session): Active SQLAlchemy database session.
         context (OffboardingContext): Data describing the offboarding operation.
@@ -24,16 +40,43 @@ def create_offboarding_record(
         registration=context.registration,
         performed_by_username=context.performed_by,
     )
+    # Linked through the relationship, so record.id is not needed before
+    # the rows are written
+    record.revoked_accesses.extend(
+        RevokedAccess(system_name=system) for system in context.systems
+    )
     session.add(record)
-    session.flush()
 
-    for system in context.systems:
-        session.add(
-            RevokedAccess(offboarding_id=record.id, system_name=system)
-        )
+    commit_or_stage(session)
+    return record
 
-    session.commit()
-    session.refresh(record)
+
+async def create_offboarding_record_async(
+    session: AsyncSession,
+    context: OffboardingContext,
+) -> OffboardingRecord:
+    """Async variant of create_offboarding_record.
+
+    Args:
+        session (AsyncSession): Active async database session.
+        context (OffboardingContext): Data describing the offboarding
+            operation.
+
+    Returns:
+        OffboardingRecord: The persisted offboarding record.
+    """
+    record = OffboardingRecord(
+        user_id=context.user_id,
+        username=context.username,
+        registration=context.registration,
+        performed_by_username=context.performed_by,
+    )
+    record.revoked_accesses.extend(
+        RevokedAccess(system_name=system) for system in context.systems
+    )
+    session.add(record)
+
+    await commit_or_stage_async(session)
     return record
 
 
@@ -55,6 +98,53 @@ def get_offboarding_history(
     Returns:
         OffboardingHistoryResponse: Paginated list of offboarding records.
     """
+    stmt = _history_query(registration)
+
+    total = session.execute(
+        select(func.count()).select_from(stmt.subquery())
+    ).scalar_one()
+
+    records = session.execute(
+        stmt.offset((page - 1) * limit).limit(limit)
+    ).scalars().all()
+
+    return _to_history_response(records, total=total, page=page, limit=limit)
+
+
+async def get_offboarding_history_async(
+    session: AsyncSession,
+    *,
+    registration: str | None = None,
+    page: int = 1,
+    limit: int = 20,
+) -> OffboardingHistoryResponse:
+    """Async variant of get_offboarding_history.
+
+    Args:
+        session (AsyncSession): Active async database session.
+        registration (str | None): Employee registration number to filter by.
+        page (int): Page number, starting at 1.
+        limit (int): Maximum number of records per page.
+
+    Returns:
+        OffboardingHistoryResponse: Paginated list of offboarding records.
+    """
+    stmt = _history_query(registration)
+
+    total = (await session.execute(
+        select(func.count()).select_from(stmt.subquery())
+    )).scalar_one()
+
+    # revoked_accesses is loaded by selectin within this await, so the
+    # conversion below does no further I/O
+    records = (await session.execute(
+        stmt.offset((page - 1) * limit).limit(limit)
+    )).scalars().all()
+
+    return _to_history_response(records, total=total, page=page, limit=limit)
+
+
+def _history_query(registration: str | None) -> Select:
     stmt = (
         select(OffboardingRecord)
         .order_by(OffboardingRecord.offboarded_at.desc())
@@ -63,14 +153,12 @@ def get_offboarding_history(
     if registration:
         stmt = stmt.where(OffboardingRecord.registration == registration)
 
-    total = session.execute(
-        select(func.count()).select_from(stmt.subquery())
-    ).scalar_one()
+    return stmt
 
-    records = session.execute(
-        stmt.offset((page - 1) * limit).limit(limit)
-    ).scalars().all()
 
+def _to_history_response(
+    records, *, total: int, page: int, limit: int
+) -> OffboardingHistoryResponse:
     return OffboardingHistoryResponse(
         items=[_to_history_item(r) for r in records],
         total=total,
@@ -96,3 +184,258 @@ def _to_history_item(record: OffboardingRecord) -> OffboardingHistoryItem:
         performed_by=record.performed_by_username,
         revoked_systems=[a.system_name for a in record.revoked_accesses],
     )
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def create_offboarding_job(
+    session: Session,
+    *,
+    registration: str,
+    requested_by_id: uuid.UUID,
+    ip_address: str | None,
+    user_agent: str | None,
+) -> OffboardingJob:
+    """Queues an offboarding job for the background workers.
+
+    Args:
+        session (Session): Active SQLAlchemy database session.
+        registration (str): Employee registration number to offboard.
+        requested_by_id (uuid.UUID): User who requested the offboarding.
+        ip_address (str | None): Client IP kept for the audit trail.
+        user_agent (str | None): Client user agent kept for the audit trail.
+
+    Returns:
+        OffboardingJob: The persisted job.
+    """
+    job = OffboardingJob(
+        registration=registration,
+        requested_by_id=requested_by_id,
+        ip_address=ip_address,
+        user_agent=user_agent,
+    )
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+    return job
+
+
+def get_offboarding_job(
+    session: Session, job_id: uuid.UUID
+) -> OffboardingJob | None:
+    """Loads a job by id.
+
+    Args:
+        session (Session): Active SQLAlchemy database session.
+        job_id (uuid.UUID): Job identifier.
+
+    Returns:
+        OffboardingJob | None: The job, or None if it does not exist.
+    """
+    return session.get(OffboardingJob, job_id)
+
+
+def claim_offboarding_job(
+    session: Session,
+    *,
+    worker_id: str,
+    lease: float,
+) -> OffboardingJob | None:
+    """Takes the oldest runnable job for a worker.
+
+    A job is runnable when it is queued and its retry time has passed, or
+    when it is running but its lease expired (the worker that held it
+    died). The claim is a conditional UPDATE, so two workers never get the
+    same job.
+
+    Args:
+        session (Session): Active SQLAlchemy database session.
+        worker_id (str): Identifier of the claiming worker.
+        lease (float): Seconds a claim stays valid without a heartbeat.
+
+    Returns:
+        OffboardingJob | None: The claimed job, or None if none is runnable.
+    """
+    now = _utcnow()
+    runnable = or_(
+        and_(
+            OffboardingJob.status == OffboardingJobStatus.QUEUED,
+            or_(
+                OffboardingJob.next_attempt_at.is_(None),
+                OffboardingJob.next_attempt_at <= now,
+            ),
+        ),
+        and_(
+            OffboardingJob.status == OffboardingJobStatus.RUNNING,
+            OffboardingJob.locked_at < now - timedelta(seconds=lease),
+        ),
+    )
+
+    candidates = session.scalars(
+        select(OffboardingJob.id)
+        .where(runnable)
+        .order_by(OffboardingJob.created_at)
+        .limit(5)
+    ).all()
+
+    for job_id in candidates:
+        claimed = session.execute(
+            update(OffboardingJob)
+            .where(OffboardingJob.id == job_id, runnable)
+            .values(
+                status=OffboardingJobStatus.RUNNING,
+                locked_by=worker_id,
+                locked_at=now,
+                attempts=OffboardingJob.attempts + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+
+        if claimed.rowcount == 1:
+            return session.get(
+                OffboardingJob, job_id, populate_existing=True
+            )
+
+    return None
+
+
+def renew_offboarding_job_lease(
+    session: Session, job_id: uuid.UUID, worker_id: str, *, attempt: int
+) -> bool:
+    """Extends a worker's claim on a running job.
+
+    Every claim increments the job's attempts, so a job finished or
+    requeued by this attempt is told apart from one taken over by
+    another worker after the lease expired.
+
+    Args:
+        session (Session): Active SQLAlchemy database session.
+        job_id (uuid.UUID): Job identifier.
+        worker_id (str): Worker holding the claim.
+        attempt (int): Job attempts when the worker claimed it.
+
+    Returns:
+        bool: False if another claim replaced this one.
+    """
+    renewed = session.execute(
+        update(OffboardingJob)
+        .where(
+            OffboardingJob.id == job_id,
+            OffboardingJob.locked_by == worker_id,
+            OffboardingJob.attempts == attempt,
+            OffboardingJob.status == OffboardingJobStatus.RUNNING,
+        )
+        .values(locked_at=_utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    session.commit()
+    if renewed.rowcount == 1:
+        return True
+
+    return session.scalar(
+        select(OffboardingJob.attempts).where(OffboardingJob.id == job_id)
+    ) == attempt
+
+
+def record_offboarding_job_step(
+    session: Session,
+    job: OffboardingJob,
+    *,
+    system: str,
+    terms: list[dict],
+) -> None:
+    """Marks a step of the job as completed, with the terms it generated.
+
+    Args:
+        session (Session): Active SQLAlchemy database session.
+        job (OffboardingJob): Job being executed.
+        system (str): System whose access was revoked.
+        terms (list[dict]): Serialized GeneratedTerm produced by the step.
+    """
+    completed = json.loads(job.completed_steps)
+    if system not in completed:
+        completed.append(system)
+    job.completed_steps = json.dumps(completed)
+
+    if terms:
+        job.terms = json.dumps(json.loads(job.terms) + terms)
+
+    session.commit()
+
+
+def retry_offboarding_job(
+    session: Session,
+    job: OffboardingJob,
+    *,
+    error: str,
+    delay: float,
+) -> None:
+    """Puts a job back in the queue to be retried after a delay.
+
+    Args:
+        session (Session): Active SQLAlchemy database session.
+        job (OffboardingJob): Job being executed.
+        error (str): Why the attempt did not complete.
+        delay (float): Seconds before the job may run again.
+    """
+    job.status = OffboardingJobStatus.QUEUED
+    job.error = error
+    job.next_attempt_at = _utcnow() + timedelta(seconds=delay)
+    job.locked_by = None
+    job.locked_at = None
+    session.commit()
+
+
+def finish_offboarding_job(
+    session: Session,
+    job: OffboardingJob,
+    *,
+    status: OffboardingJobStatus,
+    result: OffboardingResult,
+) -> None:
+    """Stores the final result of a job.
+
+    Args:
+        session (Session): Active SQLAlchemy database session.
+        job (OffboardingJob): Job being executed.
+        status (OffboardingJobStatus): Final status.
+        result (OffboardingResult): Result of the offboarding.
+    """
+    job.status = status
+    job.result = result.model_dump_json()
+    job.error = result.error
+    job.finished_at = _utcnow()
+    job.next_attempt_at = None
+    job.locked_by = None
+    job.locked_at = None
+    session.commit()
+
+
+def to_job_response(job: OffboardingJob) -> OffboardingJobResponse:
+    """Converts an ORM job to its API schema.
+
+    Args:
+        job (OffboardingJob): SQLAlchemy ORM instance.
+
+    Returns:
+        OffboardingJobResponse: Serializable Pydantic schema.
+    """
+    return OffboardingJobResponse(
+        id=job.id,
+        registration=job.registration,
+        status=job.status,
+        attempts=job.attempts,
+        completed_steps=json.loads(job.completed_steps),
+        result=(
+            OffboardingResult.model_validate_json(job.result)
+            if job.result else None
+        ),
+        error=job.error,
+        next_attempt_at=job.next_attempt_at,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        finished_at=job.finished_at,
+    )
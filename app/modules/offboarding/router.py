@@ -1,8 +1,20 @@
 import logging
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+import uuid
+from pathlib import Path
+from typing import Annotated, AsyncIterator
 
-from app.core.database import Db_session
-from app.modules.users import Current_user
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import FileResponse, StreamingResponse
+
+from app.core.database import AsyncDb_session, Db_session
 from app.integrations.active_directory import ADServiceDep
 from app.integrations.snipe_it import (
     CheckinAssetRequest,
@@ -10,9 +22,25 @@ from app.integrations.snipe_it import (
     SnipeItService,
     get_snipeit_service,
 )
+from app.modules.users import Current_user
 
-from .schemas import OffboardingHistoryResponse, OffboardingResult
-from .service import execute_offboarding, fetch_offboarding_history, verify_services
+from .schemas import (
+    BulkOffboardingItem,
+    BulkOffboardingRequest,
+    OffboardingHistoryResponse,
+    OffboardingJobResponse,
+)
+from .service import (
+    enqueue_offboarding,
+    execute_bulk_offboarding,
+    fetch_offboarding_history_async,
+    fetch_offboarding_job,
+    fetch_offboarding_job_terms,
+    normalize_registrations,
+    parse_registrations_csv,
+    verify_services,
+)
+from .term_store import iter_terms_zip, term_path
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +56,7 @@ async def search_services(
     current_user: Current_user,
     snipeit: SnipeItService = Depends(get_snipeit_service),
 ) -> dict[str, bool]:
-    """Returns a map of external systems and whether the user is currently active in each.
+    """Returns the external systems and whether the user is active in each.
 
     Args:
         registration (str): Employee registration number.
@@ -43,42 +71,241 @@ async def search_services(
 
 @router.post(
     "/execute/{registration}",
-    summary="Execute full offboarding for an employee",
+    summary="Queue a full offboarding for an employee",
+    status_code=202,
 )
-async def execute(
+def execute(
     registration: str,
     current_user: Current_user,
-    background_tasks: BackgroundTasks,
-    ad_service: ADServiceDep,
     request: Request,
     session: Db_session,
-    snipeit_service: SnipeItService = Depends(get_snipeit_service),
-) -> OffboardingResult:
-    """Triggers the full offboarding sequence for the given registration.
+) -> OffboardingJobResponse:
+    """Queues the full offboarding sequence for the given registration.
 
-    Revokes access across all active systems, generates checkin documents,
-    persists the offboarding record, and dispatches a notification email.
+    The offboarding runs in a background worker, which revokes access across
+    all active systems, generates checkin documents, persists the offboarding
+    record, and dispatches a notification email. Poll
+    `GET /offboarding/jobs/{job_id}` for its progress and result.
 
     Args:
         registration (str): Employee registration number to offboard.
-        current_user (Current_user): Authenticated user performing the operation.
-        background_tasks (BackgroundTasks): FastAPI task queue for async email.
-        ad_service (ADServiceDep): Active Directory service injected by FastAPI.
+        current_user (Current_user): Authenticated user performing the
+            operation.
         request (Request): FastAPI request for audit metadata.
         session (Db_session): Database session injected by FastAPI.
-        snipeit_service (SnipeItService): Snipe-IT service injected by FastAPI.
 
     Returns:
-        OffboardingResult: Result with success status, affected systems, and term documents.
+        OffboardingJobResponse: The queued job.
     """
-    return await execute_offboarding(
+    return enqueue_offboarding(
+        session,
         registration=registration,
         current_user=current_user,
-        background_tasks=background_tasks,
-        ad_service=ad_service,
-        snipeit_service=snipeit_service,
         req=request,
-        session=session,
+    )
+
+
+@router.get(
+    "/jobs/{job_id}",
+    summary="Get the status of a queued offboarding",
+)
+def get_job(
+    job_id: uuid.UUID,
+    session: Db_session,
+    _: Current_user,
+) -> OffboardingJobResponse:
+    """Returns the status, completed steps and result of an offboarding job.
+
+    Args:
+        job_id (uuid.UUID): Job identifier returned by `/execute`.
+        session (Db_session): Database session injected by FastAPI.
+        _ (Current_user): Authenticated user (required but unused directly).
+
+    Returns:
+        OffboardingJobResponse: Current job status.
+
+    Raises:
+        HTTPException: 404 if the job does not exist.
+    """
+    return fetch_offboarding_job(session, job_id)
+
+
+@router.get(
+    "/jobs/{job_id}/terms.zip",
+    summary="Download every term generated by an offboarding as a ZIP",
+    response_class=StreamingResponse,
+)
+def download_job_terms(
+    job_id: uuid.UUID,
+    session: Db_session,
+    _: Current_user,
+) -> StreamingResponse:
+    """Streams a ZIP with the term documents generated by an offboarding job.
+
+    The archive is written while it is sent, so it is never held in memory.
+
+    Args:
+        job_id (uuid.UUID): Job identifier returned by `/execute`.
+        session (Db_session): Database session injected by FastAPI.
+        _ (Current_user): Authenticated user (required but unused directly).
+
+    Returns:
+        StreamingResponse: ZIP archive as a downloadable attachment.
+
+    Raises:
+        HTTPException: 404 if the job does not exist.
+    """
+    terms = fetch_offboarding_job_terms(session, job_id)
+
+    return StreamingResponse(
+        iter_terms_zip(terms),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="termos_{job_id}.zip"'
+            ),
+            "Access-Control-Expose-Headers": "Content-Disposition",
+        },
+    )
+
+
+@router.get(
+    "/terms/{sha256}",
+    summary="Download a generated term document",
+)
+def download_term(
+    sha256: str,
+    _: Current_user,
+    filename: Annotated[
+        str | None, Query(description="Name to save the file as")
+    ] = None,
+) -> FileResponse:
+    """Streams a term document from the term store.
+
+    Args:
+        sha256 (str): Document identifier, as found in `GeneratedTerm.sha256`.
+        _ (Current_user): Authenticated user (required but unused directly).
+        filename (str | None): Download name; defaults to the identifier.
+
+    Returns:
+        FileResponse: DOCX file as a downloadable attachment.
+
+    Raises:
+        HTTPException: 400 if the identifier is malformed.
+        HTTPException: 404 if the document is not in the store (e.g. expired).
+    """
+    try:
+        path = term_path(sha256)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Term not found.")
+
+    return FileResponse(
+        path,
+        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        filename=Path(filename).name if filename else path.name,
+        headers={"Access-Control-Expose-Headers": "Content-Disposition"},
+    )
+
+
+async def _ndjson(
+    items: AsyncIterator[BulkOffboardingItem],
+) -> AsyncIterator[str]:
+    async for item in items:
+        yield item.model_dump_json() + "\n"
+
+
+@router.post(
+    "/bulk",
+    summary="Execute offboarding for a list of employees",
+    response_class=StreamingResponse,
+)
+async def execute_bulk(
+    payload: BulkOffboardingRequest,
+    current_user: Current_user,
+    ad_service: ADServiceDep,
+    request: Request,
+    snipeit_service: Annotated[
+        SnipeItService, Depends(get_snipeit_service)
+    ],
+) -> StreamingResponse:
+    """Offboards every registration in the list and streams progress as NDJSON.
+
+    One JSON line is written per employee as soon as its offboarding
+    finishes, carrying the same OffboardingResult as the single endpoint.
+
+    Args:
+        payload (BulkOffboardingRequest): Registrations to offboard.
+        current_user (Current_user): Authenticated user performing the
+            operation.
+        ad_service (ADServiceDep): Active Directory service injected by
+            FastAPI.
+        request (Request): FastAPI request for audit metadata.
+        snipeit_service (SnipeItService): Snipe-IT service injected by FastAPI.
+
+    Returns:
+        StreamingResponse: NDJSON stream of BulkOffboardingItem.
+    """
+    registrations = normalize_registrations(payload.registrations)
+
+    return StreamingResponse(
+        _ndjson(
+            execute_bulk_offboarding(
+                registrations=registrations,
+                current_user=current_user,
+                ad_service=ad_service,
+                snipeit_service=snipeit_service,
+                req=request,
+            )
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post(
+    "/bulk/csv",
+    summary="Execute offboarding for the employees in a CSV file",
+    response_class=StreamingResponse,
+)
+async def execute_bulk_csv(
+    file: UploadFile,
+    current_user: Current_user,
+    ad_service: ADServiceDep,
+    request: Request,
+    snipeit_service: Annotated[
+        SnipeItService, Depends(get_snipeit_service)
+    ],
+) -> StreamingResponse:
+    """Offboards the registrations listed in the first column of a CSV upload.
+
+    Args:
+        file (UploadFile): CSV file, one registration per row.
+        current_user (Current_user): Authenticated user performing the
+            operation.
+        ad_service (ADServiceDep): Active Directory service injected by
+            FastAPI.
+        request (Request): FastAPI request for audit metadata.
+        snipeit_service (SnipeItService): Snipe-IT service injected by FastAPI.
+
+    Returns:
+        StreamingResponse: NDJSON stream of BulkOffboardingItem.
+    """
+    registrations = normalize_registrations(
+        parse_registrations_csv(await file.read())
+    )
+
+    return StreamingResponse(
+        _ndjson(
+            execute_bulk_offboarding(
+                registrations=registrations,
+                current_user=current_user,
+                ad_service=ad_service,
+                snipeit_service=snipeit_service,
+                req=request,
+            )
+        ),
+        media_type="application/x-ndjson",
     )
 
 
@@ -86,26 +313,32 @@ async def execute(
     "/history",
     summary="List offboarding history",
 )
-def list_history(
-    session: Db_session,
+async def list_history(
+    session: AsyncDb_session,
     _: Current_user,
-    registration: str | None = Query(default=None, description="Filter by registration number"),
+    registration: str | None = Query(
+        default=None, description="Filter by registration number"
+    ),
     page: int = Query(default=1, ge=1, description="Page number"),
-    limit: int = Query(default=20, ge=1, le=100, description="Records per page"),
+    limit: int = Query(
+        default=20, ge=1, le=100, description="Records per page"
+    ),
 ) -> OffboardingHistoryResponse:
-    """Returns paginated offboarding history, optionally filtered by registration.
+    """Returns paginated offboarding history, optionally by registration.
 
     Args:
-        session (Db_session): Database session injected by FastAPI.
+        session (AsyncDb_session): Async database session injected by
+            FastAPI.
         _ (Current_user): Authenticated user (required but unused directly).
-        registration (str | None): Optional registration number to filter records.
+        registration (str | None): Optional registration number to filter
+            records.
         page (int): Page number starting at 1.
         limit (int): Number of records per page, between 1 and 100.
 
     Returns:
         OffboardingHistoryResponse: Paginated list of offboarding records.
     """
-    return fetch_offboarding_history(
+    return await fetch_offboarding_history_async(
         session,
         registration=registration,
         page=page,
@@ -141,7 +374,9 @@ async def generate_term(
             template_id=request.template_id,
         )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to generate term: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to generate term: {e}"
+        )
 
     filename = f"termo_{request.employee_num}_{request.asset_tag}.docx"
 
@@ -166,7 +401,8 @@ async def checkin_asset(
     """Manually returns a specific asset to inventory in Snipe-IT.
 
     Args:
-        payload (CheckinAssetRequest): Registration number, asset tag, and optional note.
+        payload (CheckinAssetRequest): Registration number, asset tag, and
+            optional note.
         snipeit (SnipeItService): Snipe-IT service injected by FastAPI.
 
     Returns:
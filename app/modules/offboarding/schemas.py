@@ -1,6 +1,12 @@
-from uuid import UUID
-from pydantic import BaseModel
 from datetime import datetime
+from urllib.parse import quote
+from uuid import UUID
+
+from pydantic import BaseModel, computed_field
+
+from app.integrations.active_directory.schemas import ADUser
+from app.integrations.ifs.schemas import IFSUserLookup
+from app.integrations.intouch.schemas import InTouchUserSearchModel
 
 
 class OffboardingContext(BaseModel):
@@ -13,6 +19,30 @@ class OffboardingContext(BaseModel):
     systems: list[str]
 
 
+class OffboardingLookup(BaseModel):
+    """Upstream records found for an employee during discovery.
+
+    Built once per offboarding by the discovery phase and passed to every
+    use case, so they act on these records instead of searching again.
+    A field is left empty when the system has no record or the lookup failed.
+    """
+
+    registration: str
+    ad_users: list[ADUser] = []
+    intouch_user: InTouchUserSearchModel | None = None
+    snipeit_user: dict | None = None
+    assets: list[dict] = []
+    ifs_user: IFSUserLookup | None = None
+    # Set when the InTouch search raised, so a failed lookup is not taken
+    # for an employee that does not exist
+    intouch_error: str | None = None
+
+    @property
+    def ad_user(self) -> ADUser | None:
+        """The AD account, when the registration matches exactly one."""
+        return self.ad_users[0] if len(self.ad_users) == 1 else None
+
+
 class RevokedSystemResult(BaseModel):
     """Result of a single system revocation attempt."""
 
@@ -22,10 +52,29 @@ class RevokedSystemResult(BaseModel):
 
 
 class GeneratedTerm(BaseModel):
-    """Represents a generated term document in Base64 format."""
+    """Generated term document, kept in the term store under its SHA-256."""
 
     filename: str
-    content_base64: str
+    sha256: str
+    size: int
+
+    @computed_field
+    @property
+    def download_url(self) -> str:
+        """Path of the endpoint streaming the document."""
+        return (
+            f"/offboarding/terms/{self.sha256}"
+            f"?filename={quote(self.filename)}"
+        )
+
+
+class OffboardingRun(BaseModel):
+    """Outcome of the revocation steps of one offboarding run."""
+
+    target_username: str
+    revoked: list[str] = []
+    failed: list[str] = []
+    terms: list[GeneratedTerm] = []
 
 
 class OffboardingResult(BaseModel):
@@ -37,6 +86,38 @@ class OffboardingResult(BaseModel):
     error: str | None = None
 
 
+class BulkOffboardingRequest(BaseModel):
+    """List of registrations to offboard in a single bulk run."""
+
+    registrations: list[str]
+
+
+class BulkOffboardingItem(BaseModel):
+    """Progress line streamed for each employee of a bulk run."""
+
+    registration: str
+    completed: int
+    total: int
+    result: OffboardingResult | None = None
+    error: str | None = None
+
+
+class OffboardingJobResponse(BaseModel):
+    """Status of a queued offboarding job."""
+
+    id: UUID
+    registration: str
+    status: str
+    attempts: int
+    completed_steps: list[str] = []
+    result: OffboardingResult | None = None
+    error: str | None = None
+    next_attempt_at: datetime | None = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: datetime | None = None
+
+
 class OffboardingHistoryItem(BaseModel):
     """Single offboarding record for history listing."""
 
@@ -1,47 +1,113 @@
 import asyncio
+import csv
+import io
+import json
 import logging
+import uuid
+from functools import partial
+from typing import AsyncIterator, Awaitable, Callable, Collection
 
-from fastapi import HTTPException, Request
+from fastapi import BackgroundTasks, HTTPException, Request
 from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import Db_session
+from app.core.cache import SingleFlightCache
+from app.core.config import settings
+from app.core.database import (
+    Db_session,
+    async_session_local,
+    async_unit_of_work,
+)
 from app.integrations.active_directory import ADService
 from app.integrations.intouch import service as intouch_service
-from app.integrations.snipe_it import SnipeItService
+from app.integrations.snipe_it import SnipeItService, get_snipeit_service
+from app.modules.audit.enums import AuditAction, AuditStatus
+from app.modules.audit.service import AuditLogCreate, create_audit_log
 from app.modules.shared import EmailActions, email_service
-from app.integrations.ifs.service import IFSService
-
-from .enums import OffboardingSystem
-from .repository import create_offboarding_record, get_offboarding_history
+from app.modules.users.model import User
+
+from .enums import OffboardingJobStatus, OffboardingSystem
+from .model import OffboardingJob
+from .repository import (
+    create_offboarding_job,
+    create_offboarding_record,
+    finish_offboarding_job,
+    get_offboarding_history,
+    get_offboarding_history_async,
+    get_offboarding_job,
+    record_offboarding_job_step,
+    retry_offboarding_job,
+    to_job_response,
+)
 from .schemas import (
+    BulkOffboardingItem,
+    GeneratedTerm,
     OffboardingContext,
     OffboardingHistoryResponse,
+    OffboardingJobResponse,
+    OffboardingLookup,
     OffboardingResult,
+    OffboardingRun,
 )
+from .steps import build_step, run_steps
 from .use_cases.checkin_assets import checkin_assets
-from .use_cases.disable_intouch_access import disable_intouch_access
 from .use_cases.disable_ad_access import disable_ad_account
 from .use_cases.disable_gateway_access import disable_gateway_access
-from .use_cases.disable_ifs_access import disable_ifs_access, check_ifs_status
+from .use_cases.disable_ifs_access import disable_ifs_access, lookup_ifs_user
+from .use_cases.disable_intouch_access import disable_intouch_access
 
 logger = logging.getLogger(__name__)
 
+STEP_AUDIT_ACTIONS: dict[OffboardingSystem, AuditAction] = {
+    OffboardingSystem.EQUIPMENT: AuditAction.CHECKIN_ASSET,
+    OffboardingSystem.ACCESS: AuditAction.DISABLE_TURNSTILE_USER,
+    OffboardingSystem.INTOUCH: AuditAction.DISABLE_INTOUCH_USER,
+    OffboardingSystem.IFS: AuditAction.DISABLE_IFS_USER,
+    OffboardingSystem.NETWORK: AuditAction.DISABLE_AD_USER,
+}
+
+# Bulk runs keep going when the client disconnects; holding the tasks here
+# stops them from being garbage collected halfway through an offboarding.
+_bulk_tasks: set[asyncio.Task] = set()
+
+# Concurrent searches for the same registration share one upstream fan-out;
+# the result is then reused for a few seconds.
+_service_map_cache: SingleFlightCache[str, dict[str, bool]] = (
+    SingleFlightCache(
+        ttl=settings.OFFBOARDING_LOOKUP_CACHE_TTL,
+        maxsize=settings.OFFBOARDING_LOOKUP_CACHE_SIZE,
+    )
+)
 
-async def verify_services(
+
+async def _lookup_snipeit(
     registration: str,
     snipeit_service: SnipeItService,
-) -> dict[str, bool]:
-    """Checks which external systems have an active record for the given user.
+) -> tuple[dict, list[dict]]:
+    user = await snipeit_service.find_user(registration)
+    assets = await snipeit_service.get_user_assets(user["id"])
+    return user, assets
+
+
+async def discover_user(
+    registration: str,
+    snipeit_service: SnipeItService,
+) -> OffboardingLookup:
+    """Looks the employee up in every external system.
 
-    Runs AD, InTouch, and Snipe-IT lookups concurrently with a shared timeout.
+    Runs the AD, InTouch, Snipe-IT and IFS lookups concurrently with a shared
+    timeout and keeps the records found, so the offboarding steps can act on
+    them without searching again. A failed lookup is logged and leaves its
+    field empty.
 
     Args:
-        registration (str): Employee registration number to search across systems.
+        registration (str): Employee registration number to search across
+            systems.
         snipeit_service (SnipeItService): Snipe-IT service instance.
 
     Returns:
-        dict[str, bool]: Map of system name to active status.
+        OffboardingLookup: Records found in each system.
 
     Raises:
         HTTPException: 504 if external systems exceed the 10-second timeout.
@@ -50,16 +116,16 @@ async def verify_services(
 
     try:
 
-        ad_response, intouch_data, snipeit_assets, ifs_is_active = await asyncio.wait_for(
+        (
+            ad_response, intouch_data, snipeit_data, ifs_user
+        ) = await asyncio.wait_for(
             asyncio.gather(
                 run_in_threadpool(
                     ad_service.search_users, registration=registration
                 ),
-                run_in_threadpool(
-                    intouch_service.search_user, registration=registration
-                ),
-                snipeit_service.search_assets_by_user(registration),
-                check_ifs_status(registration), 
+                intouch_service.search_user(registration=registration),
+                _lookup_snipeit(registration, snipeit_service),
+                lookup_ifs_user(registration),
                 return_exceptions=True,
             ),
             timeout=10.0,
@@ -68,76 +134,184 @@ async def verify_services(
         logger.error("Timeout: service lookup exceeded 10 seconds.")
         raise HTTPException(
             status_code=504,
-            detail="External systems are taking too long to respond. Please try again.",
+            detail=(
+                "External systems are taking too long to respond. "
+                "Please try again."
+            ),
         )
 
-    service_map: dict[str, bool] = {}
+    lookup = OffboardingLookup(registration=registration)
 
-    if not isinstance(ad_response, BaseException) and ad_response:
-        service_map[OffboardingSystem.NETWORK] = bool(ad_response[0].enabled)
-    elif isinstance(ad_response, BaseException):
+    if isinstance(ad_response, BaseException):
         logger.error(f"Falha ao buscar AD: {ad_response}")
+    else:
+        lookup.ad_users = list(ad_response)
 
-    if (
-        not isinstance(intouch_data, BaseException)
-        and intouch_data
-        and intouch_data.success
-    ):
-        service_map[OffboardingSystem.INTOUCH] = bool(intouch_data.is_active)
-    elif isinstance(intouch_data, BaseException):
+    if isinstance(intouch_data, BaseException):
         logger.error(f"Falha ao buscar InTouch: {intouch_data}")
+        lookup.intouch_error = str(intouch_data) or type(intouch_data).__name__
+    else:
+        lookup.intouch_user = intouch_data
+
+    if isinstance(ifs_user, BaseException):
+        logger.error(f"Falha de conexão com o IFS: {ifs_user}")
+    else:
+        lookup.ifs_user = ifs_user
+
+    if isinstance(snipeit_data, BaseException):
+        logger.error(f"Falha de conexão com o Snipe-IT: {snipeit_data}")
+    else:
+        lookup.snipeit_user, lookup.assets = snipeit_data
+
+    return lookup
+
 
-    if not isinstance(ifs_is_active, BaseException) and ifs_is_active:
+def build_service_map(lookup: OffboardingLookup) -> dict[str, bool]:
+    """Derives which systems have an active record from a discovery lookup.
+
+    Args:
+        lookup (OffboardingLookup): Result of discover_user.
+
+    Returns:
+        dict[str, bool]: Map of system name to active status.
+    """
+    service_map: dict[str, bool] = {}
+
+    if lookup.ad_users:
+        service_map[OffboardingSystem.NETWORK] = bool(
+            lookup.ad_users[0].enabled
+        )
+
+    if lookup.intouch_user and lookup.intouch_user.success:
+        service_map[OffboardingSystem.INTOUCH] = bool(
+            lookup.intouch_user.is_active
+        )
+
+    if lookup.ifs_user and lookup.ifs_user.user.is_active:
         service_map[OffboardingSystem.IFS] = True
-    elif isinstance(ifs_is_active, BaseException):
-        logger.error(f"Falha de conexão com o IFS: {ifs_is_active}")
 
-    if not isinstance(snipeit_assets, BaseException) and snipeit_assets:
+    if lookup.assets:
         service_map[OffboardingSystem.EQUIPMENT] = True
-    elif isinstance(snipeit_assets, BaseException):
-        logger.error(f"Falha de conexão com o Snipe-IT: {snipeit_assets}")
 
-    logger.info(f"Active services for {registration}: {service_map}")
+    logger.info(f"Active services for {lookup.registration}: {service_map}")
     return service_map
 
 
-async def execute_offboarding(
+async def verify_services(
+    registration: str,
+    snipeit_service: SnipeItService,
+) -> dict[str, bool]:
+    """Checks which external systems have an active record for the given user.
+
+    Concurrent calls for the same registration share a single lookup, and
+    its result is cached for OFFBOARDING_LOOKUP_CACHE_TTL seconds or until
+    an offboarding step for that registration completes.
+
+    Args:
+        registration (str): Employee registration number to search across
+            systems.
+        snipeit_service (SnipeItService): Snipe-IT service instance.
+
+    Returns:
+        dict[str, bool]: Map of system name to active status.
+
+    Raises:
+        HTTPException: 504 if external systems exceed the 10-second timeout.
+    """
+
+    async def load() -> dict[str, bool]:
+        lookup = await discover_user(registration, snipeit_service)
+        return build_service_map(lookup)
+
+    service_map = await _service_map_cache.get_or_load(
+        registration.strip(), load
+    )
+    return dict(service_map)
+
+
+def invalidate_service_map(registration: str) -> None:
+    """Discards the cached verify_services result for a registration.
+
+    Args:
+        registration (str): Employee registration number.
+    """
+    _service_map_cache.invalidate(registration.strip())
+
+
+async def revoke_access(
     *,
     registration: str,
     current_user,
     ad_service: ADService,
     snipeit_service: SnipeItService,
-    background_tasks,
     req: Request,
     session: Session,
-) -> OffboardingResult:
-    """Orchestrates the full offboarding process for a given employee.
-
-    Sequentially attempts to revoke access across all active systems.
-    Each step is independent — a failure in one does not abort the others.
-    Persists a record of successfully revoked systems and sends a notification email.
+    skip: Collection[str] = (),
+    on_step_done: (
+        Callable[
+            [OffboardingSystem, bool, list[GeneratedTerm]], Awaitable[None]
+        ]
+        | None
+    ) = None,
+) -> OffboardingRun | None:
+    """Runs the revocation steps for an employee, without finalizing it.
+
+    Looks the employee up once in every system and passes the records found
+    to each step, so the steps do not search again. Revokes access across all
+    active systems concurrently, following the step dependencies in
+    STEP_DEPENDENCIES (AD runs last). Each step is independent — a failure or
+    timeout in one does not abort the others.
 
     Args:
         registration (str): Employee registration number to offboard.
         current_user: Authenticated user performing the operation.
         ad_service (ADService): Active Directory service instance.
         snipeit_service (SnipeItService): Snipe-IT service instance.
-        background_tasks: FastAPI BackgroundTasks for async email dispatch.
         req (Request): FastAPI request object for audit metadata extraction.
         session (Session): Active SQLAlchemy database session.
+        skip (Collection[str]): Systems already revoked by an earlier run.
+        on_step_done (Callable | None): Awaited as each step finishes with
+            the system, whether access was revoked and the terms it
+            generated.
 
     Returns:
-        OffboardingResult: Result containing success status, revoked systems, and generated terms.
+        OffboardingRun | None: Steps outcome, or None if the user was not
+            found.
     """
-    target_user = await run_in_threadpool(intouch_service.search_user, registration)
+    lookup = await discover_user(registration, snipeit_service)
+    target_user = lookup.intouch_user
+
+    if lookup.intouch_error:
+        create_audit_log(
+            session,
+            AuditLogCreate(
+                action=AuditAction.SEARCH_INTOUCH_USER,
+                status=AuditStatus.FAILED,
+                message=(
+                    f"InTouch lookup failed for {registration}: "
+                    f"{lookup.intouch_error}"
+                ),
+                user_id=current_user.id,
+                username=current_user.username,
+                target_registration=registration,
+                resource=registration,
+                ip_address=req.client.host if req.client else None,
+                user_agent=req.headers.get("user-agent"),
+            ),
+        )
+        raise HTTPException(
+            status_code=502,
+            detail="InTouch lookup failed, offboarding not started.",
+        )
 
     if not target_user:
-        logger.error(f"Offboarding aborted: registration {registration} not found.")
-        return OffboardingResult(success=False, error="User not found.")
+        logger.error(
+            f"Offboarding aborted: registration {registration} not found."
+        )
+        return None
 
-    services_map = await verify_services(registration, snipeit_service)
-    successfully_revoked: list[str] = []
-    generated_terms = []
+    services_map = build_service_map(lookup)
+    generated_terms: list[GeneratedTerm] = []
 
     shared = dict(
         registration=registration,
@@ -147,81 +321,612 @@ async def execute_offboarding(
         req=req,
     )
 
-    if services_map.get(OffboardingSystem.EQUIPMENT):
+    async def revoke_equipment() -> bool:
         success, terms = await checkin_assets(
             registration=registration,
             target_name=target_user.name,
             snipeit_service=snipeit_service,
             current_user=current_user,
             session=session,
-            req=req
+            req=req,
+            lookup=lookup,
         )
-        if success:
-            successfully_revoked.append(OffboardingSystem.EQUIPMENT)
-            generated_terms.extend(terms)
-
-            try:
-                await snipeit_service.update_user_notes(
-                    registration=registration,
-                    performed_by=current_user.username,
-                )
-            except Exception as e:
-                logger.warning(
-                    f"Não foi possível atualizar notas no Snipe-IT "
-                    f"para {registration}: {e}"
-                )
-
-    # Gate access
-    if services_map.get(OffboardingSystem.ACCESS):
-        if await disable_gateway_access(**shared):  # type: ignore
-            successfully_revoked.append(OffboardingSystem.ACCESS)
+        if not success:
+            return False
 
-    # InTouch
-    if services_map.get(OffboardingSystem.INTOUCH):
-        if await disable_intouch_access(**shared):  # type: ignore
-            successfully_revoked.append(OffboardingSystem.INTOUCH)
-
-    # IFS
-    if services_map.get(OffboardingSystem.IFS):
-        if await disable_ifs_access(**shared):  # type: ignore
-            successfully_revoked.append(OffboardingSystem.IFS)
-
-    # Active Directory
-    if services_map.get(OffboardingSystem.NETWORK):
-        if await disable_ad_account(**shared, ad_service=ad_service):  # type: ignore
-            successfully_revoked.append(OffboardingSystem.NETWORK)
-
-    if successfully_revoked:
+        generated_terms.extend(terms)
         try:
-            create_offboarding_record(
+            await snipeit_service.update_user_notes(
+                registration=registration,
+                performed_by=current_user.username,
+                user_id=(
+                    lookup.snipeit_user["id"] if lookup.snipeit_user else None
+                ),
+            )
+        except Exception as e:
+            logger.warning(
+                f"Não foi possível atualizar notas no Snipe-IT "
+                f"para {registration}: {e}"
+            )
+        return True
+
+    step_runners = {
+        OffboardingSystem.EQUIPMENT: revoke_equipment,
+        OffboardingSystem.ACCESS: lambda: disable_gateway_access(**shared),  # type: ignore
+        OffboardingSystem.INTOUCH: lambda: disable_intouch_access(
+            **shared, lookup=lookup  # type: ignore
+        ),
+        OffboardingSystem.IFS: lambda: disable_ifs_access(
+            **shared, lookup=lookup  # type: ignore
+        ),
+        OffboardingSystem.NETWORK: lambda: disable_ad_account(
+            **shared, ad_service=ad_service, lookup=lookup  # type: ignore
+        ),
+    }
+
+    def audit_timeout(system: OffboardingSystem) -> None:
+        try:
+            create_audit_log(
                 session,
-                OffboardingContext(
+                AuditLogCreate(
+                    action=STEP_AUDIT_ACTIONS[system],
+                    status=AuditStatus.FAILED,
+                    message=f"{system}: step timed out for {registration}.",
                     user_id=current_user.id,
-                    username=target_user.name,
-                    registration=registration,
-                    performed_by=current_user.username,
-                    systems=successfully_revoked,
+                    username=current_user.username,
+                    target_username=target_user.name,
+                    target_registration=registration,
+                    resource=registration,
+                    ip_address=req.client.host if req.client else None,
+                    user_agent=req.headers.get("user-agent"),
                 ),
             )
         except Exception as e:
-            logger.error(f"Failed to persist offboarding record for {registration}: {e}")
+            logger.error(f"Failed to audit {system} timeout: {e}")
+
+    async def step_done(system: OffboardingSystem, revoked: bool) -> None:
+        invalidate_service_map(registration)
+        if on_step_done is not None:
+            await on_step_done(
+                system,
+                revoked,
+                (
+                    generated_terms
+                    if system == OffboardingSystem.EQUIPMENT
+                    else []
+                ),
+            )
+
+    outcomes = await run_steps(
+        [
+            build_step(system, run)
+            for system, run in step_runners.items()
+            if services_map.get(system) and system not in skip
+        ],
+        deadline=settings.OFFBOARDING_DEADLINE,
+        on_timeout=audit_timeout,
+        on_complete=step_done,
+    )
+
+    return OffboardingRun(
+        target_username=target_user.name,
+        revoked=[system for system, revoked in outcomes.items() if revoked],
+        failed=[system for system, revoked in outcomes.items() if not revoked],
+        terms=generated_terms,
+    )
+
+
+def finalize_offboarding(
+    *,
+    registration: str,
+    current_user,
+    target_username: str,
+    revoked: list[str],
+    background_tasks,
+    session: Session,
+) -> None:
+    """Persists the offboarding record and queues the notification email.
+
+    Does nothing when no system was revoked.
+
+    Args:
+        registration (str): Employee registration number.
+        current_user: User who performed the offboarding.
+        target_username (str): Display name of the offboarded employee.
+        revoked (list[str]): Systems whose access was revoked.
+        background_tasks: FastAPI BackgroundTasks for async email dispatch.
+        session (Session): Active SQLAlchemy database session.
+    """
+    if not revoked:
+        return
+
+    try:
+        create_offboarding_record(
+            session,
+            OffboardingContext(
+                user_id=current_user.id,
+                username=target_username,
+                registration=registration,
+                performed_by=current_user.username,
+                systems=revoked,
+            ),
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to persist offboarding record for {registration}: {e}"
+        )
+
+    background_tasks.add_task(
+        email_service.send_email,
+        registration=registration,
+        action=EmailActions.get_by_id(3),
+        user_target=target_username,
+        performed_by=str(current_user.username),
+        systems_list=revoked,
+    )
+
+
+async def execute_offboarding(
+    *,
+    registration: str,
+    current_user,
+    ad_service: ADService,
+    snipeit_service: SnipeItService,
+    background_tasks,
+    req: Request,
+    session: AsyncSession,
+) -> OffboardingResult:
+    """Orchestrates the full offboarding process for a given employee.
+
+    Revokes access in every active system (see revoke_access), then
+    persists a record of successfully revoked systems and sends a
+    notification email. All database writes are staged and committed in
+    a single awaited transaction at the end.
+
+    Args:
+        registration (str): Employee registration number to offboard.
+        current_user: Authenticated user performing the operation.
+        ad_service (ADService): Active Directory service instance.
+        snipeit_service (SnipeItService): Snipe-IT service instance.
+        background_tasks: FastAPI BackgroundTasks for async email dispatch.
+        req (Request): FastAPI request object for audit metadata extraction.
+        session (AsyncSession): Async database session.
 
-        background_tasks.add_task(
-            email_service.send_email,
+    Returns:
+        OffboardingResult: Result containing success status, revoked
+            systems, and generated terms.
+    """
+    # Audit logs of every step and the offboarding record are committed
+    # together at the end instead of one transaction each
+    async with async_unit_of_work(session) as staging:
+        run = await revoke_access(
             registration=registration,
-            action=EmailActions.get_by_id(3),
-            user_target=target_user.name,
-            performed_by=str(current_user.username),
-            systems_list=successfully_revoked,
+            current_user=current_user,
+            ad_service=ad_service,
+            snipeit_service=snipeit_service,
+            req=req,
+            session=staging,
+        )
+
+        if run is None:
+            return OffboardingResult(success=False, error="User not found.")
+
+        finalize_offboarding(
+            registration=registration,
+            current_user=current_user,
+            target_username=run.target_username,
+            revoked=run.revoked,
+            background_tasks=background_tasks,
+            session=staging,
         )
 
     return OffboardingResult(
-        success=bool(successfully_revoked),
-        details=successfully_revoked,
-        terms=[t.model_dump() for t in generated_terms],
+        success=bool(run.revoked),
+        details=run.revoked,
+        terms=run.terms,
     )
 
 
+def enqueue_offboarding(
+    session: Session,
+    *,
+    registration: str,
+    current_user,
+    req: Request,
+) -> OffboardingJobResponse:
+    """Queues an offboarding to be executed by the background workers.
+
+    The client IP and user agent are stored with the job so the audit
+    entries written by the workers match the ones of a direct execution.
+
+    Args:
+        session (Session): Active SQLAlchemy database session.
+        registration (str): Employee registration number to offboard.
+        current_user: Authenticated user requesting the offboarding.
+        req (Request): FastAPI request object for audit metadata extraction.
+
+    Returns:
+        OffboardingJobResponse: The queued job.
+    """
+    job = create_offboarding_job(
+        session,
+        registration=registration,
+        requested_by_id=current_user.id,
+        ip_address=req.client.host if req.client else None,
+        user_agent=req.headers.get("user-agent"),
+    )
+    logger.info(f"Offboarding job {job.id} queued for {registration}.")
+    return to_job_response(job)
+
+
+def fetch_offboarding_job(
+    session: Session, job_id: uuid.UUID
+) -> OffboardingJobResponse:
+    """Returns the status of a queued offboarding.
+
+    Args:
+        session (Session): Active SQLAlchemy database session.
+        job_id (uuid.UUID): Job identifier.
+
+    Returns:
+        OffboardingJobResponse: Current job status.
+
+    Raises:
+        HTTPException: 404 if the job does not exist.
+    """
+    job = get_offboarding_job(session, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404, detail="Offboarding job not found."
+        )
+    return to_job_response(job)
+
+
+def fetch_offboarding_job_terms(
+    session: Session, job_id: uuid.UUID
+) -> list[GeneratedTerm]:
+    """Returns the term documents generated so far by an offboarding job.
+
+    Args:
+        session (Session): Active SQLAlchemy database session.
+        job_id (uuid.UUID): Job identifier.
+
+    Returns:
+        list[GeneratedTerm]: Terms generated by the job's completed steps.
+
+    Raises:
+        HTTPException: 404 if the job does not exist.
+    """
+    job = get_offboarding_job(session, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404, detail="Offboarding job not found."
+        )
+    return [
+        GeneratedTerm.model_validate(term) for term in json.loads(job.terms)
+    ]
+
+
+def _job_request(job: OffboardingJob) -> Request:
+    """Rebuilds a request carrying the client metadata stored with the job."""
+    headers = []
+    if job.user_agent:
+        headers.append((b"user-agent", job.user_agent.encode()))
+
+    return Request({
+        "type": "http",
+        "method": "POST",
+        "path": f"/offboarding/execute/{job.registration}",
+        "query_string": b"",
+        "headers": headers,
+        "client": (job.ip_address, 0) if job.ip_address else None,
+    })
+
+
+def _job_run_error(
+    run: OffboardingRun | None, completed: list[str]
+) -> str | None:
+    """Returns why a job attempt did not complete, or None if it did."""
+    if run is None:
+        return "User not found."
+    if run.failed:
+        return "Failed steps: " + ", ".join(run.failed)
+    if not (run.revoked or completed):
+        return "No active systems to revoke."
+    return None
+
+
+async def run_offboarding_job(session: Session, job: OffboardingJob) -> None:
+    """Executes one attempt of a claimed offboarding job.
+
+    Steps revoked by earlier attempts are skipped, and every step revoked
+    now is saved as soon as it finishes, so an interrupted job resumes
+    where it stopped. An attempt that fails, or leaves steps failed, is
+    retried with exponential backoff until OFFBOARDING_JOB_MAX_ATTEMPTS;
+    the last attempt finalizes the offboarding with whatever was revoked.
+    A job with no active system to revoke fails.
+
+    The steps stage their audit logs into a separate, unbound session;
+    the staged rows are moved to the job session and committed with the
+    job progress, one save at a time and in a worker thread, so the
+    event loop never waits on the database.
+
+    Args:
+        session (Session): Session of the calling worker, not expiring
+            its objects on commit.
+        job (OffboardingJob): Job claimed by the calling worker.
+    """
+    current_user = await run_in_threadpool(
+        session.get, User, job.requested_by_id
+    )
+    if current_user is None:
+        await run_in_threadpool(
+            finish_offboarding_job,
+            session,
+            job,
+            status=OffboardingJobStatus.FAILED,
+            result=OffboardingResult(
+                success=False, error="Requesting user no longer exists."
+            ),
+        )
+        return
+
+    staging = Session(info={"unit_of_work": True})
+    save_lock = asyncio.Lock()
+
+    async def save(write: Callable[[], None]) -> None:
+        async with save_lock:
+            staged = list(staging.new)
+            staging.expunge_all()
+            session.add_all(staged)
+            await run_in_threadpool(write)
+
+    async def step_done(
+        system: OffboardingSystem, revoked: bool, terms: list[GeneratedTerm]
+    ) -> None:
+        if revoked:
+            await save(
+                partial(
+                    record_offboarding_job_step,
+                    session,
+                    job,
+                    system=system,
+                    terms=[t.model_dump() for t in terms],
+                )
+            )
+
+    completed = json.loads(job.completed_steps)
+    try:
+        run = await revoke_access(
+            registration=job.registration,
+            current_user=current_user,
+            ad_service=ADService(),
+            snipeit_service=get_snipeit_service(),
+            req=_job_request(job),
+            session=staging,
+            skip=completed,
+            on_step_done=step_done,
+        )
+    except HTTPException as e:
+        error = str(e.detail)
+    except asyncio.CancelledError:
+        # Keep the audit trail of the interrupted attempt
+        await save(session.commit)
+        raise
+    except Exception as e:
+        logger.error(f"Offboarding job {job.id} attempt failed: {e}")
+        error = str(e)
+    else:
+        error = _job_run_error(run, completed)
+        if run is not None:
+            job.target_username = run.target_username
+
+    if error and job.attempts < settings.OFFBOARDING_JOB_MAX_ATTEMPTS:
+        backoff = settings.OFFBOARDING_JOB_RETRY_BACKOFF
+        delay = backoff * 2 ** (job.attempts - 1)
+        logger.warning(
+            f"Offboarding job {job.id} will be retried in {delay:.0f}s: "
+            f"{error}"
+        )
+        await save(
+            partial(
+                retry_offboarding_job, session, job, error=error, delay=delay
+            )
+        )
+        return
+
+    completed = json.loads(job.completed_steps)
+    revoked = [system for system in OffboardingSystem if system in completed]
+
+    if error is None:
+        status = OffboardingJobStatus.SUCCEEDED
+    elif revoked:
+        status = OffboardingJobStatus.PARTIAL
+    else:
+        status = OffboardingJobStatus.FAILED
+
+    background_tasks = BackgroundTasks()
+    finalize_offboarding(
+        registration=job.registration,
+        current_user=current_user,
+        target_username=job.target_username or job.registration,
+        revoked=revoked,
+        background_tasks=background_tasks,
+        session=staging,
+    )
+    await save(
+        partial(
+            finish_offboarding_job,
+            session,
+            job,
+            status=status,
+            result=OffboardingResult(
+                success=bool(revoked),
+                details=revoked,
+                terms=json.loads(job.terms),
+                error=error,
+            ),
+        )
+    )
+    logger.info(f"Offboarding job {job.id} finished: {status}")
+
+    await background_tasks()
+
+
+def normalize_registrations(registrations: list[str]) -> list[str]:
+    """Strips, de-duplicates and validates a bulk list of registrations.
+
+    Args:
+        registrations (list[str]): Registrations as received.
+
+    Returns:
+        list[str]: Unique, non-empty registrations in their original order.
+
+    Raises:
+        HTTPException: 422 if the list is empty or exceeds
+            OFFBOARDING_BULK_MAX_ITEMS.
+    """
+    unique = list(dict.fromkeys(r.strip() for r in registrations if r.strip()))
+
+    if not unique:
+        raise HTTPException(
+            status_code=422, detail="No registrations provided."
+        )
+
+    if len(unique) > settings.OFFBOARDING_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                f"Too many registrations: {len(unique)} "
+                f"(maximum {settings.OFFBOARDING_BULK_MAX_ITEMS})."
+            ),
+        )
+
+    return unique
+
+
+def parse_registrations_csv(content: bytes) -> list[str]:
+    """Reads registrations from the first column of a CSV file.
+
+    A header row is skipped when its first cell has no digits.
+
+    Args:
+        content (bytes): Uploaded file content.
+
+    Returns:
+        list[str]: Registrations found, in file order.
+
+    Raises:
+        HTTPException: 422 if the file is not valid UTF-8 text.
+    """
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=422, detail="CSV must be UTF-8 encoded."
+        )
+
+    dialect = csv.excel
+    try:
+        dialect = csv.Sniffer().sniff(text[:1024], delimiters=",;\t")
+    except csv.Error:
+        pass
+
+    registrations = [
+        row[0].strip()
+        for row in csv.reader(io.StringIO(text), dialect)
+        if row and row[0].strip()
+    ]
+
+    if registrations and not any(c.isdigit() for c in registrations[0]):
+        registrations = registrations[1:]
+
+    return registrations
+
+
+async def execute_bulk_offboarding(
+    *,
+    registrations: list[str],
+    current_user,
+    ad_service: ADService,
+    snipeit_service: SnipeItService,
+    req: Request,
+) -> AsyncIterator[BulkOffboardingItem]:
+    """Offboards several employees concurrently, yielding results as they end.
+
+    Each employee goes through execute_offboarding with its own database
+    session, so audit logs and history records match the single path.
+    At most OFFBOARDING_BULK_CONCURRENCY employees run at once. If the
+    caller stops consuming the results, the remaining employees are still
+    offboarded. Notification emails are sent by the same tasks rather than
+    the response's background tasks, which never run if the client
+    disconnects before the stream ends.
+
+    Args:
+        registrations (list[str]): Registrations to offboard, already
+            normalized.
+        current_user: Authenticated user performing the operation.
+        ad_service (ADService): Active Directory service instance.
+        snipeit_service (SnipeItService): Snipe-IT service instance.
+        req (Request): FastAPI request object for audit metadata extraction.
+
+    Yields:
+        BulkOffboardingItem: Outcome of one employee, in completion order.
+    """
+    semaphore = asyncio.Semaphore(
+        max(1, settings.OFFBOARDING_BULK_CONCURRENCY)
+    )
+    total = len(registrations)
+
+    async def run_one(
+        registration: str,
+    ) -> tuple[str, OffboardingResult | None, str | None]:
+        notifications = BackgroundTasks()
+        async with semaphore, async_session_local() as session:
+            try:
+                result = await execute_offboarding(
+                    registration=registration,
+                    current_user=current_user,
+                    ad_service=ad_service,
+                    snipeit_service=snipeit_service,
+                    background_tasks=notifications,
+                    req=req,
+                    session=session,
+                )
+            except HTTPException as e:
+                return registration, None, str(e.detail)
+            except Exception as e:
+                logger.error(
+                    f"Bulk offboarding failed for {registration}: {e}"
+                )
+                return registration, None, str(e)
+
+        try:
+            await notifications()
+        except Exception as e:
+            logger.error(f"Offboarding email for {registration} failed: {e}")
+
+        return registration, result, None
+
+    tasks = [asyncio.create_task(run_one(r)) for r in registrations]
+    for task in tasks:
+        _bulk_tasks.add(task)
+        task.add_done_callback(_bulk_tasks.discard)
+
+    logger.info(f"Bulk offboarding started for {total} registration(s).")
+
+    completions = asyncio.as_completed(tasks)
+    for completed, next_done in enumerate(completions, start=1):
+        registration, result, error = await next_done
+        yield BulkOffboardingItem(
+            registration=registration,
+            completed=completed,
+            total=total,
+            result=result,
+            error=error,
+        )
+
+
 def fetch_offboarding_history(
     session: Db_session,
     *,
@@ -229,7 +934,7 @@ def fetch_offboarding_history(
     page: int = 1,
     limit: int = 20,
 ) -> OffboardingHistoryResponse:
-    """Retrieves paginated offboarding history, delegating to the repository layer.
+    """Retrieves paginated offboarding history from the repository layer.
 
     Args:
         session (Db_session): Active SQLAlchemy database session.
@@ -246,3 +951,29 @@ def fetch_offboarding_history(
         page=page,
         limit=limit,
     )
+
+
+async def fetch_offboarding_history_async(
+    session: AsyncSession,
+    *,
+    registration: str | None = None,
+    page: int = 1,
+    limit: int = 20,
+) -> OffboardingHistoryResponse:
+    """Async variant of fetch_offboarding_history.
+
+    Args:
+        session (AsyncSession): Active async database session.
+        registration (str | None): Optional registration number filter.
+        page (int): Page number, starting at 1.
+        limit (int): Maximum records per page.
+
+    Returns:
+        OffboardingHistoryResponse: Paginated offboarding history.
+    """
+    return await get_offboarding_history_async(
+        session,
+        registration=registration,
+        page=page,
+        limit=limit,
+    )
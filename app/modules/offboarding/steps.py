@@ -0,0 +1,183 @@
+import asyncio
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from app.core.config import settings
+
+from .enums import OffboardingSystem
+
+logger = logging.getLogger(__name__)
+
+# Steps that must wait for others to finish. AD goes last: once the network
+# account is disabled the user is locked out, so it is only done after the
+# other systems have been handled.
+STEP_DEPENDENCIES: dict[OffboardingSystem, frozenset[OffboardingSystem]] = {
+    OffboardingSystem.NETWORK: frozenset({
+        OffboardingSystem.EQUIPMENT,
+        OffboardingSystem.ACCESS,
+        OffboardingSystem.INTOUCH,
+        OffboardingSystem.IFS,
+    }),
+}
+
+
+@dataclass(frozen=True)
+class OffboardingStep:
+    """A single revocation step.
+
+    Attributes:
+        system (OffboardingSystem): System the step revokes access from.
+        run (Callable[[], Awaitable[bool]]): Coroutine factory returning
+            True when access was revoked.
+        after (frozenset[OffboardingSystem]): Steps that must finish first.
+        timeout (float | None): Maximum seconds the step may take.
+    """
+
+    system: OffboardingSystem
+    run: Callable[[], Awaitable[bool]]
+    after: frozenset[OffboardingSystem] = frozenset()
+    timeout: float | None = None
+
+
+def build_step(
+    system: OffboardingSystem,
+    run: Callable[[], Awaitable[bool]],
+) -> OffboardingStep:
+    """Creates a step with the dependencies and timeout configured for it.
+
+    Args:
+        system (OffboardingSystem): System the step revokes access from.
+        run (Callable[[], Awaitable[bool]]): Coroutine factory for the step.
+
+    Returns:
+        OffboardingStep: Step ready to be scheduled.
+    """
+    return OffboardingStep(
+        system=system,
+        run=run,
+        after=STEP_DEPENDENCIES.get(system, frozenset()),
+        timeout=settings.OFFBOARDING_STEP_TIMEOUTS.get(
+            system, settings.OFFBOARDING_STEP_TIMEOUT
+        ),
+    )
+
+
+def _check_acyclic(steps: list[OffboardingStep]) -> None:
+    scheduled = {step.system for step in steps}
+    pending = {step.system: set(step.after & scheduled) for step in steps}
+
+    while pending:
+        ready = [system for system, deps in pending.items() if not deps]
+        if not ready:
+            raise ValueError(
+                f"Circular offboarding step dependencies: {sorted(pending)}"
+            )
+        for system in ready:
+            del pending[system]
+        for deps in pending.values():
+            deps.difference_update(ready)
+
+
+async def _notify(
+    callback: Callable[..., Awaitable[None] | None],
+    system: OffboardingSystem,
+    *args,
+) -> None:
+    # A failing callback must not escape gather() while sibling steps
+    # are still running
+    try:
+        result = callback(system, *args)
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.error(f"Offboarding step {system} callback failed: {e}")
+
+
+async def _run_within(
+    run: Callable[[], Awaitable[bool]], timeout: float | None
+) -> bool:
+    # wait_for would still start the step when no time is left
+    if timeout is not None and timeout <= 0:
+        raise asyncio.TimeoutError
+    return bool(await asyncio.wait_for(run(), timeout))
+
+
+async def run_steps(
+    steps: list[OffboardingStep],
+    *,
+    deadline: float | None = None,
+    on_timeout: Callable[[OffboardingSystem], None] | None = None,
+    on_complete: (
+        Callable[[OffboardingSystem, bool], Awaitable[None] | None] | None
+    ) = None,
+) -> dict[OffboardingSystem, bool]:
+    """Runs offboarding steps concurrently, honouring their dependencies.
+
+    Each step starts as soon as the steps it depends on have finished,
+    whatever their outcome. Dependencies on systems that are not scheduled
+    are ignored. A step that raises or exceeds its timeout, or the global
+    deadline, counts as failed; the others keep running.
+
+    Steps that run blocking work in a thread (e.g. AD) stop being awaited
+    on timeout but the thread itself finishes in the background; the AD
+    step stops its thread before the account is modified.
+
+    Args:
+        steps (list[OffboardingStep]): Steps to execute.
+        deadline (float | None): Seconds for the whole run.
+        on_timeout (Callable[[OffboardingSystem], None] | None): Called
+            with the system of every step that timed out.
+        on_complete (Callable[[OffboardingSystem, bool], Awaitable[None] |
+            None] | None): Called as each step finishes, with its system
+            and outcome; awaited if it is a coroutine function.
+
+    Returns:
+        dict[OffboardingSystem, bool]: Outcome per system, in step order.
+
+    Raises:
+        ValueError: If the step dependencies contain a cycle.
+    """
+    _check_acyclic(steps)
+
+    loop = asyncio.get_running_loop()
+    expires_at = loop.time() + deadline if deadline is not None else None
+    scheduled = {step.system for step in steps}
+    finished = {step.system: asyncio.Event() for step in steps}
+    results: dict[OffboardingSystem, bool] = {}
+
+    def _timeout(step: OffboardingStep) -> float | None:
+        if expires_at is None:
+            return step.timeout
+        remaining = expires_at - loop.time()
+        return (
+            remaining if step.timeout is None
+            else min(step.timeout, remaining)
+        )
+
+    async def _run(step: OffboardingStep) -> None:
+        for dependency in step.after & scheduled:
+            await finished[dependency].wait()
+
+        try:
+            results[step.system] = await _run_within(
+                step.run, _timeout(step)
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Offboarding step {step.system} timed out.")
+            results[step.system] = False
+            if on_timeout is not None:
+                await _notify(on_timeout, step.system)
+        except Exception as e:
+            logger.error(f"Offboarding step {step.system} failed: {e}")
+            results[step.system] = False
+        finally:
+            finished[step.system].set()
+
+        if on_complete is not None:
+            await _notify(on_complete, step.system, results[step.system])
+
+    await asyncio.gather(*(_run(step) for step in steps))
+
+    return {step.system: results[step.system] for step in steps}
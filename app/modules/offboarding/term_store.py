@@ -0,0 +1,162 @@
+import hashlib
+import io
+import logging
+import os
+import re
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from app.core.config import settings
+
+from .schemas import GeneratedTerm
+
+logger = logging.getLogger(__name__)
+
+TERMS_DIR = Path(settings.TERMS_DIR)
+TERMS_DIR.mkdir(parents=True, exist_ok=True)
+TERM_SUFFIX = ".docx"
+CHUNK_SIZE = 64 * 1024
+DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def store_term(content: bytes) -> str:
+    """Writes a term document to the store, named by its SHA-256.
+
+    Identical documents are stored once. Storing an existing document
+    refreshes its modification time, restarting its retention period.
+
+    Args:
+        content (bytes): DOCX document.
+
+    Returns:
+        str: Hex SHA-256 digest identifying the document.
+    """
+    digest = hashlib.sha256(content).hexdigest()
+    path = TERMS_DIR / f"{digest}{TERM_SUFFIX}"
+
+    if path.exists():
+        os.utime(path)
+        return digest
+
+    fd, tmp_name = tempfile.mkstemp(dir=TERMS_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    return digest
+
+
+def term_path(digest: str) -> Path:
+    """Resolves the file of a stored term.
+
+    Args:
+        digest (str): Hex SHA-256 digest returned by store_term.
+
+    Returns:
+        Path: Path of the stored document.
+
+    Raises:
+        ValueError: If the digest is malformed.
+        FileNotFoundError: If the document is not in the store (e.g. expired).
+    """
+    if not DIGEST_RE.match(digest):
+        raise ValueError("Invalid term identifier")
+
+    path = TERMS_DIR / f"{digest}{TERM_SUFFIX}"
+    if not path.is_file():
+        raise FileNotFoundError(digest)
+
+    return path
+
+
+class _ZipSink(io.RawIOBase):
+    """Write-only, non-seekable buffer drained after every chunk.
+
+    zipfile falls back to data descriptors when the output cannot seek,
+    so the archive can be produced strictly front to back.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    @staticmethod
+    def writable() -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_terms_zip(terms: Iterable[GeneratedTerm]) -> Iterator[bytes]:
+    """Streams a ZIP archive of stored terms.
+
+    Documents are read in chunks and emitted as they are added, so
+    neither the documents nor the archive are held in memory. DOCX files
+    are already compressed and are stored without recompression. Terms
+    no longer in the store are skipped.
+
+    Args:
+        terms (Iterable[GeneratedTerm]): Terms to bundle.
+
+    Yields:
+        bytes: Consecutive chunks of the archive.
+    """
+    sink = _ZipSink()
+    with zipfile.ZipFile(
+        sink, mode="w", compression=zipfile.ZIP_STORED
+    ) as archive:
+        for term in terms:
+            try:
+                path = term_path(term.sha256)
+            except (ValueError, FileNotFoundError):
+                logger.warning(f"Term {term.filename} missing from the store.")
+                continue
+
+            with path.open("rb") as source, archive.open(
+                term.filename, mode="w", force_zip64=True
+            ) as dest:
+                while chunk := source.read(CHUNK_SIZE):
+                    dest.write(chunk)
+                    if data := sink.drain():
+                        yield data
+
+    yield sink.drain()
+
+
+def cleanup_term_files() -> int:
+    """Deletes stored terms older than TERMS_RETENTION_DAYS.
+
+    Returns:
+        int: Number of files deleted.
+    """
+    cutoff = time.time() - settings.TERMS_RETENTION_DAYS * 86400
+    deleted = 0
+
+    for file in TERMS_DIR.iterdir():
+        if not file.is_file():
+            continue
+
+        if file.stat().st_mtime < cutoff:
+            file.unlink(missing_ok=True)
+            deleted += 1
+
+    logger.info(f"Term cleanup removed {deleted} file(s)")
+    return deleted
@@ -1,49 +1,162 @@
-from fastapi import Request
-import base64
+import asyncio
 import logging
-import httpx
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Callable
 
-from app.integrations.snipe_it import SnipeItService
-from app.modules.offboarding.schemas import GeneratedTerm
-from app.modules.audit.service import AuditLogCreate, create_audit_log
+import httpx
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.integrations.snipe_it import SnipeItService, snipeit_cache
 from app.modules.audit.enums import AuditAction, AuditStatus
+from app.modules.audit.service import AuditLogCreate, create_audit_log
+from app.modules.offboarding.schemas import GeneratedTerm, OffboardingLookup
+from app.modules.offboarding.term_store import store_term
 
 logger = logging.getLogger(__name__)
 
 
-async def checkin_assets(
+@dataclass(frozen=True)
+class _CheckinContext:
+    """Inputs shared by the checkin of every asset of one employee.
+
+    Attributes:
+        registration (str): Employee registration number.
+        snipeit_service (SnipeItService): Snipe-IT service instance.
+        template_id (int | None): Checkin term template, if configured.
+        term_prefix (str): Start of the generated term file names.
+        note (str): Note recorded with each checkin.
+        semaphore (asyncio.Semaphore): Limits the assets processed at once.
+        audit (Callable[[AuditStatus, str], None]): Records a checkin
+            audit entry.
+    """
+
+    registration: str
+    snipeit_service: SnipeItService
+    template_id: int | None
+    term_prefix: str
+    note: str
+    semaphore: asyncio.Semaphore
+    audit: Callable[[AuditStatus, str], None]
+
+
+async def _generate_term(
+    context: _CheckinContext, asset_tag: str
+) -> GeneratedTerm | None:
+    try:
+        term_bytes = await context.snipeit_service.generate_term(
+            employee_num=context.registration,
+            template_id=context.template_id,
+            asset_tag=asset_tag,
+        )
+    except httpx.HTTPStatusError as e:
+        logger.error(
+            f"HTTP error generating term for {asset_tag}:"
+            f"{e.response.status_code} — {e.response.text}"
+        )
+        return None
+    except Exception as e:
+        logger.error(f"Unexpected error generating term for {asset_tag}: {e}")
+        return None
+
+    try:
+        sha256 = await run_in_threadpool(store_term, term_bytes)
+    except Exception as e:
+        logger.error(f"Could not store the term for {asset_tag}: {e}")
+        return None
+
+    logger.info(f"Term generated for asset {asset_tag}.")
+    return GeneratedTerm(
+        filename=f"{context.term_prefix}_{asset_tag}.docx",
+        sha256=sha256,
+        size=len(term_bytes),
+    )
+
+
+async def _process_asset(
+    context: _CheckinContext, asset: dict
+) -> tuple[bool, GeneratedTerm | None]:
+    asset_tag = asset.get("asset_tag")
+    if not asset_tag:
+        logger.warning(f"Asset without asset_tag ignored: {asset}")
+        return False, None
+
+    async with context.semaphore:
+        term = None
+        if context.template_id is not None:
+            term = await _generate_term(context, asset_tag)
+
+        try:
+            await context.snipeit_service.checkin_asset(
+                registration=context.registration,
+                asset_tag=asset_tag,
+                note=context.note,
+                asset_id=asset.get("id"),
+            )
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"HTTP error checking {asset_tag}: "
+                f"{e.response.status_code} — {e.response.text}"
+            )
+            context.audit(
+                AuditStatus.FAILED, f"Equipment checkin assets error: {e}"
+            )
+            return False, term
+        except Exception as e:
+            context.audit(
+                AuditStatus.FAILED, f"Equipment checkin assets failed: {e}"
+            )
+            logger.error(f"Unexpected error checking {asset_tag}: {e}")
+            return False, term
+
+    logger.info(f"Checkin completed for asset {asset_tag}.")
+    context.audit(
+        AuditStatus.SUCCESS,
+        f"Equipment: Check-in on user {context.registration}'s equipment.",
+    )
+    return True, term
+
+
+# Takes the same keyword arguments as the other use cases, plus lookup
+async def checkin_assets(  # noqa: PLR0913
     *,
     registration: str,
     target_name: str,
     snipeit_service: SnipeItService,
     req: Request,
     session,
-    current_user
+    current_user,
+    lookup: OffboardingLookup | None = None,
 ) -> tuple[bool, list[GeneratedTerm]]:
     """Generates checkin term documents and checks in all assets for the user.
 
-    Fetches the checkin template once, then iterates over every assigned asset.
-    Each asset is processed independently — a failure in one does not stop
-    the others. Both the term generation and the checkin are attempted per asset.
+    Fetches the checkin template once, then processes the assigned assets
+    concurrently, at most SNIPEIT_ASSET_CONCURRENCY at a time. Each asset is
+    processed independently — a failure in one does not stop the others.
+    Both the term generation and the checkin are attempted per asset, and
+    each checkin gets its own audit entry. Terms keep the asset order.
 
     Args:
         registration (str): Employee registration number.
         target_name (str): Full name of the user being offboarded.
         snipeit_service (SnipeItService): Snipe-IT service instance.
+        lookup (OffboardingLookup | None): Discovery result; its asset list is
+            reused instead of fetching the assets again.
 
     Returns:
         tuple[bool, list[GeneratedTerm]]: Success flag and list of generated
-            term documents encoded in Base64.
+            term documents, written to the term store.
     """
-    generated_terms: list[GeneratedTerm] = []
-    any_success = False
-
-    try:
-        assets = await snipeit_service.search_assets_by_user(registration)
-    except Exception as e:
-        logger.error(f"Failed to retrieve assets from {registration}: {e}")
-        return False, []
+    if lookup is not None and lookup.snipeit_user is not None:
+        assets = lookup.assets
+    else:
+        try:
+            assets = await snipeit_service.search_assets_by_user(registration)
+        except Exception as e:
+            logger.error(f"Failed to retrieve assets from {registration}: {e}")
+            return False, []
 
     if not assets:
         logger.info(f"No assets found for {registration}.")
@@ -58,95 +171,41 @@ async def checkin_assets(
     current_date = datetime.now().strftime("%Y%m%d_%H%M")
     format_name = target_name.replace(" ", "_")
 
-    for asset in assets:
-        asset_tag = asset.get("asset_tag")
-        if not asset_tag:
-            logger.warning(f"Asset without asset_tag ignored: {asset}")
-            continue
-
-        if template_id is not None:
-            try:
-                term_bytes = await snipeit_service.generate_term(
-                    employee_num=registration,
-                    template_id=template_id,
-                    asset_tag=asset_tag,
-                )
-                filename = f"{registration}_{format_name}_{current_date}_{asset_tag}.docx"
-                generated_terms.append(
-                    GeneratedTerm(
-                        filename=filename,
-                        content_base64=base64.b64encode(term_bytes).decode("utf-8"),
-                    )
-                )
-                logger.info(f"Term generated for asset {asset_tag}.")
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP error generating term for {asset_tag}:"
-                    f"{e.response.status_code} — {e.response.text}"
-                )
-            except Exception as e:
-                logger.error(f"Unexpected error generating term for {asset_tag}: {e}")
-
-        try:
-            await snipeit_service.checkin_asset(
-                registration=registration,
-                asset_tag=asset_tag,
-                note=f"Automatic offboarding — {current_date}",
-            )
-            logger.info(f"Checkin completed for asset {asset_tag}.")
-            any_success = True
-
-            create_audit_log(
-                    session,
-                    AuditLogCreate(
-                        action=AuditAction.CHECKIN_ASSET,
-                        status=AuditStatus.SUCCESS,
-                        message=f"Equipment: Check-in on user {registration}'s equipment.",
-                        user_id=current_user.id,
-                        username=current_user.username,
-                        target_username=target_name,
-                        target_registration=registration,
-                        resource=registration,
-                        ip_address=req.client.host if req.client else None,
-                        user_agent=req.headers.get("user-agent"),
-                    ),
-                )
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                f"HTTP error checking {asset_tag}: "
-                f"{e.response.status_code} — {e.response.text}"
-            )
-            create_audit_log(
-                    session,
-                    AuditLogCreate(
-                        action=AuditAction.CHECKIN_ASSET,
-                        status=AuditStatus.FAILED,
-                        message=f"Equipment checkin assets error: {e}",
-                        user_id=current_user.id,
-                        username=current_user.username,
-                        target_username=target_name,
-                        target_registration=registration,
-                        resource=registration,
-                        ip_address=req.client.host if req.client else None,
-                        user_agent=req.headers.get("user-agent"),
-                    ),
-                )
-        except Exception as e:
-            create_audit_log(
-                    session,
-                    AuditLogCreate(
-                        action=AuditAction.CHECKIN_ASSET,
-                        status=AuditStatus.FAILED,
-                        message=f"Equipment checkin assets failed: {e}",
-                        user_id=current_user.id,
-                        username=current_user.username,
-                        target_username=target_name,
-                        target_registration=registration,
-                        resource=registration,
-                        ip_address=req.client.host if req.client else None,
-                        user_agent=req.headers.get("user-agent"),
-                    ),
-                )
-            logger.error(f"Unexpected error checking {asset_tag}: {e}")
-
+    def audit(status: AuditStatus, message: str) -> None:
+        create_audit_log(
+            session,
+            AuditLogCreate(
+                action=AuditAction.CHECKIN_ASSET,
+                status=status,
+                message=message,
+                user_id=current_user.id,
+                username=current_user.username,
+                target_username=target_name,
+                target_registration=registration,
+                resource=registration,
+                ip_address=req.client.host if req.client else None,
+                user_agent=req.headers.get("user-agent"),
+            ),
+        )
+
+    context = _CheckinContext(
+        registration=registration,
+        snipeit_service=snipeit_service,
+        template_id=template_id,
+        term_prefix=f"{registration}_{format_name}_{current_date}",
+        note=f"Automatic offboarding — {current_date}",
+        semaphore=asyncio.Semaphore(
+            max(1, settings.SNIPEIT_ASSET_CONCURRENCY)
+        ),
+        audit=audit,
+    )
+
+    results = await asyncio.gather(
+        *(_process_asset(context, asset) for asset in assets)
+    )
+
+    generated_terms = [term for _, term in results if term is not None]
+    any_success = any(checked_in for checked_in, _ in results)
+
+    logger.debug(f"Snipe-IT cache stats: {snipeit_cache.stats()}")
     return any_success, generated_terms
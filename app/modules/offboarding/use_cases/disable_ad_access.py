@@ -1,12 +1,16 @@
 # app/modules/offboarding/use_cases/disable_ad_account.py
 
+import asyncio
 import logging
+import threading
+
 from fastapi import Request
 from fastapi.concurrency import run_in_threadpool
 
 from app.integrations.active_directory import ADService, DisableUserRequest
-from app.modules.audit.service import AuditLogCreate, create_audit_log
 from app.modules.audit.enums import AuditAction, AuditStatus
+from app.modules.audit.service import AuditLogCreate, create_audit_log
+from app.modules.offboarding.schemas import OffboardingLookup
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +23,7 @@ async def disable_ad_account(
     ad_service: ADService,
     session,
     req: Request,
+    lookup: OffboardingLookup | None = None,
 ) -> bool:
     """Disables the user account in Active Directory and logs the audit result.
 
@@ -29,6 +34,8 @@ async def disable_ad_account(
         ad_service (ADService): Active Directory service instance.
         session: Active SQLAlchemy database session.
         req (Request): FastAPI request object for IP and user-agent extraction.
+        lookup (OffboardingLookup | None): Discovery result; its AD entry is
+            reused instead of searching again.
 
     Returns:
         bool: True if the account was disabled or was already disabled, False on failure.
@@ -38,7 +45,19 @@ async def disable_ad_account(
             registration=registration,
             performed_by=current_user.username,
         )
-        result = await run_in_threadpool(ad_service.disable_user, payload)
+        cancelled = threading.Event()
+        try:
+            result = await run_in_threadpool(
+                ad_service.disable_user,
+                payload,
+                user=lookup.ad_user if lookup else None,
+                cancelled=cancelled,
+            )
+        except asyncio.CancelledError:
+            # The step timed out: the thread keeps running, but must not
+            # disable the account once the step was audited as failed
+            cancelled.set()
+            raise
 
         if result.action in ("disabled", "already_disabled"):
             if result.action == "already_disabled":
@@ -47,12 +66,22 @@ async def disable_ad_account(
                     "reported active but found already disabled."
                 )
             else:
+                failed_steps = [s for s in result.steps if not s.success]
+                message = f"Network: User {registration} deactivated from AD."
+                if failed_steps:
+                    message += " Incomplete steps: " + "; ".join(
+                        f"{s.step} ({s.message})" for s in failed_steps
+                    )
+
                 create_audit_log(
                     session,
                     AuditLogCreate(
                         action=AuditAction.DISABLE_AD_USER,
-                        status=AuditStatus.SUCCESS,
-                        message=f"Network: User {registration} deactivated from AD.",
+                        status=(
+                            AuditStatus.PARTIAL if failed_steps
+                            else AuditStatus.SUCCESS
+                        ),
+                        message=message,
                         user_id=current_user.id,
                         username=current_user.username,
                         target_username=target_username,
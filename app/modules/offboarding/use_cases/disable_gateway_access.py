@@ -1,11 +1,12 @@
 # app/modules/offboarding/use_cases/revoke_gate_access.py
 
 import logging
+
 from fastapi import Request
 
 from app.integrations.gate import deactivate_user_turnstiles
-from app.modules.audit.service import AuditLogCreate, create_audit_log
 from app.modules.audit.enums import AuditAction, AuditStatus
+from app.modules.audit.service import AuditLogCreate, create_audit_log
 
 logger = logging.getLogger(__name__)
 
@@ -28,28 +29,55 @@ async def disable_gateway_access(
         req (Request): FastAPI request object for IP and user-agent extraction.
 
     Returns:
-        bool: True if access was revoked successfully, False otherwise.
+        bool: True if access was revoked on every turnstile, False if any
+            device failed.
     """
     try:
         result = await deactivate_user_turnstiles(registration=registration)
 
-        if result.get("success"):
-            create_audit_log(
-                session,
-                AuditLogCreate(
-                    action=AuditAction.DISABLE_TURNSTILE_USER,
-                    status=AuditStatus.SUCCESS,
-                    message=f"Gateway: User {registration} blocked in all turnstiles.",
-                    user_id=current_user.id,
-                    username=current_user.username,
-                    target_username=target_username,
-                    target_registration=registration,
-                    resource=registration,
-                    ip_address=req.client.host if req.client else None,
-                    user_agent=req.headers.get("user-agent"),
-                ),
+        if result.error:
+            raise RuntimeError(result.error)
+
+        failed = result.failed_devices
+        if not failed:
+            status = AuditStatus.SUCCESS
+            message = (
+                f"Gateway: User {registration} blocked in all turnstiles."
+            )
+        else:
+            status = (
+                AuditStatus.PARTIAL if result.partial
+                else AuditStatus.FAILED
+            )
+            message = (
+                f"Gateway: User {registration} not blocked in: "
+                + "; ".join(f"{d.name} ({d.error})" for d in failed)
+            )
+
+        logger.info(
+            f"Gateway results for {registration}: "
+            + ", ".join(
+                f"{d.name}={d.status_code} in {d.latency_ms:.0f}ms"
+                for d in result.devices.values()
             )
-            return True
+        )
+
+        create_audit_log(
+            session,
+            AuditLogCreate(
+                action=AuditAction.DISABLE_TURNSTILE_USER,
+                status=status,
+                message=message,
+                user_id=current_user.id,
+                username=current_user.username,
+                target_username=target_username,
+                target_registration=registration,
+                resource=registration,
+                ip_address=req.client.host if req.client else None,
+                user_agent=req.headers.get("user-agent"),
+            ),
+        )
+        return result.success
 
     except Exception as e:
         logger.error(f"Gate error for {registration}: {e}")
@@ -1,9 +1,11 @@
 import logging
+
 from fastapi import Request
 
 from app.integrations.intouch import service as intouch_service
-from app.modules.audit.service import AuditLogCreate, create_audit_log
 from app.modules.audit.enums import AuditAction, AuditStatus
+from app.modules.audit.service import AuditLogCreate, create_audit_log
+from app.modules.offboarding.schemas import OffboardingLookup
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,7 @@ async def disable_intouch_access(
     target_username: str,
     session,
     req: Request,
+    lookup: OffboardingLookup | None = None,
 ) -> bool:
     """Deactivates the user in the InTouch (Staffbase) platform and logs the result.
 
@@ -24,12 +27,16 @@ async def disable_intouch_access(
         target_username (str): Display name of the user being offboarded.
         session: Active SQLAlchemy database session.
         req (Request): FastAPI request object for IP and user-agent extraction.
+        lookup (OffboardingLookup | None): Discovery result; its InTouch user
+            is reused instead of searching again.
 
     Returns:
         bool: True if deactivation succeeded, False otherwise.
     """
     try:
-        result = await intouch_service.deactivate_user_intouch(registration)
+        result = await intouch_service.deactivate_user_intouch(
+            registration, user=lookup.intouch_user if lookup else None
+        )
 
         status = AuditStatus.SUCCESS if result.success else AuditStatus.FAILED
         message = result.message if result.success else result.error
@@ -0,0 +1,171 @@
+import asyncio
+import logging
+import os
+import socket
+import uuid
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+
+from .repository import claim_offboarding_job, renew_offboarding_job_lease
+from .service import run_offboarding_job
+
+logger = logging.getLogger(__name__)
+
+
+class OffboardingJobWorkers:
+    """Pool of asyncio workers executing queued offboarding jobs.
+
+    Workers poll the offboarding_jobs table, claim one job at a time and
+    renew the claim while it runs. A job whose worker died (restart,
+    crash) becomes claimable again once its lease expires and resumes
+    from its last completed step.
+
+    Args:
+        size (int): Number of jobs executed at the same time.
+        poll_interval (float): Seconds between polls when the queue is empty.
+        lease (float): Seconds a claim stays valid without being renewed.
+    """
+
+    def __init__(self, *, size: int, poll_interval: float, lease: float):
+        self.size = max(1, size)
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self._tasks: list[asyncio.Task] = []
+        self._stopping: asyncio.Event | None = None
+
+    async def start(self) -> None:
+        """Starts the workers on the running event loop."""
+        self._stopping = asyncio.Event()
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks = [
+            asyncio.create_task(self._work(f"{prefix}:{index}"))
+            for index in range(self.size)
+        ]
+        logger.info(f"{self.size} offboarding worker(s) started")
+
+    async def stop(self) -> None:
+        """Stops the workers.
+
+        Jobs still running are interrupted and resumed by the next worker
+        that claims them after their lease expires.
+        """
+        if self._stopping is None:
+            return
+
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Offboarding workers stopped")
+
+    async def _work(self, worker_id: str) -> None:
+        while not self._stopping.is_set():
+            try:
+                claimed = await self._run_next(worker_id)
+            except Exception as e:
+                logger.error(f"Offboarding worker {worker_id} error: {e}")
+                claimed = False
+
+            if not claimed:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), self.poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _run_next(self, worker_id: str) -> bool:
+        # The job is read on the event loop between the commits that
+        # run_offboarding_job makes in threads, so it must not expire
+        session = SessionLocal(expire_on_commit=False)
+        try:
+            job = await run_in_threadpool(
+                claim_offboarding_job,
+                session,
+                worker_id=worker_id,
+                lease=self.lease,
+            )
+            if job is None:
+                return False
+
+            logger.info(
+                f"Worker {worker_id} running offboarding job {job.id} "
+                f"(attempt {job.attempts})"
+            )
+            run = asyncio.create_task(run_offboarding_job(session, job))
+            heartbeat = asyncio.create_task(
+                self._renew_lease(job.id, job.attempts, worker_id, run)
+            )
+            try:
+                await run
+            except asyncio.CancelledError:
+                lost = (
+                    heartbeat.done()
+                    and not heartbeat.cancelled()
+                    and heartbeat.result()
+                )
+                if not lost:
+                    raise
+            finally:
+                heartbeat.cancel()
+            return True
+        finally:
+            session.close()
+
+    async def _renew_lease(
+        self,
+        job_id: uuid.UUID,
+        attempt: int,
+        worker_id: str,
+        run: asyncio.Task,
+    ) -> bool:
+        """Renews the claim on a job until cancelled.
+
+        A renewal that fails is retried on the next beat; the lease lasts
+        three beats. If another worker took the job over, run is
+        cancelled so the same employee is not offboarded twice at once.
+
+        Returns:
+            bool: True if the lease was lost and run cancelled.
+        """
+        while True:
+            await asyncio.sleep(self.lease / 3)
+            try:
+                renewed = await run_in_threadpool(
+                    self._renew, job_id, attempt, worker_id
+                )
+            except Exception as e:
+                logger.error(
+                    f"Worker {worker_id} could not renew the lease on job "
+                    f"{job_id}: {e}"
+                )
+                continue
+
+            if not renewed:
+                logger.warning(
+                    f"Worker {worker_id} lost the lease on job {job_id}, "
+                    "stopping it"
+                )
+                run.cancel()
+                return True
+
+    @staticmethod
+    def _renew(job_id: uuid.UUID, attempt: int, worker_id: str) -> bool:
+        session = SessionLocal()
+        try:
+            return renew_offboarding_job_lease(
+                session, job_id, worker_id, attempt=attempt
+            )
+        finally:
+            session.close()
+
+
+offboarding_workers = OffboardingJobWorkers(
+    size=settings.OFFBOARDING_JOB_WORKERS,
+    poll_interval=settings.OFFBOARDING_JOB_POLL_INTERVAL,
+    lease=settings.OFFBOARDING_JOB_LEASE,
+)
@@ -1,12 +1,11 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import (
-    DateTime, Enum, ForeignKey, String, Text, func
-)
+from sqlalchemy import DateTime, ForeignKey, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.modules.users.model import SqliteUUID, table_registry
+
 from .enums import FieldType, ItemStatus, OnboardingStatus
 
 
@@ -1,12 +1,12 @@
-from sqlalchemy import select, func
+from datetime import datetime
+
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from .enums import ItemStatus, OnboardingStatus
 from .model import OnboardingChecklist, OnboardingField, OnboardingItem
 from .schemas import ChecklistCreate, ChecklistListResponse, ChecklistSummary
 
-from datetime import datetime
-
 
 def create_checklist(
     session: Session,
@@ -1,10 +1,11 @@
 import logging
+
 from fastapi import APIRouter, HTTPException, Query, Request
 
-from app.modules.users import Current_user
 from app.core.database import Db_session
+from app.modules.users import Current_user
 
-from .enums import ItemStatus, OnboardingStatus
+from .enums import OnboardingStatus
 from .schemas import (
     ChecklistCreate,
     ChecklistListResponse,
@@ -1,12 +1,13 @@
 from datetime import datetime
 from uuid import UUID
+
 from pydantic import BaseModel, Field
 
 from .enums import FieldType, ItemStatus, OnboardingStatus
 
-
 # Free fields
 
+
 class FieldCreate(BaseModel):
     """Payload to define a free-form field during checklist creation."""
 
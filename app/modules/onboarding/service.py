@@ -1,10 +1,12 @@
-from fastapi import Request
 import logging
+
+from fastapi import Request
 from sqlalchemy.orm import Session
-from app.modules.audit.service import create_audit_log
-from app.modules.audit.schemas import AuditLogCreate
+
 from app.modules.audit.enums import AuditAction, AuditStatus
-from app.modules.users import Current_user
+from app.modules.audit.schemas import AuditLogCreate
+from app.modules.audit.service import create_audit_log
+
 from .enums import ItemStatus, OnboardingStatus
 from .repository import (
     complete_item,
@@ -1,7 +1,8 @@
-from .model import SqliteUUID
 from .email_actions import EmailActions
+from .model import SqliteDateTime, SqliteUUID
 
 __all__ = [
+    "SqliteDateTime",
     "SqliteUUID",
     "EmailActions"
 ]
@@ -4,10 +4,9 @@ from datetime import datetime
 from email.message import EmailMessage
 from zoneinfo import ZoneInfo
 
-from .email_actions import EmailActions
 from app.core import settings
 
-
+from .email_actions import EmailActions
 
 
 async def send_email(
@@ -16,8 +15,8 @@ async def send_email(
     user_target: str,
     performed_by: str = "System",
     systems_list: list | None = None
-   
-    
+
+
     ):
     now = datetime.now(ZoneInfo("America/Sao_Paulo")).strftime(
         "%d/%m/%Y %H:%M:%S"
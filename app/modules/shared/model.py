@@ -1,5 +1,7 @@
 import uuid
-from sqlalchemy import BLOB
+
+from sqlalchemy import BLOB, DateTime
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.types import TypeDecorator
 
 
@@ -18,3 +20,27 @@ class SqliteUUID(TypeDecorator):
         if value is None:
             return None
         return uuid.UUID(bytes=value)
+
+
+class SqliteDateTime(TypeDecorator):
+    """Timezone-aware DateTime, stored on SQLite like CURRENT_TIMESTAMP.
+
+    SQLite compares datetimes as text. Bound values carry microseconds
+    ("2026-01-01 10:00:00.000000") while server defaults do not
+    ("2026-01-01 10:00:00"), so equal instants never compare equal and
+    keyset comparisons skip or repeat rows. Storing whole seconds keeps
+    both forms identical; other databases keep full precision.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):  # noqa: PLR6301
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(sqlite.DATETIME(
+                storage_format=(
+                    "%(year)04d-%(month)02d-%(day)02d "
+                    "%(hour)02d:%(minute)02d:%(second)02d"
+                )
+            ))
+        return dialect.type_descriptor(DateTime(timezone=True))
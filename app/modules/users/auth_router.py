@@ -1,18 +1,19 @@
 from http import HTTPStatus
 
 from fastapi import APIRouter, HTTPException, Request
+from slowapi import Limiter
 
-from app.core.database import Db_session
-from app.modules.audit.enums import AuditAction, AuditStatus
-from app.modules.users.model import User
-from app.modules.audit.schemas import AuditLogCreate
 from app.core import (
     create_access_token,
     verify_password,
 )
-from .deps import Form_data, Current_user
+from app.core.database import Db_session
+from app.modules.audit.enums import AuditAction, AuditStatus
+from app.modules.audit.schemas import AuditLogCreate
 from app.modules.audit.service import create_audit_log
-from slowapi import Limiter
+from app.modules.users.repository import get_user_by_username
+
+from .deps import Current_user, Form_data
 
 
 def get_client_ip(request: Request) -> str:
@@ -37,7 +38,7 @@ def login(
     request: Request,
     form_data: Form_data,
 ):
-    user = db.query(User).filter(User.username == form_data.username).first()
+    user = get_user_by_username(db, form_data.username)
     if not user or not verify_password(form_data.password, user.password):
         create_audit_log(
             db,
@@ -5,9 +5,11 @@ from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jwt import ExpiredSignatureError, InvalidTokenError, decode
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db
+
 from .model import User
-from app.core.config import settings
+from .repository import get_user_by_username
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -37,7 +39,7 @@ def get_current_user(
     except InvalidTokenError:
         raise credentials_exception
 
-    user = db.query(User).filter(User.username == username).first()
+    user = get_user_by_username(db, username)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
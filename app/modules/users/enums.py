@@ -1,5 +1,6 @@
 from enum import IntEnum
 
+
 class UserRole(IntEnum):
     ADMIM = 1
     EDITOR = 2
@@ -1,14 +1,13 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import BLOB, Boolean, DateTime, Integer, String, func
+from sqlalchemy import Boolean, DateTime, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.types import TypeDecorator
+
 from app.core import table_registry
 from app.modules.shared import SqliteUUID
-from .enums import UserRole
-
 
+from .enums import UserRole
 
 
 @table_registry.mapped_as_dataclass
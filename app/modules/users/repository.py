@@ -0,0 +1,53 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .model import User
+
+
+def get_user_by_username(session: Session, username: str) -> User | None:
+    """Finds a user by username.
+
+    Args:
+        session (Session): Active SQLAlchemy database session.
+        username (str): Username to look up.
+
+    Returns:
+        User | None: The user, or None if there is none with that name.
+    """
+    return session.scalar(select(User).where(User.username == username))
+
+
+async def get_user_by_username_async(
+    session: AsyncSession, username: str
+) -> User | None:
+    """Async variant of get_user_by_username.
+
+    Args:
+        session (AsyncSession): Active async database session.
+        username (str): Username to look up.
+
+    Returns:
+        User | None: The user, or None if there is none with that name.
+    """
+    return await session.scalar(
+        select(User).where(User.username == username)
+    )
+
+
+async def list_users_async(
+    session: AsyncSession, *, offset: int, limit: int
+) -> list[User]:
+    """Returns a page of users.
+
+    Args:
+        session (AsyncSession): Active async database session.
+        offset (int): Users to skip.
+        limit (int): Maximum users returned.
+
+    Returns:
+        list[User]: The users of the page.
+    """
+    return list(
+        await session.scalars(select(User).offset(offset).limit(limit))
+    )
@@ -1,41 +1,47 @@
 from http import HTTPStatus
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.security import OAuth2PasswordBearer
 from jwt import ExpiredSignatureError, InvalidTokenError, decode
 from sqlalchemy import select
-from uuid import UUID
-from app.core.database import Db_session
+
+from app.core import get_password_hash
+from app.core.config import settings
+from app.core.database import AsyncDb_session, Db_session
 from app.modules.audit.enums import AuditAction, AuditStatus
 from app.modules.audit.schemas import AuditLogCreate
+from app.modules.audit.service import (
+    create_audit_log,
+    create_audit_log_async,
+)
+
+from .deps import Current_user, Editor_user, Token
 from .model import User
+from .repository import get_user_by_username_async, list_users_async
 from .schemas import (
     FilterPage,
     UserCreate,
-    UserUpdate,
     UserList,
     UserPublic,
+    UserUpdate,
 )
-from app.core import get_password_hash
-from .deps import Token, Current_user, Editor_user
-from app.core.config import settings
-from app.modules.audit.service import create_audit_log
 
 router = APIRouter(prefix="/users", tags=["Users"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
 @router.get("/", response_model=UserList)
-def list_users(
-    session: Db_session,
+async def list_users(
+    session: AsyncDb_session,
     current_user: Current_user,
     filter_users: Annotated[FilterPage, Query()],
     request: Request
 ):
-    users = session.scalars(
-        select(User).offset(filter_users.offset).limit(filter_users.limit)
-    ).all()
+    users = await list_users_async(
+        session, offset=filter_users.offset, limit=filter_users.limit
+    )
 
     return {"users": users}
 
@@ -227,9 +233,9 @@ def update_user(
 
 
 @router.get("/me", response_model=UserPublic)
-def read_users_me(
+async def read_users_me(
     token: Token,
-    session: Db_session,
+    session: AsyncDb_session,
     current_user: Current_user,
     request: Request
 ):
@@ -244,7 +250,7 @@ def read_users_me(
                 detail="Invalid authentication token",
             )
     except ExpiredSignatureError:
-        create_audit_log(
+        await create_audit_log_async(
             session,
             AuditLogCreate(
                 action=AuditAction.READ_CURRENT_USER,
@@ -262,7 +268,7 @@ def read_users_me(
             detail="Token has expired",
         )
     except InvalidTokenError:
-        create_audit_log(
+        await create_audit_log_async(
             session,
             AuditLogCreate(
                 action=AuditAction.READ_CURRENT_USER,
@@ -280,9 +286,9 @@ def read_users_me(
             detail="Invalid authentication token",
         )
 
-    user = session.query(User).filter(User.username == username).first()
+    user = await get_user_by_username_async(session, username)
     if not user:
-        create_audit_log(
+        await create_audit_log_async(
             session,
             AuditLogCreate(
                 action=AuditAction.READ_CURRENT_USER,
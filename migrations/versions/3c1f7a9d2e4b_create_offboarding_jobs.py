@@ -0,0 +1,78 @@
+"""create_offboarding_jobs
+
+Revision ID: 3c1f7a9d2e4b
+Revises: fb3de63d89e3
+Create Date: 2026-10-18 10:12:41.503127
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.modules.shared import SqliteUUID
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f7a9d2e4b'
+down_revision: Union[str, Sequence[str], None] = 'fb3de63d89e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('offboarding_jobs',
+    sa.Column('registration', sa.String(length=50), nullable=False),
+    sa.Column('requested_by_id', SqliteUUID(), nullable=False),
+    sa.Column('ip_address', sa.String(length=100), nullable=True),
+    sa.Column('user_agent', sa.String(length=255), nullable=True),
+    sa.Column('target_username', sa.String(length=100), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('completed_steps', sa.Text(), nullable=False),
+    sa.Column('terms', sa.Text(), nullable=False),
+    sa.Column('result', sa.Text(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=True),
+    sa.Column('locked_by', sa.String(length=100), nullable=True),
+    sa.Column('locked_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column(
+        'created_at', sa.DateTime(),
+        server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False
+    ),
+    sa.Column(
+        'updated_at', sa.DateTime(),
+        server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False
+    ),
+    sa.Column('id', SqliteUUID(), nullable=False),
+    sa.ForeignKeyConstraint(['requested_by_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        op.f('ix_offboarding_jobs_next_attempt_at'),
+        'offboarding_jobs', ['next_attempt_at'], unique=False
+    )
+    op.create_index(
+        op.f('ix_offboarding_jobs_registration'),
+        'offboarding_jobs', ['registration'], unique=False
+    )
+    op.create_index(
+        op.f('ix_offboarding_jobs_status'),
+        'offboarding_jobs', ['status'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f('ix_offboarding_jobs_status'), table_name='offboarding_jobs'
+    )
+    op.drop_index(
+        op.f('ix_offboarding_jobs_registration'), table_name='offboarding_jobs'
+    )
+    op.drop_index(
+        op.f('ix_offboarding_jobs_next_attempt_at'),
+        table_name='offboarding_jobs'
+    )
+    op.drop_table('offboarding_jobs')
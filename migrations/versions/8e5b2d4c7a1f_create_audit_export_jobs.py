@@ -0,0 +1,56 @@
+"""create_audit_export_jobs
+
+Revision ID: 8e5b2d4c7a1f
+Revises: 3c1f7a9d2e4b
+Create Date: 2026-10-18 14:37:09.218446
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.modules.shared import SqliteUUID
+
+# revision identifiers, used by Alembic.
+revision: str = '8e5b2d4c7a1f'
+down_revision: Union[str, Sequence[str], None] = '3c1f7a9d2e4b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('audit_export_jobs',
+    sa.Column('id', SqliteUUID(), nullable=False),
+    sa.Column('format', sa.String(length=10), nullable=False),
+    sa.Column('filters', sa.Text(), nullable=False),
+    sa.Column('filters_hash', sa.String(length=64), nullable=False),
+    sa.Column('filename', sa.String(length=100), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('rows_written', sa.Integer(), nullable=False),
+    sa.Column('bytes_written', sa.Integer(), nullable=False),
+    sa.Column('duration', sa.Float(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('requested_by_id', SqliteUUID(), nullable=True),
+    sa.Column(
+        'created_at', sa.DateTime(),
+        server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False
+    ),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        op.f('ix_audit_export_jobs_filters_hash'),
+        'audit_export_jobs', ['filters_hash'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f('ix_audit_export_jobs_filters_hash'),
+        table_name='audit_export_jobs'
+    )
+    op.drop_table('audit_export_jobs')
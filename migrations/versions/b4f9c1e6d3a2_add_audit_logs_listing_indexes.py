@@ -0,0 +1,44 @@
+"""add_audit_logs_listing_indexes
+
+Revision ID: b4f9c1e6d3a2
+Revises: 8e5b2d4c7a1f
+Create Date: 2026-10-18 15:52:27.640913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4f9c1e6d3a2'
+down_revision: Union[str, Sequence[str], None] = '8e5b2d4c7a1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_audit_logs_created_at_id',
+        'audit_logs', ['created_at', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_audit_logs_action_created_at',
+        'audit_logs', ['action', 'created_at', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_audit_logs_status_created_at',
+        'audit_logs', ['status', 'created_at', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_audit_logs_username_created_at',
+        'audit_logs', ['username', 'created_at', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_audit_logs_username_created_at', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_status_created_at', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_action_created_at', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_created_at_id', table_name='audit_logs')
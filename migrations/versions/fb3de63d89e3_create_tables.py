@@ -7,10 +7,10 @@ Create Date: 2026-05-26 14:04:09.334855
 """
 from typing import Sequence, Union
 
-from app.modules.shared import SqliteUUID
-from alembic import op
 import sqlalchemy as sa
+from alembic import op
 
+from app.modules.shared import SqliteUUID
 
 # revision identifiers, used by Alembic.
 revision: str = 'fb3de63d89e3'
@@ -18,6 +18,7 @@ down_revision: Union[str, Sequence[str], None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+
 def upgrade() -> None:
     """Upgrade schema."""
     # ### commands auto generated by Alembic - please adjust! ###
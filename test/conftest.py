@@ -1,6 +1,18 @@
+import os
+import tempfile
+
 import pytest
 
-from .database import SessionLocalTest
+# The app builds its engine at import time, so one must be configured
+# before anything under app/ is imported
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite:///{os.path.join(tempfile.gettempdir(), 'offboarding-test.db')}",
+)
+
+from app.core.database import table_registry  # noqa: E402
+
+from .database import SessionLocalTest, engine_test  # noqa: E402
 
 
 @pytest.fixture
@@ -10,3 +22,6 @@ def session():
         yield db
     finally:
         db.close()
+        # The in-memory database outlives the test; start the next one empty
+        table_registry.metadata.drop_all(bind=engine_test)
+        table_registry.metadata.create_all(bind=engine_test)
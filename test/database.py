@@ -1,7 +1,11 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.models import table_registry
+from app.core.database import table_registry
+from app.modules.audit.model import *  # noqa
+from app.modules.offboarding.model import *  # noqa
+from app.modules.onboarding.model import *  # noqa
+from app.modules.users.model import *  # noqa
 
 TEST_SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
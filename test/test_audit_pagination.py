@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.modules.audit.enums import AuditAction, AuditStatus
+from app.modules.audit.model import AuditLog
+from app.modules.audit.schemas import AuditLogListFilters
+from app.modules.audit.service import fetch_audit_logs
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def logs(session):
+    # Pairs of logs share a timestamp, so pages must break ties on id
+    session.add_all([
+        AuditLog(
+            action=(
+                AuditAction.SYSTEM_LOGIN if i % 3
+                else AuditAction.SYSTEM_LOGOUT
+            ),
+            status=AuditStatus.SUCCESS,
+            username=f"user{i}",
+            created_at=START + timedelta(minutes=i // 2),
+        )
+        for i in range(25)
+    ])
+    session.commit()
+
+
+def _walk_cursor(session, **filters):
+    ids = []
+    cursor = ""
+    while cursor is not None:
+        page = fetch_audit_logs(
+            session,
+            filters=AuditLogListFilters(cursor=cursor, limit=4, **filters),
+        )
+        ids += [item["id"] for item in page.items]
+        cursor = page.next_cursor
+    return ids
+
+
+def _walk_offset(session, **filters):
+    page = fetch_audit_logs(
+        session, filters=AuditLogListFilters(limit=100, **filters)
+    )
+    return [item["id"] for item in page.items]
+
+
+@pytest.mark.usefixtures("logs")
+def test_cursor_pages_match_offset_order(session):
+    ids = _walk_cursor(session)
+
+    assert ids == _walk_offset(session)
+    assert len(ids) == len(set(ids)) == 25  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("logs")
+def test_cursor_pages_keep_filters(session):
+    filters = {"action": AuditAction.SYSTEM_LOGOUT}
+
+    assert _walk_cursor(session, **filters) == _walk_offset(
+        session, **filters
+    )
+
+
+@pytest.mark.usefixtures("logs")
+def test_last_cursor_page_has_no_next_cursor(session):
+    page = fetch_audit_logs(
+        session, filters=AuditLogListFilters(cursor="", limit=25)
+    )
+
+    assert len(page.items) == 25  # noqa: PLR2004
+    assert page.next_cursor is None
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "WzFd", "bnVsbA=="])
+def test_invalid_cursor_is_rejected(session, cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        fetch_audit_logs(session, filters=AuditLogListFilters(cursor=cursor))
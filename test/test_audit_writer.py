@@ -0,0 +1,165 @@
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import table_registry
+from app.modules.audit import writer as writer_module
+from app.modules.audit.enums import AuditAction, AuditStatus
+from app.modules.audit.model import AuditLog
+from app.modules.audit.writer import AuditLogWriter
+
+
+@pytest.fixture
+def writer_db(monkeypatch):
+    # The writer thread needs to see the same in-memory database
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    table_registry.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(writer_module, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    sizes = []
+    write = AuditLogWriter._write
+
+    def recording_write(self, batch):
+        sizes.append(len(batch))
+        write(self, batch)
+
+    monkeypatch.setattr(AuditLogWriter, "_write", recording_write)
+    return sizes
+
+
+def _log(i: int) -> dict:
+    return {
+        "action": AuditAction.LIST_USERS,
+        "status": AuditStatus.SUCCESS,
+        "username": f"user{i}",
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+def _count(factory) -> int:
+    with factory() as session:
+        return session.scalar(select(func.count()).select_from(AuditLog))
+
+
+def test_submit_is_refused_when_writer_not_running():
+    writer = AuditLogWriter(batch_size=10, flush_interval=1, max_queue=10)
+
+    assert not writer.submit(_log(0))
+
+
+def test_logs_are_written_in_batches(writer_db, batches):
+    writer = AuditLogWriter(batch_size=2, flush_interval=5, max_queue=100)
+    writer.start()
+    for i in range(5):
+        assert writer.submit(_log(i))
+    writer.stop()
+
+    assert _count(writer_db) == 5  # noqa: PLR2004
+    assert writer.stats()["written"] == 5  # noqa: PLR2004
+    assert sum(batches) == 5  # noqa: PLR2004
+    assert max(batches) <= 2  # noqa: PLR2004
+
+
+def test_partial_batch_is_flushed_after_interval(writer_db):
+    writer = AuditLogWriter(batch_size=100, flush_interval=0.05, max_queue=10)
+    writer.start()
+    try:
+        writer.submit(_log(0))
+        deadline = time.monotonic() + 5
+        while _count(writer_db) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert _count(writer_db) == 1
+    finally:
+        writer.stop()
+
+
+def test_stop_flushes_queued_logs(writer_db):
+    writer = AuditLogWriter(batch_size=100, flush_interval=60, max_queue=10)
+    writer.start()
+    for i in range(3):
+        writer.submit(_log(i))
+
+    started = time.monotonic()
+    writer.stop()
+
+    assert _count(writer_db) == 3  # noqa: PLR2004
+    assert time.monotonic() - started < 5  # noqa: PLR2004
+
+
+def test_full_queue_pushes_back_on_callers(writer_db, monkeypatch):
+    release = threading.Event()
+    writing = threading.Event()
+    write = AuditLogWriter._write
+
+    def blocked_write(self, batch):
+        writing.set()
+        release.wait(5)
+        write(self, batch)
+
+    monkeypatch.setattr(AuditLogWriter, "_write", blocked_write)
+    writer = AuditLogWriter(batch_size=1, flush_interval=0, max_queue=1)
+    writer.start()
+    try:
+        assert writer.submit(_log(0))
+        assert writing.wait(5)
+
+        assert writer.submit(_log(1))
+        assert not writer.submit(_log(2))
+        assert writer.stats()["rejected"] == 1
+    finally:
+        release.set()
+        writer.stop()
+
+    assert _count(writer_db) == 2  # noqa: PLR2004
+
+
+class _BrokenSession:
+    attempts = 0
+
+    def __init__(self):
+        type(self).attempts += 1
+
+    @staticmethod
+    def execute(*args):
+        raise RuntimeError("database is down")
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_failing_batch_is_retried_then_dropped(monkeypatch):
+    _BrokenSession.attempts = 0
+    monkeypatch.setattr(writer_module, "SessionLocal", _BrokenSession)
+    monkeypatch.setattr(
+        writer_module,
+        "time",
+        SimpleNamespace(monotonic=time.monotonic, sleep=lambda _: None),
+    )
+    writer = AuditLogWriter(batch_size=10, flush_interval=0, max_queue=10)
+    writer.start()
+    writer.submit(_log(0))
+    writer.stop()
+
+    assert _BrokenSession.attempts == writer_module.MAX_ATTEMPTS
+    assert writer.stats()["dropped"] == 1
+    assert writer.stats()["written"] == 0
@@ -0,0 +1,163 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import SingleFlightCache, TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(
+        cache_module, "time", SimpleNamespace(monotonic=lambda: now.value)
+    )
+    return now
+
+
+def test_ttl_cache_returns_value_until_it_expires(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("key", "value")
+
+    clock.value += 9.9
+    assert cache.get("key") == "value"
+
+    clock.value += 0.1
+    assert cache.get("key") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_ttl_cache_per_entry_ttl_overrides_default(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("short", 1, ttl=1)
+    cache.set("long", 2)
+
+    clock.value += 5
+
+    assert cache.get("short", "missing") == "missing"
+    assert cache.get("long") == 2  # noqa: PLR2004
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3  # noqa: PLR2004
+
+
+def test_single_flight_coalesces_concurrent_loads():
+    cache = SingleFlightCache(ttl=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def main():
+        return await asyncio.gather(
+            *(cache.get_or_load("key", loader) for _ in range(10))
+        )
+
+    assert asyncio.run(main()) == ["value"] * 10
+    assert calls == 1
+    assert cache.stats()["in_flight"] == 0
+
+
+def test_single_flight_caches_result_until_expiry(clock):
+    cache = SingleFlightCache(ttl=10)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    async def main():
+        first = await cache.get_or_load("key", loader)
+        cached = await cache.get_or_load("key", loader)
+        clock.value += 10
+        reloaded = await cache.get_or_load("key", loader)
+        return first, cached, reloaded
+
+    assert asyncio.run(main()) == (1, 1, 2)
+
+
+def test_single_flight_does_not_cache_errors():
+    cache = SingleFlightCache(ttl=60)
+    outcomes = iter([RuntimeError("upstream down"), "value"])
+
+    async def loader():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("key", loader)
+        return await cache.get_or_load("key", loader)
+
+    assert asyncio.run(main()) == "value"
+
+
+def test_single_flight_cancelled_caller_does_not_cancel_the_load():
+    cache = SingleFlightCache(ttl=60)
+
+    async def main():
+        gate = asyncio.Event()
+
+        async def loader():
+            await gate.wait()
+            return "value"
+
+        impatient = asyncio.create_task(cache.get_or_load("key", loader))
+        patient = asyncio.create_task(cache.get_or_load("key", loader))
+        await asyncio.sleep(0)
+
+        impatient.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await impatient
+
+        gate.set()
+        return await patient
+
+    assert asyncio.run(main()) == "value"
+    assert cache.cache.get("key") == "value"
+
+
+def test_single_flight_invalidate_detaches_load_in_flight():
+    cache = SingleFlightCache(ttl=60)
+
+    async def main():
+        gates = [asyncio.Event(), asyncio.Event()]
+        loads = iter(enumerate(gates, start=1))
+
+        async def loader():
+            version, gate = next(loads)
+            await gate.wait()
+            return f"v{version}"
+
+        stale = asyncio.create_task(cache.get_or_load("key", loader))
+        await asyncio.sleep(0)
+
+        cache.invalidate("key")
+        fresh = asyncio.create_task(cache.get_or_load("key", loader))
+        await asyncio.sleep(0)
+
+        # The newer load lands first; the detached one must not
+        # overwrite it when it finishes afterwards
+        gates[1].set()
+        fresh_value = await fresh
+        gates[0].set()
+        return await stale, fresh_value
+
+    assert asyncio.run(main()) == ("v1", "v2")
+    assert cache.cache.get("key") == "v2"
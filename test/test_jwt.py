@@ -4,10 +4,11 @@ import jwt
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.security import create_access_token, get_password_hash
 from app.main import app
-from app.models import User
-from app.core.security import SECRET_KEY, create_access_token, get_password_hash
+from app.modules.users.model import User
 
 from .database import SessionLocalTest
 
@@ -58,7 +59,9 @@ def test_jwt():
     data = {"test": "test"}
     token = create_access_token(data)
 
-    decoded = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+    decoded = jwt.decode(
+        token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+    )
 
     assert decoded["test"] == data["test"]
     assert "exp" in decoded
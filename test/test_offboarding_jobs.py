@@ -0,0 +1,171 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.core.database import table_registry
+from app.modules.offboarding import service as service_module
+from app.modules.offboarding.enums import OffboardingJobStatus
+from app.modules.offboarding.repository import (
+    claim_offboarding_job,
+    create_offboarding_job,
+    finish_offboarding_job,
+    renew_offboarding_job_lease,
+    retry_offboarding_job,
+)
+from app.modules.offboarding.schemas import OffboardingResult, OffboardingRun
+from app.modules.offboarding.service import run_offboarding_job
+from app.modules.users.model import User
+
+LEASE = 60
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@pytest.fixture
+def job(session):
+    return create_offboarding_job(
+        session,
+        registration="1234",
+        requested_by_id=uuid.uuid4(),
+        ip_address=None,
+        user_agent=None,
+    )
+
+
+def test_claim_takes_queued_job(session, job):
+    claimed = claim_offboarding_job(session, worker_id="w1", lease=LEASE)
+
+    assert claimed.id == job.id
+    assert claimed.status == OffboardingJobStatus.RUNNING
+    assert claimed.locked_by == "w1"
+    assert claimed.attempts == 1
+
+
+def test_claimed_job_is_not_claimed_again_while_leased(session, job):
+    claim_offboarding_job(session, worker_id="w1", lease=LEASE)
+
+    assert claim_offboarding_job(session, worker_id="w2", lease=LEASE) is None
+
+
+def test_claim_skips_job_waiting_for_retry(session, job):
+    claim_offboarding_job(session, worker_id="w1", lease=LEASE)
+    retry_offboarding_job(session, job, error="IFS down", delay=30)
+
+    assert claim_offboarding_job(session, worker_id="w1", lease=LEASE) is None
+
+    job.next_attempt_at = _utcnow() - timedelta(seconds=1)
+    session.commit()
+    claimed = claim_offboarding_job(session, worker_id="w2", lease=LEASE)
+
+    assert claimed.id == job.id
+    assert claimed.attempts == 2  # noqa: PLR2004
+
+
+def test_renew_keeps_lease_of_current_claim(session, job):
+    claimed = claim_offboarding_job(session, worker_id="w1", lease=LEASE)
+
+    assert renew_offboarding_job_lease(
+        session, job.id, "w1", attempt=claimed.attempts
+    )
+
+
+def test_expired_lease_is_taken_over_and_old_claim_fenced(session, job):
+    first = claim_offboarding_job(session, worker_id="w1", lease=LEASE)
+    first_attempt = first.attempts
+    job.locked_at = _utcnow() - timedelta(seconds=LEASE + 1)
+    session.commit()
+
+    second = claim_offboarding_job(session, worker_id="w2", lease=LEASE)
+
+    assert second.locked_by == "w2"
+    assert second.attempts == first_attempt + 1
+    assert not renew_offboarding_job_lease(
+        session, job.id, "w1", attempt=first_attempt
+    )
+    assert renew_offboarding_job_lease(
+        session, job.id, "w2", attempt=second.attempts
+    )
+
+
+def test_reclaim_by_same_worker_fences_old_attempt(session, job):
+    first = claim_offboarding_job(session, worker_id="w1", lease=LEASE)
+    first_attempt = first.attempts
+    job.locked_at = _utcnow() - timedelta(seconds=LEASE + 1)
+    session.commit()
+
+    claim_offboarding_job(session, worker_id="w1", lease=LEASE)
+
+    assert not renew_offboarding_job_lease(
+        session, job.id, "w1", attempt=first_attempt
+    )
+
+
+def test_renew_after_own_attempt_finished_is_not_a_lost_lease(session, job):
+    claimed = claim_offboarding_job(session, worker_id="w1", lease=LEASE)
+    finish_offboarding_job(
+        session,
+        job,
+        status=OffboardingJobStatus.SUCCEEDED,
+        result=OffboardingResult(success=True),
+    )
+
+    assert renew_offboarding_job_lease(
+        session, job.id, "w1", attempt=claimed.attempts
+    )
+
+
+@pytest.fixture
+def worker_session():
+    # run_offboarding_job commits from worker threads, which must see the
+    # same in-memory database
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    table_registry.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine, expire_on_commit=False)()
+    yield db
+    db.close()
+    engine.dispose()
+
+
+def test_job_without_active_systems_fails(worker_session, monkeypatch):
+    requester = User(username="admin", email="admin@x.com", password="x")
+    worker_session.add(requester)
+    worker_session.commit()
+    create_offboarding_job(
+        worker_session,
+        registration="1234",
+        requested_by_id=requester.id,
+        ip_address=None,
+        user_agent=None,
+    )
+    claimed = claim_offboarding_job(
+        worker_session, worker_id="w1", lease=LEASE
+    )
+
+    async def revoke_nothing(**kwargs):
+        return OffboardingRun(target_username="Jane Doe")
+
+    monkeypatch.setattr(service_module, "revoke_access", revoke_nothing)
+    monkeypatch.setattr(service_module, "ADService", lambda: None)
+    monkeypatch.setattr(service_module, "get_snipeit_service", lambda: None)
+    monkeypatch.setattr(settings, "OFFBOARDING_JOB_MAX_ATTEMPTS", 1)
+
+    asyncio.run(run_offboarding_job(worker_session, claimed))
+
+    assert claimed.status == OffboardingJobStatus.FAILED
+    assert claimed.error == "No active systems to revoke."
+    result = json.loads(claimed.result)
+    assert result["success"] is False
+    assert result["details"] == []
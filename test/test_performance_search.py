@@ -1,41 +1,45 @@
 
 # ==========================================
-#  TEST: SEARCH IN PARALLELISM 
+#  TEST: SEARCH IN PARALLELISM
 # ==========================================
 
-import sys
+import asyncio
 import os
+import sys
 import time
-import asyncio
+
 from fastapi.concurrency import run_in_threadpool
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
 
 
+from app.integrations.active_directory import ADService
 from app.integrations.intouch import service
-from app.services import ADService
+
 
 async def verify_v1_old(registration: str):
     ad_service = ADService()
-    
+
     ad_response = await run_in_threadpool(ad_service.search_users, registration=registration)
-    intouch_data = await run_in_threadpool(service.search_user, registration=registration)
-    
+    intouch_data = await service.search_user(registration=registration)
+
     return bool(ad_response), bool(intouch_data)
 
+
 async def verify_v2_new(registration: str):
     ad_service = ADService()
-    
+
     task_ad = run_in_threadpool(ad_service.search_users, registration=registration)
-    task_intouch = run_in_threadpool(service.search_user, registration=registration)
-    
+    task_intouch = service.search_user(registration=registration)
+
     ad_response, intouch_data = await asyncio.gather(task_ad, task_intouch)
-    
+
     return bool(ad_response), bool(intouch_data)
 
+
 async def main():
-    test_registration = "9998" 
-    
+    test_registration = "9998"
+
     print(f"search: {test_registration}")
     print("-" * 30)
 
@@ -58,5 +62,6 @@ async def main():
     print(f"time saved: {time_v1 - time_v2:.4f} seconds per request")
     print(f"percentage of the economy: {percentage:.2f}%")
 
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
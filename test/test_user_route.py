@@ -3,8 +3,8 @@ from http import HTTPStatus
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
 from app.core.security import create_access_token
+from app.main import app
 
 
 @pytest.fixture